@@ -0,0 +1,25 @@
+from django.contrib import admin
+from .models import ArchivoMedia, CargaFragmentada, SubidaPendiente
+
+
+@admin.register(SubidaPendiente)
+class SubidaPendienteAdmin(admin.ModelAdmin):
+    list_display    = ["nombre", "resource_type", "estado", "intentos", "usuario", "creada_en"]
+    list_filter     = ["estado", "resource_type"]
+    search_fields   = ["nombre", "public_id"]
+    readonly_fields = ["token", "url_final", "error", "usuario", "creada_en", "actualizada"]
+
+
+@admin.register(CargaFragmentada)
+class CargaFragmentadaAdmin(admin.ModelAdmin):
+    list_display    = ["nombre_original", "destino", "objeto_id", "recibidos", "tamano", "estado", "usuario"]
+    list_filter     = ["estado", "destino"]
+    readonly_fields = ["token", "recibidos", "sha256", "subida", "creada_en", "actualizada"]
+
+
+@admin.register(ArchivoMedia)
+class ArchivoMediaAdmin(admin.ModelAdmin):
+    list_display    = ["nombre", "resource_type", "formato", "tamano", "referencias", "creado_en"]
+    list_filter     = ["resource_type", "formato"]
+    search_fields   = ["nombre", "sha256", "public_id"]
+    readonly_fields = ["sha256", "creado_en"]
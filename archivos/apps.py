@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+
+
+class ArchivosConfig(AppConfig):
+    name = 'archivos'
+
+    def ready(self):
+        from django.core.signals import request_finished, request_started
+        from django.db.models.signals import post_delete, post_save, pre_save
+        from .cola import al_iniciar_request, al_terminar_request, corregir_pendientes
+        from .liberacion import al_borrar, al_guardar, al_guardar_previo
+        from .referencias import campos_archivo
+
+        request_started.connect(al_iniciar_request, dispatch_uid="archivos-request-inicio")
+        request_finished.connect(al_terminar_request, dispatch_uid="archivos-request-fin")
+
+        for modelo in {modelo for modelo, _ in campos_archivo()}:
+            etiqueta = modelo._meta.label
+            post_save.connect(corregir_pendientes, sender=modelo, dispatch_uid=f"archivos-pendientes-{etiqueta}")
+            pre_save.connect(al_guardar_previo, sender=modelo, dispatch_uid=f"archivos-liberar-previo-{etiqueta}")
+            post_save.connect(al_guardar, sender=modelo, dispatch_uid=f"archivos-liberar-{etiqueta}")
+            post_delete.connect(al_borrar, sender=modelo, dispatch_uid=f"archivos-liberar-borrar-{etiqueta}")
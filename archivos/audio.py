@@ -0,0 +1,259 @@
+"""
+archivos/audio.py
+
+Duración de un audio leyendo solo sus cabeceras, sin decodificarlo ni
+descargarlo entero.
+
+    WAV → chunks "fmt " (byte_rate) y "data" (tamaño)       primeros bytes
+    MP3 → salta el tag ID3v2, lee la primera trama y usa el
+          contador de tramas Xing/Info/VBRI, o tamaño/bitrate  primeros KB
+    OGG → frecuencia de la cabecera Vorbis/Opus y granule
+          position de la última página                        primeros y últimos KB
+
+Los lectores exponen `tamano`, `leer(inicio, n)` y `cerrar()`:
+    LectorArchivo → archivo local o UploadedFile (seek + read)
+    LectorHTTP    → URL remota con peticiones Range
+
+segundos(archivo) elige el lector a partir de un FieldFile y devuelve la
+duración entera, o None si no se pudo leer.
+"""
+
+import logging
+import struct
+
+import requests
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import FileSystemStorage
+
+logger = logging.getLogger(__name__)
+
+CABEZA = 16 * 1024
+COLA   = 64 * 1024
+
+
+# ── Lectores ──
+
+class LectorArchivo:
+
+    def __init__(self, archivo, propio=True):
+        self.archivo = archivo
+        self.propio  = propio
+        self.archivo.seek(0, 2)
+        self.tamano = self.archivo.tell()
+
+    def leer(self, inicio, n):
+        self.archivo.seek(inicio)
+        return self.archivo.read(n)
+
+    def cerrar(self):
+        if self.propio:
+            self.archivo.close()
+        else:
+            # Archivo recién subido: el storage lo leerá después desde el principio
+            self.archivo.seek(0)
+
+
+class LectorHTTP:
+    """Cada lectura es un GET con Range; el primer bloque de CABEZA bytes queda en memoria."""
+
+    def __init__(self, url, timeout=10):
+        self.url     = url
+        self.timeout = timeout
+        self.cabeza  = self._get(0, CABEZA)
+
+    def _get(self, inicio, n):
+        respuesta = requests.get(
+            self.url, headers={"Range": f"bytes={inicio}-{inicio + n - 1}"},
+            timeout=self.timeout, stream=True,
+        )
+        respuesta.raise_for_status()
+        if respuesta.status_code != 206:
+            # El servidor ignoró el Range: no descargar el archivo entero
+            respuesta.close()
+            raise ValueError("El servidor no acepta peticiones Range.")
+        if inicio == 0:
+            self.tamano = int(respuesta.headers["Content-Range"].rsplit("/", 1)[1])
+        return respuesta.raw.read(n)
+
+    def leer(self, inicio, n):
+        if inicio + n <= len(self.cabeza):
+            return self.cabeza[inicio:inicio + n]
+        return self._get(inicio, n)
+
+    def cerrar(self):
+        pass
+
+
+def ruta_local(archivo):
+    """Ruta en disco de un FieldFile guardado, o None si vive en un storage remoto."""
+    from ruedo.storage import LOCALES
+
+    if archivo.name.startswith(LOCALES):
+        return FileSystemStorage().path(archivo.name)
+    if isinstance(archivo.storage, FileSystemStorage):
+        return archivo.storage.path(archivo.name)
+    return None
+
+
+def lector_de(archivo):
+    """
+    Lector para un FieldFile: el archivo recién subido (sin guardar todavía),
+    un archivo en disco (LocalStorage o pendiente de subir) o una URL remota.
+    """
+    if not archivo._committed:
+        return LectorArchivo(archivo.file, propio=False)
+    ruta = ruta_local(archivo)
+    if ruta:
+        return LectorArchivo(open(ruta, "rb"))
+    return LectorHTTP(archivo.url)
+
+
+def segundos(archivo):
+    """Duración redondeada a segundos de un FieldFile de audio, o None."""
+    if not archivo:
+        return None
+    try:
+        lector = lector_de(archivo)
+    except (OSError, ValueError, SuspiciousFileOperation, requests.RequestException) as e:
+        logger.warning("No se pudo abrir %s para medirlo: %s", archivo.name, e)
+        return None
+    try:
+        total = duracion(lector)
+    except (OSError, ValueError, IndexError, ZeroDivisionError, struct.error, requests.RequestException) as e:
+        logger.warning("No se pudo leer la duración de %s: %s", archivo.name, e)
+        total = None
+    finally:
+        lector.cerrar()
+    return round(total) if total is not None else None
+
+
+# ── Formatos ──
+
+def duracion(lector):
+    """Segundos (float) o None si el formato no se reconoce."""
+    cabeza = lector.leer(0, 64)
+    if cabeza[:4] == b"RIFF" and cabeza[8:12] == b"WAVE":
+        return _wav(lector)
+    if cabeza[:4] == b"OggS":
+        return _ogg(lector)
+    return _mp3(lector, cabeza)
+
+
+def _wav(lector):
+    pos, byte_rate = 12, None
+    for _ in range(32):
+        cabecera = lector.leer(pos, 8)
+        if len(cabecera) < 8:
+            return None
+        chunk, tamano = cabecera[:4], struct.unpack("<I", cabecera[4:])[0]
+        if chunk == b"fmt ":
+            byte_rate = struct.unpack("<I", lector.leer(pos + 16, 4))[0]
+        elif chunk == b"data" and byte_rate:
+            # Algunos grabadores dejan el tamaño en 0 o 0xFFFFFFFF al cortar la grabación
+            if not tamano or pos + 8 + tamano > lector.tamano:
+                tamano = lector.tamano - pos - 8
+            return tamano / byte_rate
+        pos += 8 + tamano + (tamano & 1)
+    return None
+
+
+def _ogg(lector):
+    cabeza = lector.leer(0, 512)
+    segmentos = cabeza[26]
+    paquete = cabeza[27 + segmentos:]
+    serial = cabeza[14:18]
+
+    if paquete[:7] == b"\x01vorbis":
+        frecuencia = struct.unpack("<I", paquete[12:16])[0]
+        previo = 0
+    elif paquete[:8] == b"OpusHead":
+        # Opus siempre cuenta muestras a 48 kHz; pre-skip son muestras de relleno
+        frecuencia = 48000
+        previo = struct.unpack("<H", paquete[10:12])[0]
+    else:
+        return None
+
+    inicio = max(0, lector.tamano - COLA)
+    cola = lector.leer(inicio, lector.tamano - inicio)
+    pos = cola.rfind(b"OggS")
+    while pos >= 0:
+        if cola[pos + 4] == 0 and cola[pos + 14:pos + 18] == serial:
+            granule = struct.unpack("<q", cola[pos + 6:pos + 14])[0]
+            if granule > 0:
+                return max(0, granule - previo) / frecuencia
+        pos = cola.rfind(b"OggS", 0, pos)
+    return None
+
+
+_BITRATES = {
+    (3, 3): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (3, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (3, 1): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 3): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 1): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_FRECUENCIAS = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _trama_mp3(b, i):
+    """Datos de la cabecera de trama en b[i:i+4], o None si no es válida."""
+    if b[i] != 0xFF or b[i + 1] & 0xE0 != 0xE0:
+        return None
+    version = (b[i + 1] >> 3) & 3          # 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5
+    capa    = (b[i + 1] >> 1) & 3          # 1 = Layer III, 2 = II, 3 = I
+    ind_bitrate    = b[i + 2] >> 4
+    ind_frecuencia = (b[i + 2] >> 2) & 3
+    if version == 1 or capa == 0 or ind_bitrate in (0, 15) or ind_frecuencia == 3:
+        return None
+    tabla = _BITRATES[(3 if version == 3 else 2, capa)]
+    if capa == 3:
+        muestras = 384
+    elif capa == 2 or version == 3:
+        muestras = 1152
+    else:
+        muestras = 576
+    return {
+        "version":    version,
+        "capa":       capa,
+        "bitrate":    tabla[ind_bitrate] * 1000,
+        "frecuencia": _FRECUENCIAS[version][ind_frecuencia],
+        "muestras":   muestras,
+        "mono":       (b[i + 3] >> 6) == 3,
+    }
+
+
+def _mp3(lector, cabeza):
+    inicio = 0
+    if cabeza[:3] == b"ID3":
+        tamano_tag = 0
+        for byte in cabeza[6:10]:
+            tamano_tag = (tamano_tag << 7) | (byte & 0x7F)
+        inicio = 10 + tamano_tag + (10 if cabeza[5] & 0x10 else 0)
+
+    bloque = lector.leer(inicio, 4096)
+    for i in range(len(bloque) - 4):
+        trama = _trama_mp3(bloque, i)
+        if trama:
+            break
+    else:
+        return None
+
+    # Cabecera Xing/Info (VBR o CBR de LAME): trae el número total de tramas
+    if trama["version"] == 3:
+        lateral = 17 if trama["mono"] else 32
+    else:
+        lateral = 9 if trama["mono"] else 17
+    xing = i + 4 + lateral
+    if bloque[xing:xing + 4] in (b"Xing", b"Info"):
+        banderas = struct.unpack(">I", bloque[xing + 4:xing + 8])[0]
+        if banderas & 1:
+            tramas = struct.unpack(">I", bloque[xing + 8:xing + 12])[0]
+            return tramas * trama["muestras"] / trama["frecuencia"]
+    vbri = i + 4 + 32
+    if bloque[vbri:vbri + 4] == b"VBRI":
+        tramas = struct.unpack(">I", bloque[vbri + 14:vbri + 18])[0]
+        return tramas * trama["muestras"] / trama["frecuencia"]
+
+    # CBR sin cabecera: los bytes de audio a bitrate constante
+    return (lector.tamano - inicio - i) * 8 / trama["bitrate"]
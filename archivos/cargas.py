@@ -0,0 +1,151 @@
+"""
+archivos/cargas.py
+
+Subidas reanudables por fragmentos para videos y audios grandes.
+
+    POST  /api/archivos/cargas/           → abre la carga (destino, tamaño, sha256)
+    PATCH /api/archivos/cargas/<token>/   → Content-Range: bytes 0-1048575/524288000
+    GET   /api/archivos/cargas/<token>/   → `recibidos` indica desde dónde reanudar
+
+Cada fragmento se copia del cuerpo del request al archivo parcial en bloques
+de BLOQUE bytes, así la memoria no depende del tamaño del archivo ni del
+fragmento. Con el último byte se verifica el sha256 (también leyendo por
+bloques) y el archivo se adjunta al campo de destino: con CloudinaryStorage
+pasa a la cola de archivos/cola.py, que lo sube en modo chunked.
+"""
+
+import hashlib
+import os
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+
+from ruedo.storage import AUDIO_EXT, VIDEO_EXT
+from .models import CargaFragmentada
+
+BLOQUE = 64 * 1024
+
+Destino = CargaFragmentada.Destino
+
+# destino → (modelo, campo, extensiones permitidas)
+DESTINOS = {
+    Destino.EVENTO_VIDEO:     ("eventos.Evento",         "video",         VIDEO_EXT),
+    Destino.ENTREVISTA_AUDIO: ("entrevistas.Entrevista", "audio_archivo", AUDIO_EXT),
+}
+
+_RANGO = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class ErrorCarga(Exception):
+    def __init__(self, mensaje, status=400):
+        super().__init__(mensaje)
+        self.status = status
+
+
+def modelo_y_campo(destino):
+    etiqueta, campo, _ = DESTINOS[destino]
+    return apps.get_model(etiqueta), campo
+
+
+def ruta_parcial(carga):
+    return os.path.join(settings.MEDIA_ROOT, "cargas", f"{carga.token.hex}.part")
+
+
+def leer_rango(cabecera, tamano):
+    """'bytes 0-99/1000' → (0, 100). El fin del encabezado es inclusivo."""
+    coincidencia = _RANGO.match((cabecera or "").strip())
+    if not coincidencia:
+        raise ErrorCarga("Content-Range debe tener la forma 'bytes inicio-fin/total'.")
+    inicio, fin, total = (int(g) for g in coincidencia.groups())
+    if total != tamano or fin < inicio or fin >= tamano:
+        raise ErrorCarga("Content-Range no corresponde al tamaño declarado de la carga.")
+    if fin + 1 - inicio > settings.MEDIA_CARGA_FRAGMENTO_MAXIMO:
+        raise ErrorCarga(f"El fragmento máximo es de {settings.MEDIA_CARGA_FRAGMENTO_MAXIMO} bytes.")
+    return inicio, fin + 1
+
+
+def escribir_fragmento(carga, flujo, inicio, fin):
+    """
+    Copia los bytes [inicio, fin) de `flujo` al archivo parcial.
+    Solo se acepta el fragmento que sigue a lo ya recibido (409 si no).
+    """
+    if carga.estado != CargaFragmentada.Estado.ABIERTA:
+        raise ErrorCarga("La carga ya está completa.", status=409)
+    if inicio != carga.recibidos:
+        raise ErrorCarga(f"Se esperaba el byte {carga.recibidos}.", status=409)
+
+    ruta = ruta_parcial(carga)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, "r+b" if os.path.exists(ruta) else "wb") as parcial:
+        parcial.seek(inicio)
+        restante = fin - inicio
+        while restante:
+            bloque = flujo.read(min(BLOQUE, restante)) if flujo else b""
+            if not bloque:
+                break
+            parcial.write(bloque)
+            restante -= len(bloque)
+        if restante:
+            parcial.truncate(inicio)
+            raise ErrorCarga("El cuerpo trae menos bytes de los que indica Content-Range.")
+        parcial.truncate(fin)
+
+    # Condicional sobre `recibidos`: si dos PATCH compiten, solo uno avanza
+    avanzo = CargaFragmentada.objects.filter(pk=carga.pk, recibidos=inicio).update(recibidos=fin)
+    if not avanzo:
+        raise ErrorCarga("Otro fragmento se escribió al mismo tiempo; consulte `recibidos`.", status=409)
+    carga.recibidos = fin
+
+    if carga.recibidos == carga.tamano:
+        completar(carga)
+    return carga
+
+
+def sha256_archivo(ruta):
+    digest = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(BLOQUE * 16), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+def completar(carga):
+    ruta = ruta_parcial(carga)
+    if sha256_archivo(ruta) != carga.sha256:
+        # Los bytes no sirven: se empieza de nuevo
+        os.remove(ruta)
+        CargaFragmentada.objects.filter(pk=carga.pk).update(recibidos=0)
+        carga.recibidos = 0
+        raise ErrorCarga("El sha256 del archivo no coincide; la carga se reinició.", status=422)
+
+    with transaction.atomic():
+        carga.subida = adjuntar(carga, ruta)
+        carga.estado = CargaFragmentada.Estado.COMPLETA
+        carga.save(update_fields=["estado", "subida", "actualizada"])
+
+
+def adjuntar(carga, ruta):
+    """
+    Guarda el archivo en el storage del campo de destino y lo asigna al
+    objeto. Devuelve la SubidaPendiente si el storage sube en segundo plano.
+    """
+    modelo, nombre_campo = modelo_y_campo(carga.destino)
+    objeto = modelo._default_manager.select_for_update().get(pk=carga.objeto_id)
+    campo  = modelo._meta.get_field(nombre_campo)
+    nombre = campo.generate_filename(objeto, carga.nombre_original)
+
+    subida = None
+    if hasattr(campo.storage, "guardar_desde_ruta"):
+        nombre, subida = campo.storage.guardar_desde_ruta(nombre, ruta, carga.sha256)
+    else:
+        with open(ruta, "rb") as archivo:
+            nombre = campo.storage.save(nombre, File(archivo), max_length=campo.max_length)
+        os.remove(ruta)
+
+    auto_now = [c.name for c in modelo._meta.concrete_fields if getattr(c, "auto_now", False)]
+    setattr(objeto, nombre_campo, nombre)
+    objeto.save(update_fields=[nombre_campo, *auto_now])
+    return subida
@@ -0,0 +1,203 @@
+"""
+archivos/cola.py
+
+Pool de hilos que sube a su destino final los archivos que
+CloudinaryStorage dejó en MEDIA_ROOT/pendientes/.
+
+    programar(f, *a)  → corre f(*a) en el pool cuando confirme la transacción
+                        (dentro de un request, al terminar el request)
+    encolar(subida)   → programa la subida de una SubidaPendiente
+    procesar(pk)      → sube con reintentos, cambia el nombre provisional por
+                        la URL definitiva en los modelos y borra el temporal
+
+Otros trabajos pesados sobre media (p. ej. entrevistas/onda.py) usan el
+mismo pool a través de programar().
+
+Si el proceso muere con subidas a medias, las retoma el proceso nuevo:
+al cargar la aplicación WSGI (ruedo/wsgi.py, una vez por worker de
+gunicorn) al_arrancar() manda al pool retomar(), que devuelve a PENDIENTE
+las que quedaron en SUBIENDO hace más de MEDIA_SUBIDA_ATASCADAS minutos (el
+hilo murió con la subida tomada) y sube las PENDIENTE. Corre en el servidor
+y no en el build porque los temporales están en el MEDIA_ROOT de la
+instancia que los recibió. `manage.py procesar_subidas [--atascadas
+MINUTOS]` hace lo mismo a mano y además reintenta las ERROR. `actualizada`
+se pone al tomarla porque update() no toca los auto_now.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, models, transaction
+from django.utils import timezone
+
+from .contenido import de_respuesta, renombrar
+from .models import SubidaPendiente
+from .referencias import reemplazar_referencias
+from .subidores import get_subidor
+
+logger = logging.getLogger(__name__)
+
+PREFIJO = "pendientes/"
+
+_pool    = None
+_candado = threading.Lock()
+_estado  = threading.local()
+
+
+def _get_pool():
+    global _pool
+    with _candado:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=settings.MEDIA_SUBIDA_WORKERS,
+                thread_name_prefix="subida-media",
+            )
+        return _pool
+
+
+def es_pendiente(nombre):
+    return bool(nombre) and str(nombre).startswith(PREFIJO)
+
+
+def ruta_temporal(nombre):
+    return os.path.join(settings.MEDIA_ROOT, nombre)
+
+
+def programar(funcion, *args):
+    def _enviar():
+        # En un request se espera a request_finished: así el hilo no compite
+        # con las escrituras que el request todavía tiene por hacer
+        if getattr(_estado, "diferidas", None) is not None:
+            _estado.diferidas.append((funcion, args))
+        else:
+            _get_pool().submit(_en_hilo, funcion, *args)
+
+    transaction.on_commit(_enviar)
+
+
+def encolar(subida):
+    programar(procesar, subida.pk)
+
+
+def al_arrancar():
+    """Desde ruedo/wsgi.py: retoma en el pool lo que dejó el proceso anterior."""
+    if settings.MEDIA_SUBIDA_ATASCADAS:
+        _get_pool().submit(_en_hilo, retomar, settings.MEDIA_SUBIDA_ATASCADAS)
+
+
+def al_iniciar_request(sender, **kwargs):
+    _estado.diferidas = []
+
+
+def al_terminar_request(sender, **kwargs):
+    diferidas, _estado.diferidas = getattr(_estado, "diferidas", None) or [], None
+    for funcion, args in diferidas:
+        _get_pool().submit(_en_hilo, funcion, *args)
+
+
+def _en_hilo(funcion, *args):
+    close_old_connections()
+    try:
+        funcion(*args)
+    except Exception:
+        logger.exception("%s%s falló", funcion.__name__, args)
+    finally:
+        connection.close()
+
+
+def procesar(pk, espera_base=1.0):
+    """
+    Sube la SubidaPendiente `pk`. Reintenta hasta MEDIA_SUBIDA_REINTENTOS
+    veces con espera exponencial. Devuelve la subida actualizada.
+    """
+    # Marcar SUBIENDO de forma atómica: si otro hilo/proceso ya la tomó, no hacer nada
+    tomada = SubidaPendiente.objects.filter(
+        pk=pk, estado__in=[SubidaPendiente.Estado.PENDIENTE, SubidaPendiente.Estado.ERROR],
+    ).update(estado=SubidaPendiente.Estado.SUBIENDO, actualizada=timezone.now())
+    subida = SubidaPendiente.objects.get(pk=pk)
+    if not tomada:
+        return subida
+
+    ruta     = ruta_temporal(subida.nombre)
+    subidor  = get_subidor()
+    resultado, error = None, ""
+
+    for intento in range(settings.MEDIA_SUBIDA_REINTENTOS):
+        subida.intentos += 1
+        try:
+            resultado = subidor.subir(ruta, subida.public_id, subida.resource_type)
+            break
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.warning("Subida %s, intento %s: %s", pk, subida.intentos, error)
+            if intento + 1 < settings.MEDIA_SUBIDA_REINTENTOS:
+                time.sleep(espera_base * 2 ** intento)
+
+    if resultado is None:
+        subida.estado = SubidaPendiente.Estado.ERROR
+        subida.error  = error
+        subida.save(update_fields=["estado", "error", "intentos", "actualizada"])
+        return subida
+
+    subida.estado    = SubidaPendiente.Estado.LISTO
+    subida.url_final = resultado["secure_url"]
+    subida.error     = ""
+    subida.save(update_fields=["estado", "url_final", "error", "intentos", "actualizada"])
+    renombrar(subida.nombre, subida.url_final, **de_respuesta(resultado))
+    # Después de confirmar LISTO: una fila que se inserte más tarde la
+    # corrige el receptor post_save (ver corregir_pendientes)
+    reemplazar_referencias(subida.nombre, subida.url_final)
+
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
+    return subida
+
+
+def liberar_atascadas(minutos):
+    """Devuelve a PENDIENTE las SUBIENDO sin cambios hace más de `minutos`."""
+    limite = timezone.now() - timedelta(minutes=minutos)
+    return SubidaPendiente.objects.filter(
+        estado=SubidaPendiente.Estado.SUBIENDO, actualizada__lt=limite,
+    ).update(estado=SubidaPendiente.Estado.PENDIENTE, actualizada=timezone.now())
+
+
+def retomar(minutos):
+    """Al arrancar el proceso: libera las atascadas y sube las PENDIENTE, una por una."""
+    liberar_atascadas(minutos)
+    pks = list(
+        SubidaPendiente.objects
+        .filter(estado=SubidaPendiente.Estado.PENDIENTE)
+        .order_by("creada_en")
+        .values_list("pk", flat=True)
+    )
+    for pk in pks:
+        procesar(pk)
+
+
+def corregir_pendientes(sender, instance, **kwargs):
+    """
+    post_save de los modelos con archivos: si el archivo se subió antes de
+    que la fila existiera, el hilo no la encontró; se corrige aquí.
+    """
+    for campo in instance._meta.concrete_fields:
+        if not isinstance(campo, models.FileField):
+            continue
+        nombre = getattr(instance, campo.attname).name
+        if not es_pendiente(nombre):
+            continue
+        url = (
+            SubidaPendiente.objects
+            .filter(nombre=nombre, estado=SubidaPendiente.Estado.LISTO)
+            .values_list("url_final", flat=True)
+            .first()
+        )
+        if url:
+            reemplazar_referencias(nombre, url)
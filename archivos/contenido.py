@@ -0,0 +1,112 @@
+"""
+archivos/contenido.py
+
+Deduplicación por contenido y metadatos de media para los storages.
+
+El storage calcula el sha256 mientras lee el archivo y consulta el índice
+ArchivoMedia antes de subir nada:
+
+    reutilizar(digest)        → nombre ya guardado (y +1 referencia), o None
+    registrar(digest, ...)    → agrega al índice lo que se acaba de subir,
+                                con sus metadatos (ver de_respuesta)
+    liberar(nombre)           → -1 referencia; True si ya nadie lo usa y se
+                                puede borrar del storage remoto (lo llama
+                                storage.delete(), ver archivos/liberacion.py)
+    metadatos(nombres)        → metadatos de varios nombres en una consulta
+"""
+
+import hashlib
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import ArchivoMedia
+
+
+def copiar_con_huella(content, destino=None):
+    """
+    Recorre `content` por chunks calculando su sha256 y, si se da
+    `destino` (archivo abierto en binario), lo va escribiendo ahí en la
+    misma pasada. Deja `content` rebobinado.
+    """
+    digest = hashlib.sha256()
+    if hasattr(content, "seek"):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+        if destino is not None:
+            destino.write(chunk)
+    if hasattr(content, "seek"):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+def reutilizar(digest):
+    fila = ArchivoMedia.objects.filter(sha256=digest).values_list("pk", "nombre").first()
+    if fila is None:
+        return None
+    ArchivoMedia.objects.filter(pk=fila[0]).update(referencias=F("referencias") + 1)
+    return fila[1]
+
+
+def registrar(digest, nombre, public_id, resource_type, **datos):
+    """
+    Devuelve el nombre que debe quedar en el modelo. Si otro request subió
+    el mismo contenido al mismo tiempo gana el primero; la copia nuestra
+    queda sin referencias y la recoge el recolector de huérfanos.
+    """
+    try:
+        with transaction.atomic():
+            ArchivoMedia.objects.create(
+                sha256=digest, nombre=nombre, public_id=public_id,
+                resource_type=resource_type, **datos,
+            )
+        return nombre
+    except IntegrityError:
+        return reutilizar(digest) or nombre
+
+
+def liberar(nombre):
+    """
+    Devuelve (borrar, public_id, resource_type). Un nombre que no está en
+    el índice (anterior a él, o ya liberado) nunca se borra por aquí: de
+    esos se encarga `manage.py recolectar_huerfanos`.
+    """
+    fila = ArchivoMedia.objects.filter(nombre=nombre).values_list("pk", "public_id", "resource_type").first()
+    if fila is None:
+        return False, None, None
+    pk, public_id, resource_type = fila
+    compartido = ArchivoMedia.objects.filter(pk=pk, referencias__gt=1).update(
+        referencias=F("referencias") - 1,
+    )
+    if compartido:
+        return False, public_id, resource_type
+    # Condicional: si alguien lo reutilizó entre las dos consultas, no se borra
+    borrados, _ = ArchivoMedia.objects.filter(pk=pk, referencias__lte=1).delete()
+    return bool(borrados), public_id, resource_type
+
+
+def renombrar(viejo, nuevo, **datos):
+    """La subida en segundo plano terminó: el índice apunta a la URL definitiva."""
+    ArchivoMedia.objects.filter(nombre=viejo).update(nombre=nuevo, **datos)
+
+
+CAMPOS_METADATOS = ["tamano", "ancho", "alto", "duracion", "resource_type", "formato"]
+
+
+def de_respuesta(resultado):
+    """Metadatos de una respuesta con la forma de cloudinary.uploader.upload."""
+    datos = {
+        "tamano":   resultado.get("bytes"),
+        "ancho":    resultado.get("width"),
+        "alto":     resultado.get("height"),
+        "duracion": resultado.get("duration"),
+        "formato":  resultado.get("format") or "",
+    }
+    return {k: v for k, v in datos.items() if v not in (None, "")}
+
+
+def metadatos(nombres):
+    """nombre → dict de CAMPOS_METADATOS, solo para los que están en el índice."""
+    filas = ArchivoMedia.objects.filter(nombre__in=nombres).values("nombre", *CAMPOS_METADATOS)
+    return {fila.pop("nombre"): fila for fila in filas}
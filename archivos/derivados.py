@@ -0,0 +1,121 @@
+"""
+archivos/derivados.py
+
+Versiones responsive de las imágenes: tres anchos máximos (TAMANOS) en el
+formato original y en WebP/AVIF cuando el backend los soporta.
+
+Cada storage expone su backend en el atributo `derivados`:
+    CloudinaryStorage → DerivadosCloudinary: transformaciones en la URL
+                        (c_limit,w_…,f_…), no hay nada que generar
+    LocalStorage      → DerivadosPillow: genera los archivos al subir, en
+                        MEDIA_ROOT/derivados/<nombre sin extensión>/<tamaño>.<ext>
+
+srcset() arma el objeto compacto que exponen los serializers
+(ver archivos.serializers.SrcsetField).
+"""
+
+import os
+
+from PIL import Image, ImageOps, features
+
+# Ancho máximo de cada tamaño; nunca se agranda la imagen
+TAMANOS = {"thumb": 320, "card": 640, "full": 1280}
+
+
+def ancho_real(maximo, ancho):
+    return min(maximo, ancho) if ancho else maximo
+
+
+def srcset(storage, nombre, ancho=None, alto=None):
+    """
+    {"ancho", "alto", "thumb", "card", "full",
+     "srcset": {"original": "u 320w, u 640w, …", "webp": …, "avif": …}}
+    Las URLs sueltas van en el formato más liviano disponible.
+    """
+    backend = storage.derivados
+    if not backend.aplica(storage, nombre):
+        return None
+
+    formatos  = [None, *backend.formatos]
+    preferido = backend.formatos[0] if backend.formatos else None
+    datos     = {"ancho": ancho, "alto": alto}
+    for tamano in TAMANOS:
+        datos[tamano] = backend.url(storage, nombre, tamano, preferido, ancho)
+
+    datos["srcset"] = {}
+    for formato in formatos:
+        vistos, partes = set(), []
+        for tamano, maximo in TAMANOS.items():
+            w = ancho_real(maximo, ancho)
+            if w in vistos:
+                continue
+            vistos.add(w)
+            partes.append(f"{backend.url(storage, nombre, tamano, formato, ancho)} {w}w")
+        datos["srcset"][formato or "original"] = ", ".join(partes)
+    return datos
+
+
+class DerivadosCloudinary:
+    formatos = ("avif", "webp")
+
+    def aplica(self, storage, nombre):
+        return "/image/upload/" in storage.url(nombre)
+
+    def url(self, storage, nombre, tamano, formato, ancho=None):
+        transformacion = f"c_limit,w_{TAMANOS[tamano]},q_auto"
+        if formato:
+            transformacion += f",f_{formato}"
+        return storage.url(nombre).replace("/image/upload/", f"/image/upload/{transformacion}/", 1)
+
+    def nombres(self, nombre):
+        return []
+
+
+class DerivadosPillow:
+    EXTENSIONES = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"}
+
+    @property
+    def formatos(self):
+        return tuple(f for f in ("avif", "webp") if features.check(f))
+
+    def aplica(self, storage, nombre):
+        return os.path.splitext(nombre)[-1].lower() in self.EXTENSIONES
+
+    def _base(self, nombre):
+        return f"derivados/{os.path.splitext(nombre)[0]}"
+
+    def _original(self, nombre):
+        return "png" if os.path.splitext(nombre)[-1].lower() == ".png" else "jpg"
+
+    def _nombre(self, nombre, tamano, formato):
+        return f"{self._base(nombre)}/{tamano}.{formato or self._original(nombre)}"
+
+    def url(self, storage, nombre, tamano, formato, ancho=None):
+        return storage.url(self._nombre(nombre, tamano, formato))
+
+    def generar(self, storage, nombre):
+        """Escribe todos los derivados. Devuelve (ancho, alto) del original."""
+        with Image.open(storage.path(nombre)) as original:
+            imagen = ImageOps.exif_transpose(original)
+            ancho, alto = imagen.size
+            if self._original(nombre) == "jpg":
+                imagen = imagen.convert("RGB")
+            elif imagen.mode not in ("RGB", "RGBA"):
+                imagen = imagen.convert("RGBA")
+
+            for tamano, maximo in TAMANOS.items():
+                copia = imagen.copy()
+                copia.thumbnail((maximo, maximo * 10))
+                for formato in (None, *self.formatos):
+                    destino = storage.path(self._nombre(nombre, tamano, formato))
+                    os.makedirs(os.path.dirname(destino), exist_ok=True)
+                    copia.save(destino, quality=80, **({"optimize": True} if formato is None else {}))
+        return ancho, alto
+
+    def nombres(self, nombre):
+        """Archivos derivados de `nombre` (para borrarlos junto con el original)."""
+        return [
+            self._nombre(nombre, tamano, formato)
+            for tamano in TAMANOS
+            for formato in (None, *self.formatos)
+        ]
@@ -0,0 +1,84 @@
+"""
+archivos/liberacion.py
+
+Descuento de ArchivoMedia.referencias cuando un archivo deja de usarse.
+
+Cada storage.save() suma una referencia (archivos/contenido.py); aquí se
+resta la que corresponde a una fila:
+    pre_save    → recuerda los nombres guardados en los FileField de la fila
+    post_save   → los que cambiaron (reemplazo o vaciado) se sueltan
+    post_delete → se sueltan todos los de la fila
+
+soltar() corre en el pool de archivos/cola.py cuando confirma la
+transacción: storage.delete() descuenta y, si era la última referencia,
+borra el archivo (y sus derivados). Antes cuenta las filas que todavía lo
+usan: si son tantas como las referencias (el nombre se copió de una fila a
+otra sin pasar por el storage) no se descuenta nada; lo que sobre queda
+para `manage.py recolectar_huerfanos`.
+"""
+
+from django.core.files.storage import default_storage
+from django.db import models
+
+from .cola import programar
+from .models import ArchivoMedia
+from .referencias import campos_archivo
+
+
+def _campos(modelo):
+    return [c for c in modelo._meta.concrete_fields if isinstance(c, models.FileField)]
+
+
+def _nombre(valor):
+    return getattr(valor, "name", valor) or ""
+
+
+def usos(nombre):
+    """Cuántas filas guardan `nombre` en algún FileField."""
+    return sum(
+        modelo._default_manager.filter(**{campo: nombre}).count()
+        for modelo, campo in campos_archivo()
+    )
+
+
+def soltar(nombres):
+    """Descuenta una referencia de cada nombre que tenga más referencias que usos."""
+    for nombre in nombres:
+        referencias = ArchivoMedia.objects.filter(nombre=nombre).values_list("referencias", flat=True).first()
+        if referencias is not None and usos(nombre) < referencias:
+            default_storage.delete(nombre)
+
+
+def _programar(nombres):
+    nombres = [n for n in nombres if n]
+    if nombres:
+        programar(soltar, nombres)
+
+
+# ── Señales de los modelos con archivos ──
+
+def al_guardar_previo(sender, instance, raw=False, update_fields=None, **kwargs):
+    """pre_save: nombres guardados antes del cambio."""
+    instance._archivos_anteriores = {}
+    if raw or instance.pk is None:
+        return
+    campos = [c.attname for c in _campos(sender) if update_fields is None or c.name in update_fields]
+    if campos:
+        anteriores = sender._default_manager.filter(pk=instance.pk).values(*campos).first()
+        instance._archivos_anteriores = anteriores or {}
+
+
+def al_guardar(sender, instance, raw=False, **kwargs):
+    """post_save: suelta los archivos reemplazados o vaciados."""
+    if raw:
+        return
+    anteriores = getattr(instance, "_archivos_anteriores", None) or {}
+    _programar([
+        viejo for attname, viejo in anteriores.items()
+        if viejo and viejo != _nombre(getattr(instance, attname))
+    ])
+
+
+def al_borrar(sender, instance, **kwargs):
+    """post_delete: suelta todos los archivos de la fila."""
+    _programar([_nombre(getattr(instance, c.attname)) for c in _campos(sender)])
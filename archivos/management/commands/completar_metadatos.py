@@ -0,0 +1,90 @@
+"""
+archivos/management/commands/completar_metadatos.py
+
+Llena el índice ArchivoMedia para los archivos que ya estaban guardados en
+los modelos antes de que existiera (o que quedaron sin tamaño).
+
+Los nombres se consultan al storage en lotes (una llamada a la Admin API
+de Cloudinary por lote y tipo) y los lotes corren en paralelo; la base de
+datos solo se toca desde el hilo principal.
+
+    python manage.py completar_metadatos
+    python manage.py completar_metadatos --lote 100 --hilos 8
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from archivos.contenido import CAMPOS_METADATOS
+from archivos.models import ArchivoMedia
+from archivos.referencias import campos_archivo
+from ruedo.storage import LOCALES
+
+
+class Command(BaseCommand):
+    help = "Agrega tamaño, dimensiones, duración y formato de los archivos existentes al índice de media."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lote", type=int, default=100, help="Nombres por consulta al storage (máx. 100 en Cloudinary).")
+        parser.add_argument("--hilos", type=int, default=4, help="Lotes consultados en paralelo.")
+
+    def handle(self, *args, **opts):
+        # Cuántas filas usan cada nombre (el agrupamiento lo hace la base de datos)
+        usos = Counter()
+        for modelo, campo in campos_archivo():
+            filas = (
+                modelo._default_manager.exclude(**{campo: ""}).exclude(**{f"{campo}__isnull": True})
+                .values_list(campo).annotate(n=Count("pk")).order_by()
+            )
+            for nombre, n in filas.iterator():
+                if not nombre.startswith(LOCALES[0]):
+                    usos[nombre] += n
+
+        completos = set(
+            ArchivoMedia.objects.filter(nombre__in=list(usos), tamano__isnull=False).values_list("nombre", flat=True)
+        )
+        faltantes = [n for n in usos if n not in completos]
+        if not faltantes:
+            self.stdout.write(self.style.SUCCESS("El índice de media ya está completo."))
+            return
+
+        lotes = [faltantes[i:i + opts["lote"]] for i in range(0, len(faltantes), opts["lote"])]
+        self.stdout.write(f"{len(faltantes)} archivos sin metadatos, {len(lotes)} lotes.")
+
+        hechos = sin_datos = 0
+        with ThreadPoolExecutor(max_workers=opts["hilos"]) as pool:
+            futuros = {pool.submit(default_storage.metadatos_lote, lote): lote for lote in lotes}
+            for futuro in as_completed(futuros):
+                lote = futuros[futuro]
+                try:
+                    encontrados = futuro.result()
+                except Exception as exc:
+                    self.stderr.write(f"Lote de {len(lote)} falló: {exc}")
+                    continue
+                self._guardar(encontrados, usos)
+                hechos    += len(encontrados)
+                sin_datos += len(lote) - len(encontrados)
+                self.stdout.write(f"  {hechos + sin_datos}/{len(faltantes)}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{hechos} archivos con metadatos; {sin_datos} no se encontraron en el storage."
+        ))
+
+    def _guardar(self, encontrados, usos):
+        existentes = {a.nombre: a for a in ArchivoMedia.objects.filter(nombre__in=list(encontrados))}
+        nuevos = []
+        for nombre, datos in encontrados.items():
+            archivo = existentes.get(nombre) or ArchivoMedia(nombre=nombre, referencias=usos[nombre])
+            for campo, valor in datos.items():
+                setattr(archivo, campo, valor)
+            if archivo.pk is None:
+                nuevos.append(archivo)
+        ArchivoMedia.objects.bulk_create(nuevos)
+        if existentes:
+            ArchivoMedia.objects.bulk_update(
+                list(existentes.values()), ["public_id", *CAMPOS_METADATOS],
+            )
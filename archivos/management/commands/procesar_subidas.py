@@ -0,0 +1,50 @@
+"""
+archivos/management/commands/procesar_subidas.py
+
+Retoma las subidas en segundo plano que quedaron sin terminar
+(el proceso se reinició, o agotaron los reintentos).
+
+    python manage.py procesar_subidas                 → PENDIENTE y ERROR
+    python manage.py procesar_subidas --atascadas 30  → además SUBIENDO de hace más de 30 min
+
+Correrlo en la shell de la instancia del servidor: los temporales
+están en su MEDIA_ROOT. El servidor ya retoma solo PENDIENTE y SUBIENDO al
+arrancar (archivos/cola.py); esto sirve sobre todo para reintentar las ERROR.
+"""
+
+from django.core.management.base import BaseCommand
+
+from archivos.cola import liberar_atascadas, procesar
+from archivos.models import SubidaPendiente
+
+Estado = SubidaPendiente.Estado
+
+
+class Command(BaseCommand):
+    help = "Sube los archivos pendientes que el pool de hilos no terminó."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--atascadas", type=int, metavar="MINUTOS",
+            help="Reintentar también las que llevan más de MINUTOS en SUBIENDO.",
+        )
+
+    def handle(self, *args, **opts):
+        if opts["atascadas"] is not None:
+            liberar_atascadas(opts["atascadas"])
+
+        pks = list(
+            SubidaPendiente.objects
+            .filter(estado__in=[Estado.PENDIENTE, Estado.ERROR])
+            .order_by("creada_en")
+            .values_list("pk", flat=True)
+        )
+        listas = 0
+        for pk in pks:
+            subida = procesar(pk)
+            if subida.estado == Estado.LISTO:
+                listas += 1
+            else:
+                self.stderr.write(f"{subida.nombre}: {subida.error}")
+
+        self.stdout.write(self.style.SUCCESS(f"{listas} de {len(pks)} subidas terminadas."))
@@ -0,0 +1,141 @@
+"""
+archivos/management/commands/recolectar_huerfanos.py
+
+Borra del storage los archivos que ya no usa ninguna fila: eventos,
+noticias o entrevistas borrados, o archivos reemplazados por otro.
+
+Candidatos: el índice ArchivoMedia y, solo con --storage, el listado del
+propio storage limitado a las carpetas de los modelos (ruedo/storage.py
+CARPETAS), para recursos que nunca entraron al índice. Lo que está fuera de
+esas carpetas (subido a mano, otras apps de la misma cuenta) no se toca.
+
+Se revisan por lotes: para cada lote, una consulta `campo__in` por
+FileField/ImageField de todos los modelos. Además, un recurso cuya URL de
+Cloudinary esté pegada en algún URLField (imagen_url, video_url, src, ...)
+cuenta como usado; esos public_id se leen una vez al empezar.
+
+    python manage.py recolectar_huerfanos --dry-run
+    python manage.py recolectar_huerfanos --lote 300 --gracia 48
+    python manage.py recolectar_huerfanos --storage
+"""
+
+from datetime import timedelta
+from itertools import islice
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from archivos.models import ArchivoMedia
+from archivos.referencias import campos_archivo, campos_url
+from ruedo.storage import LOCALES, desde_url
+
+
+def _lotes(iterable, tamano):
+    iterador = iter(iterable)
+    while lote := list(islice(iterador, tamano)):
+        yield lote
+
+
+def ids_en_urls():
+    """
+    (resource_type, public_id) de las URLs de Cloudinary guardadas en
+    URLField. Con transformaciones en la URL ("w_300,c_fill/v12/eventos/x")
+    se agregan también los sufijos, así que se protege de más, nunca de menos.
+    """
+    ids = set()
+    for modelo, campo in campos_url():
+        urls = modelo._default_manager.filter(**{f"{campo}__contains": "/upload/"}).values_list(campo, flat=True)
+        for url in urls.iterator():
+            partes = desde_url(url)
+            if not partes:
+                continue
+            resource_type, public_id, _ = partes
+            segmentos = public_id.split("/")
+            ids.update((resource_type, "/".join(segmentos[i:])) for i in range(len(segmentos)))
+    return ids
+
+
+def referenciados(recursos, ids_url=frozenset()):
+    """Nombres de `recursos` que siguen guardados en algún modelo o pegados como URL."""
+    nombres = [r["nombre"] for r in recursos]
+    usados  = set()
+    for modelo, campo in campos_archivo():
+        usados.update(
+            modelo._default_manager.filter(**{f"{campo}__in": nombres}).values_list(campo, flat=True)
+        )
+    usados.update(r["nombre"] for r in recursos if (r.get("resource_type"), r.get("public_id")) in ids_url)
+    return usados
+
+
+class Command(BaseCommand):
+    help = "Borra en lote los archivos de media que ninguna fila referencia."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Solo reportar, no borrar nada.")
+        parser.add_argument("--lote", type=int, default=200, help="Archivos revisados por lote.")
+        parser.add_argument(
+            "--gracia", type=int, default=24, metavar="HORAS",
+            help="No tocar archivos más recientes (pueden estar a mitad de un guardado).",
+        )
+        parser.add_argument(
+            "--storage", action="store_true",
+            help="Recorrer también el listado del storage (solo las carpetas de los modelos).",
+        )
+        # Compatibilidad: ahora es el comportamiento por defecto
+        parser.add_argument("--solo-indice", action="store_true", help="No recorrer el listado del storage (por defecto).")
+
+    def handle(self, *args, **opts):
+        self.dry_run   = opts["dry_run"]
+        self.verbosity = opts["verbosity"]
+        self.limite    = timezone.now() - timedelta(hours=opts["gracia"])
+        self.totales   = {"revisados": 0, "huerfanos": 0, "borrados": 0}
+        self.ids_url   = ids_en_urls()
+
+        indice = (
+            ArchivoMedia.objects.exclude(nombre__startswith=LOCALES[0]).order_by("pk")
+            .values("nombre", "public_id", "resource_type", "creado_en")
+            .iterator(chunk_size=opts["lote"])
+        )
+        self.stdout.write("Índice de media:")
+        for lote in _lotes(indice, opts["lote"]):
+            self._procesar([{**fila, "creado": fila.pop("creado_en")} for fila in lote])
+
+        if opts["storage"] and not opts["solo_indice"] and hasattr(default_storage, "listar"):
+            self.stdout.write("Listado del storage:")
+            for lote in _lotes(default_storage.listar(), opts["lote"]):
+                # Los que están en el índice ya se revisaron arriba
+                en_indice = set(
+                    ArchivoMedia.objects.filter(nombre__in=[r["nombre"] for r in lote]).values_list("nombre", flat=True)
+                )
+                self._procesar([r for r in lote if r["nombre"] not in en_indice])
+
+        resumen = f"{self.totales['revisados']} revisados, {self.totales['huerfanos']} huérfanos"
+        if self.dry_run:
+            resumen += " (dry-run: no se borró nada)"
+        else:
+            resumen += f", {self.totales['borrados']} borrados"
+        self.stdout.write(self.style.SUCCESS(resumen + "."))
+
+    def _procesar(self, recursos):
+        if not recursos:
+            return
+        usados    = referenciados(recursos, self.ids_url)
+        huerfanos = [
+            r for r in recursos
+            if r["nombre"] not in usados and (r["creado"] is None or r["creado"] < self.limite)
+        ]
+        self.totales["revisados"] += len(recursos)
+        self.totales["huerfanos"] += len(huerfanos)
+
+        if self.verbosity >= 2:
+            for r in huerfanos:
+                self.stdout.write(f"    {r['nombre']}")
+        if huerfanos and not self.dry_run:
+            self.totales["borrados"] += default_storage.borrar_lote(huerfanos)
+            ArchivoMedia.objects.filter(nombre__in=[r["nombre"] for r in huerfanos]).delete()
+
+        self.stdout.write(
+            f"  {self.totales['revisados']} revisados, {self.totales['huerfanos']} huérfanos"
+            + ("" if self.dry_run else f", {self.totales['borrados']} borrados")
+        )
@@ -0,0 +1,32 @@
+"""
+archivos/middleware.py
+
+Recuerda el request en curso para que CloudinaryStorage anote quién subió
+cada SubidaPendiente: el storage no recibe el request. DRF copia al
+HttpRequest el usuario autenticado por JWT, así que se lee recién al
+guardar el archivo, no al entrar el request.
+"""
+
+import threading
+
+_estado = threading.local()
+
+
+def usuario_actual_id():
+    """id del usuario autenticado del request en curso, o None (hilos, comandos, anónimos)."""
+    usuario = getattr(getattr(_estado, "request", None), "user", None)
+    if usuario is None or not usuario.is_authenticated:
+        return None
+    return usuario.pk
+
+
+class RequestActualMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _estado.request = request
+        try:
+            return self.get_response(request)
+        finally:
+            _estado.request = None
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:23
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubidaPendiente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('nombre', models.CharField(help_text='Nombre provisional guardado en el modelo', max_length=200, unique=True)),
+                ('public_id', models.CharField(max_length=300)),
+                ('resource_type', models.CharField(max_length=10)),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('SUBIENDO', 'Subiendo'), ('LISTO', 'Listo'), ('ERROR', 'Error')], db_index=True, default='PENDIENTE', max_length=10)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('url_final', models.URLField(blank=True, max_length=500)),
+                ('error', models.TextField(blank=True)),
+                ('creada_en', models.DateTimeField(auto_now_add=True)),
+                ('actualizada', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Subida pendiente',
+                'verbose_name_plural': 'Subidas pendientes',
+                'ordering': ['-creada_en'],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:25
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archivos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CargaFragmentada',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('destino', models.CharField(choices=[('evento.video', 'Video de evento'), ('entrevista.audio_archivo', 'Audio de entrevista')], max_length=30)),
+                ('objeto_id', models.PositiveIntegerField()),
+                ('nombre_original', models.CharField(max_length=255)),
+                ('tamano', models.PositiveBigIntegerField(help_text='Tamaño total en bytes')),
+                ('recibidos', models.PositiveBigIntegerField(default=0)),
+                ('sha256', models.CharField(max_length=64)),
+                ('estado', models.CharField(choices=[('ABIERTA', 'Abierta'), ('COMPLETA', 'Completa')], default='ABIERTA', max_length=10)),
+                ('creada_en', models.DateTimeField(auto_now_add=True)),
+                ('actualizada', models.DateTimeField(auto_now=True)),
+                ('subida', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='archivos.subidapendiente')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cargas_fragmentadas', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Carga fragmentada',
+                'verbose_name_plural': 'Cargas fragmentadas',
+                'ordering': ['-creada_en'],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archivos', '0002_cargafragmentada'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivoMedia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('nombre', models.CharField(help_text='Nombre guardado en los modelos (URL o pendiente)', max_length=500, unique=True)),
+                ('public_id', models.CharField(max_length=300)),
+                ('resource_type', models.CharField(max_length=10)),
+                ('referencias', models.PositiveIntegerField(default=1)),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archivo de media',
+                'verbose_name_plural': 'Archivos de media',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archivos', '0003_archivomedia'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivomedia',
+            name='alto',
+            field=models.PositiveIntegerField(blank=True, help_text='Alto intrínseco (imágenes)', null=True),
+        ),
+        migrations.AddField(
+            model_name='archivomedia',
+            name='ancho',
+            field=models.PositiveIntegerField(blank=True, help_text='Ancho intrínseco (imágenes)', null=True),
+        ),
+    ]
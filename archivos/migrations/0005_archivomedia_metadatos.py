@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archivos', '0004_archivomedia_dimensiones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivomedia',
+            name='duracion',
+            field=models.FloatField(blank=True, help_text='Segundos (audio y video)', null=True),
+        ),
+        migrations.AddField(
+            model_name='archivomedia',
+            name='formato',
+            field=models.CharField(blank=True, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='archivomedia',
+            name='tamano',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Bytes', null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivomedia',
+            name='alto',
+            field=models.PositiveIntegerField(blank=True, help_text='Alto intrínseco (imágenes y video)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivomedia',
+            name='ancho',
+            field=models.PositiveIntegerField(blank=True, help_text='Ancho intrínseco (imágenes y video)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='archivomedia',
+            name='sha256',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,119 @@
+"""
+archivos/models.py
+
+Seguimiento de la subida asíncrona de archivos a Cloudinary.
+
+Cuando CloudinaryStorage recibe un video o audio no lo sube dentro del
+request: lo deja en MEDIA_ROOT/pendientes/, crea una SubidaPendiente y
+guarda en el modelo un nombre provisional ("pendientes/<token>.<ext>").
+Un pool de hilos (archivos/cola.py) lo sube después y cambia el nombre
+provisional por la `secure_url` definitiva.
+"""
+
+import uuid
+
+from django.db import models
+
+
+class SubidaPendiente(models.Model):
+
+    class Estado(models.TextChoices):
+        PENDIENTE = "PENDIENTE", "Pendiente"
+        SUBIENDO  = "SUBIENDO",  "Subiendo"
+        LISTO     = "LISTO",     "Listo"
+        ERROR     = "ERROR",     "Error"
+
+    token         = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    nombre        = models.CharField(max_length=200, unique=True, help_text="Nombre provisional guardado en el modelo")
+    public_id     = models.CharField(max_length=300)
+    resource_type = models.CharField(max_length=10)
+    estado        = models.CharField(max_length=10, choices=Estado.choices, default=Estado.PENDIENTE, db_index=True)
+    intentos      = models.PositiveSmallIntegerField(default=0)
+    url_final     = models.URLField(max_length=500, blank=True)
+    error         = models.TextField(blank=True)
+    # Quien hizo el request que guardó el archivo (archivos/middleware.py)
+    usuario       = models.ForeignKey(
+        "usuarios.Usuario", on_delete=models.SET_NULL, null=True, blank=True, related_name="subidas",
+    )
+    creada_en     = models.DateTimeField(auto_now_add=True)
+    actualizada   = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = "Subida pendiente"
+        verbose_name_plural = "Subidas pendientes"
+        ordering            = ["-creada_en"]
+
+    def __str__(self):
+        return f"{self.nombre} [{self.estado}]"
+
+
+class CargaFragmentada(models.Model):
+    """
+    Subida reanudable por fragmentos (ver archivos/cargas.py).
+    Los bytes se acumulan en MEDIA_ROOT/cargas/<token>.part; al completarse
+    se verifica el sha256 y el archivo se adjunta al campo de destino.
+    """
+
+    class Destino(models.TextChoices):
+        EVENTO_VIDEO     = "evento.video",             "Video de evento"
+        ENTREVISTA_AUDIO = "entrevista.audio_archivo", "Audio de entrevista"
+
+    class Estado(models.TextChoices):
+        ABIERTA  = "ABIERTA",  "Abierta"
+        COMPLETA = "COMPLETA", "Completa"
+
+    token           = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    usuario         = models.ForeignKey(
+        "usuarios.Usuario", on_delete=models.CASCADE, related_name="cargas_fragmentadas",
+    )
+    destino         = models.CharField(max_length=30, choices=Destino.choices)
+    objeto_id       = models.PositiveIntegerField()
+    nombre_original = models.CharField(max_length=255)
+    tamano          = models.PositiveBigIntegerField(help_text="Tamaño total en bytes")
+    recibidos       = models.PositiveBigIntegerField(default=0)
+    sha256          = models.CharField(max_length=64)
+    estado          = models.CharField(max_length=10, choices=Estado.choices, default=Estado.ABIERTA)
+    subida          = models.ForeignKey(
+        SubidaPendiente, on_delete=models.SET_NULL, null=True, blank=True, related_name="+",
+    )
+    creada_en       = models.DateTimeField(auto_now_add=True)
+    actualizada     = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = "Carga fragmentada"
+        verbose_name_plural = "Cargas fragmentadas"
+        ordering            = ["-creada_en"]
+
+    def __str__(self):
+        return f"{self.nombre_original} ({self.recibidos}/{self.tamano})"
+
+
+class ArchivoMedia(models.Model):
+    """
+    Índice por contenido y metadatos de lo que está en el storage
+    (ver archivos/contenido.py). Un mismo archivo subido varias veces se
+    guarda una sola vez; `referencias` cuenta cuántos guardados lo usan.
+
+    Los metadatos salen de la respuesta de la subida, así size(), exists()
+    y los serializers no tienen que preguntarle nada a Cloudinary.
+    Los archivos anteriores al índice los agrega `manage.py completar_metadatos`
+    (sin sha256: no participan en la deduplicación).
+    """
+    sha256        = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    nombre        = models.CharField(max_length=500, unique=True, help_text="Nombre guardado en los modelos (URL o pendiente)")
+    public_id     = models.CharField(max_length=300)
+    resource_type = models.CharField(max_length=10)
+    referencias   = models.PositiveIntegerField(default=1)
+    tamano        = models.PositiveBigIntegerField(null=True, blank=True, help_text="Bytes")
+    ancho         = models.PositiveIntegerField(null=True, blank=True, help_text="Ancho intrínseco (imágenes y video)")
+    alto          = models.PositiveIntegerField(null=True, blank=True, help_text="Alto intrínseco (imágenes y video)")
+    duracion      = models.FloatField(null=True, blank=True, help_text="Segundos (audio y video)")
+    formato       = models.CharField(max_length=10, blank=True)
+    creado_en     = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = "Archivo de media"
+        verbose_name_plural = "Archivos de media"
+
+    def __str__(self):
+        return f"{self.nombre} (×{self.referencias})"
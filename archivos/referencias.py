@@ -0,0 +1,51 @@
+"""
+archivos/referencias.py
+
+Dónde se guardan nombres de archivo en la base de datos: todos los
+FileField/ImageField de los modelos instalados y, como URL pegada a mano,
+los URLField (imagen_url, video_url, src de los bloques, ...).
+"""
+
+from django.apps import apps
+from django.db import models
+
+
+def campos_archivo():
+    """Pares (modelo, nombre_del_campo) de cada FileField concreto."""
+    for modelo in apps.get_models():
+        for campo in modelo._meta.concrete_fields:
+            if isinstance(campo, models.FileField):
+                yield modelo, campo.name
+
+
+def campos_url():
+    """
+    Pares (modelo, nombre_del_campo) de cada URLField, salvo los de la app
+    archivos (url_final de SubidaPendiente es un registro, no un uso).
+    """
+    for modelo in apps.get_models():
+        if modelo._meta.app_label == "archivos":
+            continue
+        for campo in modelo._meta.concrete_fields:
+            if isinstance(campo, models.URLField):
+                yield modelo, campo.name
+
+
+def reemplazar_referencias(viejo, nuevo):
+    """
+    Cambia el nombre `viejo` por `nuevo` en todas las filas que lo usan.
+    Se guarda con save(update_fields=...) para que corran las señales de
+    siempre (caché, ETag, búsqueda, cuerpo compilado). Devuelve cuántas
+    filas cambió.
+    """
+    cambiadas = 0
+    for modelo, nombre in campos_archivo():
+        auto_now = [
+            c.name for c in modelo._meta.concrete_fields
+            if getattr(c, "auto_now", False)
+        ]
+        for objeto in modelo._default_manager.filter(**{nombre: viejo}):
+            setattr(objeto, nombre, nuevo)
+            objeto.save(update_fields=[nombre, *auto_now])
+            cambiadas += 1
+    return cambiadas
@@ -0,0 +1,164 @@
+"""archivos/serializers.py"""
+
+import os
+import re
+
+from django.conf import settings
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import get_attribute
+
+from .cargas import DESTINOS, modelo_y_campo
+from .cola import es_pendiente
+from .contenido import metadatos
+from .derivados import srcset
+from .models import CargaFragmentada, SubidaPendiente
+
+
+class SubidaPendienteSerializer(serializers.ModelSerializer):
+    class Meta:
+        model  = SubidaPendiente
+        fields = [
+            "token", "estado", "intentos", "resource_type",
+            "url_final", "error", "creada_en", "actualizada",
+        ]
+
+
+class SubidasPendientesField(serializers.Field):
+    """
+    Solo lectura, con source="*". Para cada archivo del objeto que todavía
+    no termina de subirse devuelve {campo: {token, estado}}; el front
+    consulta /api/archivos/subidas/<token>/ hasta que quede LISTO.
+    Sin consultas si no hay nada pendiente.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "*")
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instancia):
+        pendientes = {}
+        for campo in instancia._meta.concrete_fields:
+            if isinstance(campo, models.FileField):
+                nombre = getattr(instancia, campo.attname).name
+                if es_pendiente(nombre):
+                    pendientes[nombre] = campo.name
+        if not pendientes:
+            return {}
+        filas = SubidaPendiente.objects.filter(nombre__in=pendientes).values_list("nombre", "token", "estado")
+        return {pendientes[nombre]: {"token": token, "estado": estado} for nombre, token, estado in filas}
+
+
+class _CampoMedia(serializers.Field):
+    """
+    Base de los campos de solo lectura que leen el índice ArchivoMedia.
+    En un listado se cargan los metadatos de toda la página con una sola
+    consulta, la primera vez que se necesitan.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def _metadatos(self, archivo):
+        cache = self.context.setdefault("_metadatos_media", {})
+        if archivo.name not in cache:
+            nombres = self._nombres_de_la_pagina() | {archivo.name}
+            cache.update(dict.fromkeys(nombres))
+            cache.update(metadatos(nombres))
+        return cache[archivo.name]
+
+    def _nombres_de_la_pagina(self):
+        # Camino de atributos desde cada objeto del listado hasta este campo
+        raiz = self.root
+        if not isinstance(raiz, serializers.ListSerializer) or raiz.instance is None:
+            return set()
+        ruta, nodo = [], self
+        while nodo is not raiz.child:
+            if nodo.parent is None or isinstance(nodo.parent, serializers.ListSerializer):
+                return set()  # anidado many=True: se resuelve uno por uno
+            ruta = nodo.source_attrs + ruta
+            nodo = nodo.parent
+
+        nombres = set()
+        for objeto in raiz.instance:
+            try:
+                archivo = get_attribute(objeto, ruta)
+            except (AttributeError, KeyError, ValueError):
+                continue
+            if archivo:
+                nombres.add(archivo.name)
+        return nombres
+
+
+class SrcsetField(_CampoMedia):
+    """
+    Versiones responsive de un ImageField (ver archivos/derivados.py), o
+    None si no hay archivo subido.
+
+        imagen_srcset = SrcsetField(source="imagen")
+    """
+
+    def to_representation(self, archivo):
+        if not archivo or not hasattr(archivo.storage, "derivados"):
+            return None
+        datos = self._metadatos(archivo) or {}
+        return srcset(archivo.storage, archivo.name, datos.get("ancho"), datos.get("alto"))
+
+
+class MetadatosField(_CampoMedia):
+    """
+    {tamano, ancho, alto, duracion, resource_type, formato} de un archivo
+    subido, o None si no hay archivo o todavía no está en el índice.
+
+        video_meta = MetadatosField(source="video")
+    """
+
+    def to_representation(self, archivo):
+        if not archivo:
+            return None
+        return self._metadatos(archivo)
+
+
+class CargaFragmentadaSerializer(serializers.ModelSerializer):
+    subida = serializers.SlugRelatedField(slug_field="token", read_only=True)
+
+    class Meta:
+        model  = CargaFragmentada
+        fields = [
+            "token", "destino", "objeto_id", "nombre_original",
+            "tamano", "sha256", "recibidos", "estado", "subida", "creada_en",
+        ]
+        read_only_fields = ["token", "recibidos", "estado", "subida", "creada_en"]
+
+    def validate_sha256(self, valor):
+        valor = valor.lower()
+        if not re.fullmatch(r"[0-9a-f]{64}", valor):
+            raise serializers.ValidationError("Debe ser el sha256 en hexadecimal (64 caracteres).")
+        return valor
+
+    def validate_tamano(self, valor):
+        if not 0 < valor <= settings.MEDIA_CARGA_TAMANO_MAXIMO:
+            raise serializers.ValidationError(
+                f"Debe estar entre 1 y {settings.MEDIA_CARGA_TAMANO_MAXIMO} bytes."
+            )
+        return valor
+
+    def validate(self, data):
+        extensiones = DESTINOS[data["destino"]][2]
+        ext = os.path.splitext(data["nombre_original"])[-1].lower()
+        if ext not in extensiones:
+            raise serializers.ValidationError(
+                {"nombre_original": f"Extensión no permitida. Use: {', '.join(extensiones)}."}
+            )
+        modelo, _ = modelo_y_campo(data["destino"])
+        objeto = modelo._default_manager.filter(pk=data["objeto_id"]).first()
+        if objeto is None:
+            raise serializers.ValidationError({"objeto_id": "No existe."})
+        data["objeto"] = objeto
+        return data
+
+    def create(self, validated_data):
+        validated_data.pop("objeto")
+        return super().create(validated_data)
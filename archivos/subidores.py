@@ -0,0 +1,57 @@
+"""
+archivos/subidores.py
+
+Backends que envían un archivo local a su destino final.
+Se elige con settings.MEDIA_SUBIDOR.
+
+Todos exponen subir(ruta, public_id, resource_type) y devuelven un dict
+con la misma forma que la respuesta de cloudinary.uploader.upload
+(al menos "secure_url").
+"""
+
+import os
+import shutil
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def get_subidor():
+    return import_string(settings.MEDIA_SUBIDOR)()
+
+
+class SubidorCloudinary:
+
+    def subir(self, ruta, public_id, resource_type):
+        import cloudinary.uploader
+
+        # upload_large lee y envía el archivo por partes (chunk_size):
+        # la memoria no crece con el tamaño del video
+        return cloudinary.uploader.upload_large(
+            ruta,
+            public_id=public_id,
+            resource_type=resource_type,
+            overwrite=True,
+            chunk_size=settings.MEDIA_CHUNK_CLOUDINARY,
+        )
+
+
+class SubidorLocal:
+    """
+    Subidor falso para desarrollo y pruebas: copia el archivo a
+    MEDIA_ROOT/subidos/. En lugar de una URL devuelve el nombre relativo
+    ("subidos/..."), que CloudinaryStorage.url() resuelve bajo MEDIA_URL.
+    """
+
+    def subir(self, ruta, public_id, resource_type):
+        ext     = os.path.splitext(ruta)[1]
+        destino = os.path.join(settings.MEDIA_ROOT, "subidos", f"{public_id}{ext}")
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        shutil.copyfile(ruta, destino)
+        return {
+            "secure_url":    f"subidos/{public_id}{ext}",
+            "public_id":     public_id,
+            "resource_type": resource_type,
+            "bytes":         os.path.getsize(destino),
+            "format":        ext.lstrip("."),
+        }
@@ -0,0 +1,310 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from PIL import Image
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from eventos.models import Evento
+from eventos.serializers import EventoResumenSerializer
+from noticias.models import Noticia
+from usuarios.models import Usuario
+from .cola import procesar, retomar, ruta_temporal
+from .contenido import liberar
+from .derivados import TAMANOS
+from .models import ArchivoMedia, SubidaPendiente
+from .referencias import reemplazar_referencias
+from .subidores import SubidorLocal
+
+PENDIENTE = "pendientes/eventos/imagenes/afiche.jpg"
+
+
+class SubidorFallido(SubidorLocal):
+    """Falla las primeras `fallos` llamadas y después copia como SubidorLocal."""
+
+    def __init__(self, fallos):
+        self.fallos   = fallos
+        self.llamadas = 0
+
+    def subir(self, ruta, public_id, resource_type):
+        self.llamadas += 1
+        if self.llamadas <= self.fallos:
+            raise ConnectionError("Cloudinary no responde")
+        return super().subir(ruta, public_id, resource_type)
+
+
+class SubidasTests(TestCase):
+
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        ajustes = override_settings(
+            MEDIA_ROOT=self.media,
+            MEDIA_SUBIDOR="archivos.subidores.SubidorLocal",
+            MEDIA_SUBIDA_REINTENTOS=3,
+        )
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+        ruta = ruta_temporal(PENDIENTE)
+        os.makedirs(os.path.dirname(ruta))
+        with open(ruta, "wb") as f:
+            f.write(b"imagen de prueba")
+
+        self.subida = SubidaPendiente.objects.create(
+            nombre=PENDIENTE, public_id="eventos/imagenes/afiche", resource_type="image",
+        )
+        ArchivoMedia.objects.create(nombre=PENDIENTE, public_id="eventos/imagenes/afiche", resource_type="image")
+        self.evento = Evento.objects.create(
+            titulo="Función", fecha=timezone.now() + timedelta(days=3), lugar="Teatro", imagen=PENDIENTE,
+        )
+
+    def test_cambia_el_nombre_pendiente_por_el_final(self):
+        subida = procesar(self.subida.pk, espera_base=0)
+
+        self.assertEqual(subida.estado, SubidaPendiente.Estado.LISTO)
+        self.assertEqual(subida.url_final, "subidos/eventos/imagenes/afiche.jpg")
+        self.evento.refresh_from_db()
+        self.assertEqual(self.evento.imagen.name, subida.url_final)
+        self.assertTrue(ArchivoMedia.objects.filter(nombre=subida.url_final, tamano=16).exists())
+        self.assertTrue(os.path.exists(os.path.join(self.media, subida.url_final)))
+        self.assertFalse(os.path.exists(ruta_temporal(PENDIENTE)))
+
+    def test_reintenta_hasta_subir(self):
+        subidor = SubidorFallido(fallos=2)
+        with mock.patch("archivos.cola.get_subidor", return_value=subidor), self.assertLogs("archivos.cola", "WARNING"):
+            subida = procesar(self.subida.pk, espera_base=0)
+
+        self.assertEqual(subidor.llamadas, 3)
+        self.assertEqual(subida.intentos, 3)
+        self.assertEqual(subida.estado, SubidaPendiente.Estado.LISTO)
+
+    def test_agota_los_reintentos(self):
+        subidor = SubidorFallido(fallos=5)
+        with mock.patch("archivos.cola.get_subidor", return_value=subidor), self.assertLogs("archivos.cola", "WARNING"):
+            subida = procesar(self.subida.pk, espera_base=0)
+
+        self.assertEqual(subidor.llamadas, 3)
+        self.assertEqual(subida.estado, SubidaPendiente.Estado.ERROR)
+        self.assertIn("Cloudinary no responde", subida.error)
+        # El temporal se conserva para procesar_subidas
+        self.assertTrue(os.path.exists(ruta_temporal(PENDIENTE)))
+        self.evento.refresh_from_db()
+        self.assertEqual(self.evento.imagen.name, PENDIENTE)
+
+    def test_no_toma_una_subida_en_curso(self):
+        SubidaPendiente.objects.filter(pk=self.subida.pk).update(estado=SubidaPendiente.Estado.SUBIENDO)
+        subida = procesar(self.subida.pk, espera_base=0)
+
+        self.assertEqual(subida.estado, SubidaPendiente.Estado.SUBIENDO)
+        self.assertEqual(subida.intentos, 0)
+
+    def test_atascadas(self):
+        SubidaPendiente.objects.filter(pk=self.subida.pk).update(
+            estado=SubidaPendiente.Estado.SUBIENDO, actualizada=timezone.now() - timedelta(hours=1),
+        )
+        call_command("procesar_subidas", atascadas=30, stdout=StringIO(), stderr=StringIO())
+
+        self.subida.refresh_from_db()
+        self.assertEqual(self.subida.estado, SubidaPendiente.Estado.LISTO)
+
+    def test_retomar_al_arrancar(self):
+        SubidaPendiente.objects.filter(pk=self.subida.pk).update(
+            estado=SubidaPendiente.Estado.SUBIENDO, actualizada=timezone.now() - timedelta(hours=1),
+        )
+        retomar(30)
+
+        self.subida.refresh_from_db()
+        self.assertEqual(self.subida.estado, SubidaPendiente.Estado.LISTO)
+
+    def test_retomar_respeta_una_subida_reciente(self):
+        SubidaPendiente.objects.filter(pk=self.subida.pk).update(estado=SubidaPendiente.Estado.SUBIENDO)
+        retomar(30)
+
+        self.subida.refresh_from_db()
+        self.assertEqual(self.subida.estado, SubidaPendiente.Estado.SUBIENDO)
+
+    def test_fila_guardada_despues_de_subir(self):
+        procesar(self.subida.pk, espera_base=0)
+        tarde = Evento.objects.create(
+            titulo="Otra", fecha=timezone.now() + timedelta(days=4), lugar="Teatro", imagen=PENDIENTE,
+        )
+
+        tarde.refresh_from_db()
+        self.assertEqual(tarde.imagen.name, "subidos/eventos/imagenes/afiche.jpg")
+
+
+class SubidaDetalleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.duena  = Usuario.objects.create_user("duena@ruedo.test", "clave", nombres="D", apellidos="X")
+        cls.otro   = Usuario.objects.create_user("otro@ruedo.test", "clave", nombres="O", apellidos="X")
+        cls.subida = SubidaPendiente.objects.create(
+            nombre=PENDIENTE, public_id="eventos/imagenes/afiche", resource_type="image", usuario=cls.duena,
+        )
+
+    def _get(self, usuario):
+        cliente = APIClient()
+        cliente.force_authenticate(usuario)
+        return cliente.get(f"/api/archivos/subidas/{self.subida.token}/", HTTP_HOST="localhost")
+
+    def test_la_ve_quien_la_subio(self):
+        self.assertEqual(self._get(self.duena).status_code, 200)
+
+    def test_otro_usuario_no_la_ve(self):
+        self.assertEqual(self._get(self.otro).status_code, 404)
+
+    def test_un_cuentero_ve_todas(self):
+        self.otro.rol = Usuario.Rol.CUENTERO
+        self.assertEqual(self._get(self.otro).status_code, 200)
+
+
+class ReemplazarReferenciasTests(TestCase):
+
+    def test_cambia_todas_las_filas_que_lo_usan(self):
+        fecha   = timezone.now() + timedelta(days=3)
+        uno     = Evento.objects.create(titulo="Uno", fecha=fecha, lugar="Teatro", imagen="pendientes/x.jpg")
+        dos     = Evento.objects.create(titulo="Dos", fecha=fecha, lugar="Teatro", imagen="pendientes/y.jpg")
+        antes   = uno.actualizado
+        noticia = Noticia.objects.create(titulo="Nota", imagen_portada="pendientes/x.jpg")
+
+        self.assertEqual(reemplazar_referencias("pendientes/x.jpg", "https://res.cloudinary.com/x.jpg"), 2)
+
+        uno.refresh_from_db()
+        dos.refresh_from_db()
+        noticia.refresh_from_db()
+        self.assertEqual(uno.imagen.name, "https://res.cloudinary.com/x.jpg")
+        self.assertEqual(noticia.imagen_portada.name, "https://res.cloudinary.com/x.jpg")
+        self.assertEqual(dos.imagen.name, "pendientes/y.jpg")
+        # update_fields incluye los auto_now: cambia el ETag
+        self.assertGreater(uno.actualizado, antes)
+
+
+def _en_el_acto(funcion, *args):
+    funcion(*args)
+
+
+@mock.patch("archivos.liberacion.programar", _en_el_acto)
+class LiberacionTests(TestCase):
+
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        ajustes = override_settings(MEDIA_ROOT=self.media)
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+    def _evento(self, contenido=b"afiche"):
+        evento = Evento(titulo="Función", fecha=timezone.now() + timedelta(days=3), lugar="Teatro")
+        evento.video.save("video.mp4", ContentFile(contenido), save=False)
+        evento.save()
+        return evento
+
+    def test_liberar_un_nombre_fuera_del_indice(self):
+        self.assertEqual(liberar("eventos/no-indexado.jpg"), (False, None, None))
+
+    def test_borrar_la_fila_libera_el_archivo(self):
+        evento = self._evento()
+        nombre = evento.video.name
+        self.assertTrue(default_storage.exists(nombre))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            evento.delete()
+
+        self.assertFalse(ArchivoMedia.objects.filter(nombre=nombre).exists())
+        self.assertFalse(default_storage.exists(nombre))
+
+    def test_contenido_compartido_solo_descuenta(self):
+        uno = self._evento()
+        dos = self._evento()
+        self.assertEqual(uno.video.name, dos.video.name)
+        self.assertEqual(ArchivoMedia.objects.get(nombre=uno.video.name).referencias, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            uno.delete()
+
+        self.assertEqual(ArchivoMedia.objects.get(nombre=dos.video.name).referencias, 1)
+        self.assertTrue(default_storage.exists(dos.video.name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            dos.delete()
+        self.assertFalse(default_storage.exists(dos.video.name))
+
+    def test_reemplazar_el_archivo_libera_el_anterior(self):
+        evento   = self._evento()
+        anterior = evento.video.name
+        with self.captureOnCommitCallbacks(execute=True):
+            evento.video.save("otro.mp4", ContentFile(b"otro contenido"))
+
+        self.assertNotEqual(evento.video.name, anterior)
+        self.assertFalse(default_storage.exists(anterior))
+        self.assertTrue(default_storage.exists(evento.video.name))
+
+    def test_no_suelta_un_nombre_copiado_a_otra_fila(self):
+        evento = self._evento()
+        copia  = Evento.objects.create(
+            titulo="Copia", fecha=evento.fecha, lugar="Teatro", video=evento.video.name,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            evento.delete()
+
+        self.assertTrue(ArchivoMedia.objects.filter(nombre=copia.video.name).exists())
+        self.assertTrue(default_storage.exists(copia.video.name))
+
+
+class DerivadosPillowTests(TestCase):
+
+    def setUp(self):
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        ajustes = override_settings(MEDIA_ROOT=self.media)
+        ajustes.enable()
+        self.addCleanup(ajustes.disable)
+
+    def _evento(self, ancho, alto):
+        contenido = BytesIO()
+        Image.new("RGB", (ancho, alto), (200, 40, 40)).save(contenido, "JPEG")
+        evento = Evento(titulo="Función", fecha=timezone.now() + timedelta(days=3), lugar="Teatro")
+        evento.imagen.save("afiche.jpg", ContentFile(contenido.getvalue()), save=False)
+        evento.save()
+        return evento
+
+    def test_genera_los_derivados_y_el_srcset(self):
+        evento = self._evento(2000, 1000)
+        nombre = evento.imagen.name
+        datos  = EventoResumenSerializer(evento).data["imagen_srcset"]
+
+        self.assertEqual((datos["ancho"], datos["alto"]), (2000, 1000))
+        base = os.path.splitext(nombre)[0]
+        self.assertEqual(
+            datos["srcset"]["original"],
+            ", ".join(f"/media/derivados/{base}/{tamano}.jpg {ancho}w" for tamano, ancho in TAMANOS.items()),
+        )
+        for formato in default_storage.derivados.formatos:
+            self.assertIn(f"/media/derivados/{base}/card.{formato} 640w", datos["srcset"][formato])
+
+        for derivado in default_storage.derivados.nombres(nombre):
+            self.assertTrue(derivado.startswith(f"derivados/{base}/"))
+            self.assertTrue(default_storage.exists(derivado), derivado)
+        for tamano, ancho in TAMANOS.items():
+            with Image.open(default_storage.path(f"derivados/{base}/{tamano}.jpg")) as imagen:
+                self.assertEqual(imagen.size, (ancho, ancho // 2))
+
+    def test_no_agranda_una_imagen_chica(self):
+        evento = self._evento(400, 300)
+        datos  = EventoResumenSerializer(evento).data["imagen_srcset"]
+
+        # full y card quedan en 400 px: el srcset no repite el ancho
+        self.assertEqual([parte.rsplit(" ", 1)[1] for parte in datos["srcset"]["original"].split(", ")], ["320w", "400w"])
+        with Image.open(default_storage.path(f"derivados/{os.path.splitext(evento.imagen.name)[0]}/full.jpg")) as imagen:
+            self.assertEqual(imagen.size, (400, 300))
@@ -0,0 +1,10 @@
+"""archivos/urls.py"""
+
+from django.urls import path
+from .views import CargaCrearView, CargaDetalleView, SubidaDetalleView
+
+urlpatterns = [
+    path("subidas/<uuid:token>/", SubidaDetalleView.as_view(), name="subida-detalle"),
+    path("cargas/",               CargaCrearView.as_view(),    name="carga-crear"),
+    path("cargas/<uuid:token>/",  CargaDetalleView.as_view(),  name="carga-detalle"),
+]
@@ -0,0 +1,70 @@
+"""archivos/views.py"""
+
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
+from usuarios.permissions import EsCuenteroOAdmin, EsPropietarioOCuentero
+from .cargas import ErrorCarga, escribir_fragmento, leer_rango
+from .models import CargaFragmentada, SubidaPendiente
+from .serializers import CargaFragmentadaSerializer, SubidaPendienteSerializer
+
+
+class SubidaDetalleView(generics.RetrieveAPIView):
+    """
+    GET /api/archivos/subidas/<token>/ → estado de una subida en segundo plano
+    (PENDIENTE, SUBIENDO, LISTO con url_final, o ERROR con el motivo).
+    Cada usuario ve solo las suyas; Cuenteros y Admins, todas.
+    """
+    serializer_class   = SubidaPendienteSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field       = "token"
+
+    def get_queryset(self):
+        if self.request.user.es_cuentero:
+            return SubidaPendiente.objects.all()
+        return SubidaPendiente.objects.filter(usuario_id=self.request.user.pk)
+
+
+class CargaCrearView(generics.CreateAPIView):
+    """
+    POST /api/archivos/cargas/
+    {"destino": "evento.video", "objeto_id": 12, "nombre_original": "funcion.mkv",
+     "tamano": 524288000, "sha256": "…"}
+    """
+    serializer_class   = CargaFragmentadaSerializer
+    permission_classes = [permissions.IsAuthenticated, EsCuenteroOAdmin]
+
+    def perform_create(self, serializer):
+        # Quien no puede editar el objeto tampoco puede cambiarle el archivo
+        objeto = serializer.validated_data["objeto"]
+        if not EsPropietarioOCuentero().has_object_permission(self.request, self, objeto):
+            self.permission_denied(self.request, message=EsPropietarioOCuentero.message)
+        serializer.save(usuario_id=self.request.user.pk)
+
+
+class CargaDetalleView(generics.RetrieveAPIView):
+    """
+    GET   /api/archivos/cargas/<token>/ → progreso (`recibidos`)
+    PATCH /api/archivos/cargas/<token>/ → un fragmento; cuerpo binario crudo con
+          Content-Range: bytes <inicio>-<fin>/<tamano>
+    """
+    serializer_class   = CargaFragmentadaSerializer
+    permission_classes = [permissions.IsAuthenticated, EsCuenteroOAdmin]
+    lookup_field       = "token"
+
+    def get_queryset(self):
+        return CargaFragmentada.objects.filter(usuario_id=self.request.user.pk)
+
+    def patch(self, request, *args, **kwargs):
+        carga = self.get_object()
+        try:
+            inicio, fin = leer_rango(request.headers.get("Content-Range"), carga.tamano)
+            # request.stream se lee por bloques; nunca se toca request.data/body
+            escribir_fragmento(carga, request.stream, inicio, fin)
+        except ErrorCarga as exc:
+            carga.refresh_from_db()
+            return Response(
+                {"detail": str(exc), "recibidos": carga.recibidos},
+                status=exc.status,
+            )
+        return Response(self.get_serializer(carga).data, status=status.HTTP_200_OK)
@@ -7,6 +7,10 @@ pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+python manage.py createcachetable
+python manage.py regenerar_agenda --todo
+python manage.py reindexar_busqueda
+python manage.py compilar_noticias
 
 # Crear superusuario si no existe (usa variables de entorno de Render)
 python manage.py shell -c "
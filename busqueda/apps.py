@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class BusquedaConfig(AppConfig):
+    name = 'busqueda'
+
+    def ready(self):
+        from .indice import conectar_senales
+
+        conectar_senales()
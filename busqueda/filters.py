@@ -0,0 +1,32 @@
+"""
+busqueda/filters.py
+
+Reemplazo de filters.SearchFilter respaldado por el índice de texto completo.
+Mismo parámetro (?search=); los resultados vienen ordenados por relevancia
+salvo que el cliente pida otro orden con ?ordering=.
+
+La búsqueda corre dentro de la misma consulta del queryset (motor.filtrar),
+así que los filtros de visibilidad de la vista no recortan un tope previo.
+
+Va después de OrderingFilter en filter_backends y la vista declara:
+    busqueda_tipo = DocumentoBusqueda.Tipo.NOTICIA
+"""
+
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from rest_framework.settings import api_settings
+
+from .motor import filtrar
+
+
+class BusquedaFilter(BaseFilterBackend):
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        q = request.query_params.get(self.search_param, "").strip()
+        if not q:
+            return queryset
+
+        queryset = filtrar(queryset, q, view.busqueda_tipo)
+        if request.query_params.get(OrderingFilter.ordering_param):
+            return queryset
+        return queryset.order_by("-relevancia", "pk")
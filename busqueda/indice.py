@@ -0,0 +1,86 @@
+"""
+busqueda/indice.py
+
+Construye y mantiene los DocumentoBusqueda de cada tipo de contenido.
+
+Cada save/delete de Evento, Noticia, BloqueContenido o Entrevista reescribe
+el documento de su objeto (un bloque reindexa su noticia completa). Las
+escrituras masivas (update/bulk_create) no disparan señales: quien las use
+debe llamar a indexar() o correr `manage.py reindexar_busqueda`.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from entrevistas.models import Entrevista
+from eventos.models import Evento
+from noticias.models import Noticia, BloqueContenido
+
+from ruedo.condicional import toques_suspendidos
+from .models import DocumentoBusqueda
+from .normalizar import normalizar
+
+Tipo = DocumentoBusqueda.Tipo
+
+
+def _doc_evento(evento):
+    return normalizar(evento.titulo), normalizar(evento.descripcion, evento.lugar, evento.ciudad), True
+
+
+def _doc_noticia(noticia):
+    cuerpo = [noticia.resumen]
+    for bloque in noticia.bloques.all():
+        cuerpo.extend([bloque.texto, bloque.autor, bloque.pie])
+    return normalizar(noticia.titulo), normalizar(*cuerpo), noticia.publicada
+
+
+def _doc_entrevista(entrevista):
+    return (
+        normalizar(entrevista.titulo, entrevista.entrevistado),
+        normalizar(entrevista.resumen, entrevista.rol, entrevista.descripcion_larga),
+        entrevista.publicada,
+    )
+
+
+# tipo → (modelo, función que arma (titulo, cuerpo, publicado))
+TIPOS = {
+    Tipo.EVENTO:     (Evento,     _doc_evento),
+    Tipo.NOTICIA:    (Noticia,    _doc_noticia),
+    Tipo.ENTREVISTA: (Entrevista, _doc_entrevista),
+}
+
+
+def indexar(tipo, objeto):
+    _, construir = TIPOS[tipo]
+    titulo, cuerpo, publicado = construir(objeto)
+    DocumentoBusqueda.objects.update_or_create(
+        tipo=tipo, objeto_id=objeto.pk,
+        defaults={"titulo": titulo, "cuerpo": cuerpo, "publicado": publicado},
+    )
+
+
+def desindexar(tipo, objeto_id):
+    DocumentoBusqueda.objects.filter(tipo=tipo, objeto_id=objeto_id).delete()
+
+
+def conectar_senales():
+    for tipo, (modelo, _) in TIPOS.items():
+        def _guardado(sender, instance, raw=False, tipo=tipo, **kwargs):
+            if not raw:
+                indexar(tipo, instance)
+
+        def _borrado(sender, instance, tipo=tipo, **kwargs):
+            desindexar(tipo, instance.pk)
+
+        uid = f"busqueda-{tipo}"
+        post_save.connect(_guardado, sender=modelo, weak=False, dispatch_uid=uid)
+        post_delete.connect(_borrado, sender=modelo, weak=False, dispatch_uid=uid)
+
+    def _bloque(sender, instance, raw=False, **kwargs):
+        if raw or toques_suspendidos():
+            return
+        noticia = Noticia.objects.filter(pk=instance.noticia_id).first()
+        if noticia is not None:
+            indexar(Tipo.NOTICIA, noticia)
+
+    post_save.connect(_bloque, sender=BloqueContenido, weak=False, dispatch_uid="busqueda-bloque")
+    post_delete.connect(_bloque, sender=BloqueContenido, weak=False, dispatch_uid="busqueda-bloque")
@@ -0,0 +1,39 @@
+"""
+busqueda/management/commands/reindexar_busqueda.py
+
+Construye los documentos de búsqueda del contenido existente.
+
+    python manage.py reindexar_busqueda            → solo objetos sin documento
+    python manage.py reindexar_busqueda --todo     → reconstruye todo
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from busqueda.indice import TIPOS, indexar
+from busqueda.models import DocumentoBusqueda
+
+
+class Command(BaseCommand):
+    help = "Indexa eventos, noticias y entrevistas para la búsqueda de texto completo."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todo", action="store_true", help="Reindexar también los que ya tienen documento.")
+
+    def handle(self, *args, **opts):
+        for tipo, (modelo, _) in TIPOS.items():
+            qs = modelo.objects.all()
+            if tipo == DocumentoBusqueda.Tipo.NOTICIA:
+                qs = qs.prefetch_related("bloques")
+            if not opts["todo"]:
+                indexados = DocumentoBusqueda.objects.filter(tipo=tipo).values("objeto_id")
+                qs = qs.exclude(pk__in=indexados)
+
+            n = 0
+            with transaction.atomic():
+                for objeto in qs.iterator(chunk_size=200):
+                    indexar(tipo, objeto)
+                    n += 1
+            self.stdout.write(f"{modelo._meta.verbose_name_plural}: {n} indexados")
+
+        self.stdout.write(self.style.SUCCESS("Índice de búsqueda al día."))
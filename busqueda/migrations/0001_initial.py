@@ -0,0 +1,83 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:15
+
+from django.db import migrations, models
+
+# Copia fija del DDL: la migración no debe depender de busqueda/motor.py, que
+# puede cambiar. VECTOR_SQL tiene que coincidir con motor.VECTOR_SQL.
+TABLA     = "busqueda_documentobusqueda"
+TABLA_FTS = "busqueda_fts"
+
+VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', titulo), 'A') || "
+    "setweight(to_tsvector('simple', cuerpo), 'B'))"
+)
+
+DDL = {
+    "postgresql": (
+        [f"CREATE INDEX IF NOT EXISTS busqueda_documento_gin ON {TABLA} USING GIN ({VECTOR_SQL})"],
+        ["DROP INDEX IF EXISTS busqueda_documento_gin"],
+    ),
+    "sqlite": (
+        [
+            f"""CREATE VIRTUAL TABLE IF NOT EXISTS {TABLA_FTS} USING fts5(
+                titulo, cuerpo, content='{TABLA}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )""",
+            f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ai AFTER INSERT ON {TABLA} BEGIN
+                INSERT INTO {TABLA_FTS}(rowid, titulo, cuerpo) VALUES (new.id, new.titulo, new.cuerpo);
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_ad AFTER DELETE ON {TABLA} BEGIN
+                INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, cuerpo) VALUES ('delete', old.id, old.titulo, old.cuerpo);
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {TABLA_FTS}_au AFTER UPDATE ON {TABLA} BEGIN
+                INSERT INTO {TABLA_FTS}({TABLA_FTS}, rowid, titulo, cuerpo) VALUES ('delete', old.id, old.titulo, old.cuerpo);
+                INSERT INTO {TABLA_FTS}(rowid, titulo, cuerpo) VALUES (new.id, new.titulo, new.cuerpo);
+            END""",
+        ],
+        [
+            f"DROP TRIGGER IF EXISTS {TABLA_FTS}_ai",
+            f"DROP TRIGGER IF EXISTS {TABLA_FTS}_ad",
+            f"DROP TRIGGER IF EXISTS {TABLA_FTS}_au",
+            f"DROP TABLE IF EXISTS {TABLA_FTS}",
+        ],
+    ),
+}
+
+
+def crear_indice_texto(apps, schema_editor):
+    for sql in DDL.get(schema_editor.connection.vendor, ([], []))[0]:
+        schema_editor.execute(sql)
+
+
+def borrar_indice_texto(apps, schema_editor):
+    for sql in DDL.get(schema_editor.connection.vendor, ([], []))[1]:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentoBusqueda',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('evento', 'Evento'), ('noticia', 'Noticia'), ('entrevista', 'Entrevista')], max_length=12)),
+                ('objeto_id', models.PositiveBigIntegerField()),
+                ('publicado', models.BooleanField(default=True)),
+                ('titulo', models.TextField(blank=True)),
+                ('cuerpo', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name': 'Documento de búsqueda',
+                'verbose_name_plural': 'Documentos de búsqueda',
+                'constraints': [models.UniqueConstraint(fields=('tipo', 'objeto_id'), name='documento_busqueda_unico')],
+            },
+        ),
+        # GIN (PostgreSQL) o FTS5 + triggers (SQLite), según el motor
+        migrations.RunPython(crear_indice_texto, borrar_indice_texto),
+    ]
@@ -0,0 +1,36 @@
+"""
+busqueda/models.py
+
+Documento de búsqueda precomputado por cada Evento, Noticia y Entrevista.
+`titulo` y `cuerpo` guardan el texto ya normalizado (sin tildes, con raíz
+en español, ver normalizar.py); el índice de texto completo propio de cada
+motor se crea en la migración 0001:
+    PostgreSQL → índice GIN sobre el tsvector (titulo peso A, cuerpo peso B)
+    SQLite     → tabla virtual FTS5 sincronizada con triggers
+"""
+
+from django.db import models
+
+
+class DocumentoBusqueda(models.Model):
+
+    class Tipo(models.TextChoices):
+        EVENTO     = "evento",     "Evento"
+        NOTICIA    = "noticia",    "Noticia"
+        ENTREVISTA = "entrevista", "Entrevista"
+
+    tipo      = models.CharField(max_length=12, choices=Tipo.choices)
+    objeto_id = models.PositiveBigIntegerField()
+    publicado = models.BooleanField(default=True)
+    titulo    = models.TextField(blank=True)
+    cuerpo    = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name        = "Documento de búsqueda"
+        verbose_name_plural = "Documentos de búsqueda"
+        constraints         = [
+            models.UniqueConstraint(fields=["tipo", "objeto_id"], name="documento_busqueda_unico"),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo} {self.objeto_id}"
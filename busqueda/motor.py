@@ -0,0 +1,123 @@
+"""
+busqueda/motor.py
+
+Consulta al índice de texto completo según el motor de base de datos.
+
+    PostgreSQL → to_tsquery sobre el índice GIN de la expresión VECTOR_SQL,
+                 ordenado por ts_rank.
+    SQLite     → MATCH sobre la tabla FTS5, ordenado por bm25.
+    Otros      → icontains sobre el texto normalizado (sin ranking real).
+
+buscar() devuelve una lista de (tipo, objeto_id, puntaje), mejor primero.
+filtrar() aplica la misma búsqueda a un queryset dentro del propio SQL
+(subconsulta de ids + puntaje correlacionado), sin tope de resultados.
+
+El DDL del índice (GIN / FTS5 + triggers) está en la migración 0001.
+"""
+
+from django.db import connection
+from django.db.models import Case, FloatField, IntegerField, Q, When
+from django.db.models.expressions import RawSQL
+
+from .models import DocumentoBusqueda
+from .normalizar import terminos
+
+TABLA = DocumentoBusqueda._meta.db_table
+TABLA_FTS = "busqueda_fts"
+
+# La consulta debe usar exactamente la misma expresión que el índice GIN
+# (copiada en busqueda/migrations/0001_initial.py)
+VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', titulo), 'A') || "
+    "setweight(to_tsvector('simple', cuerpo), 'B'))"
+)
+
+# ── Consulta ──
+
+def _coincidencias(consulta, tipo, solo_publicados):
+    """FROM/WHERE (alias `d`) y parámetros de la búsqueda en PostgreSQL o SQLite."""
+    filtros, params = [], []
+    if tipo:
+        filtros.append("d.tipo = %s")
+        params.append(tipo)
+    if solo_publicados:
+        filtros.append("d.publicado = %s")
+        params.append(True)
+    extra = "".join(f" AND {f}" for f in filtros)
+
+    if connection.vendor == "postgresql":
+        tsquery = " & ".join(f"{t}:*" for t in consulta)
+        return (
+            f"FROM {TABLA} d, to_tsquery('simple', %s) q WHERE {VECTOR_SQL} @@ q{extra}",
+            [tsquery, *params],
+            f"ts_rank({VECTOR_SQL}, q)",
+        )
+    match = " ".join(f'"{t}"*' for t in consulta)
+    return (
+        f"FROM {TABLA_FTS} JOIN {TABLA} d ON d.id = {TABLA_FTS}.rowid WHERE {TABLA_FTS} MATCH %s{extra}",
+        [match, *params],
+        f"-bm25({TABLA_FTS}, 4.0, 1.0)",
+    )
+
+
+def _sin_indice(consulta, tipo, solo_publicados):
+    qs = DocumentoBusqueda.objects.all()
+    if tipo:
+        qs = qs.filter(tipo=tipo)
+    if solo_publicados:
+        qs = qs.filter(publicado=True)
+    for t in consulta:
+        qs = qs.filter(Q(titulo__icontains=t) | Q(cuerpo__icontains=t))
+    return qs
+
+
+def buscar(q, tipo=None, solo_publicados=False, limite=200):
+    """
+    Documentos que contienen todos los términos de `q` (cada uno como prefijo).
+    `limite=None` los devuelve todos.
+    """
+    consulta = terminos(q)
+    if not consulta:
+        return []
+
+    if connection.vendor not in ("postgresql", "sqlite"):
+        qs = _sin_indice(consulta, tipo, solo_publicados).values_list("tipo", "objeto_id")
+        return [(tipo_, pk, 0.0) for tipo_, pk in qs[:limite]]
+
+    desde, params, puntaje = _coincidencias(consulta, tipo, solo_publicados)
+    sql = f"SELECT d.tipo, d.objeto_id, {puntaje} AS puntaje {desde} ORDER BY puntaje DESC, d.id"
+    if limite is not None:
+        sql += " LIMIT %s"
+        params = [*params, limite]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def filtrar(queryset, q, tipo):
+    """
+    `queryset` reducido a los objetos de `tipo` que coinciden con `q` y
+    anotado con `relevancia` (mayor = mejor). Todo en una sola consulta: los
+    filtros de visibilidad del queryset se aplican antes de cualquier tope.
+    """
+    consulta = terminos(q)
+    if not consulta:
+        return queryset.none()
+
+    if connection.vendor not in ("postgresql", "sqlite"):
+        ids = list(_sin_indice(consulta, tipo, False).values_list("objeto_id", flat=True))
+        return queryset.filter(pk__in=ids).annotate(
+            relevancia=Case(
+                *[When(pk=pk, then=-posicion) for posicion, pk in enumerate(ids)],
+                output_field=IntegerField(),
+            )
+        )
+
+    desde, params, puntaje = _coincidencias(consulta, tipo, False)
+    externo = f"{queryset.model._meta.db_table}.{queryset.model._meta.pk.column}"
+    return queryset.filter(
+        pk__in=RawSQL(f"SELECT d.objeto_id {desde}", params)
+    ).annotate(
+        relevancia=RawSQL(f"SELECT {puntaje} {desde} AND d.objeto_id = {externo}", params, output_field=FloatField())
+    )
@@ -0,0 +1,199 @@
+"""
+busqueda/normalizar.py
+
+Normalización de texto para el índice de búsqueda:
+minúsculas → sin tildes → sin palabras vacías → raíz (stemming en español).
+
+Se aplica igual al documento indexado y a la consulta, así que "narración",
+"narraciones" y "NARRACION" terminan en el mismo término en SQLite y en
+PostgreSQL, sin depender de diccionarios del motor.
+
+El stemmer es el algoritmo Snowball para español, adaptado a texto ya sin
+tildes (http://snowball.tartarus.org/algorithms/spanish/stemmer.html).
+"""
+
+import re
+import unicodedata
+
+VOCALES = "aeiou"
+
+PALABRAS_VACIAS = frozenset("""
+a al algo algunas algunos ante antes como con contra cual cuando de del desde
+donde durante e el ella ellas ellos en entre era erais eran eras eres es esa
+esas ese eso esos esta estas este esto estos fue fueron ha han hasta hay la las
+le les lo los mas me mi mis mucho muy nada ni no nos nosotros o os otra otro
+para pero poco por porque que quien se sea ser si sin sobre su sus tambien te
+tiene tu tus un una uno unos y ya yo
+""".split())
+
+_PALABRA = re.compile(r"\w+", re.UNICODE)
+
+
+def sin_tildes(texto):
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def terminos(texto):
+    """Lista de términos normalizados del texto (en orden, con repetidos)."""
+    if not texto:
+        return []
+    palabras = _PALABRA.findall(sin_tildes(texto.lower()))
+    return [raiz(p) for p in palabras if p not in PALABRAS_VACIAS]
+
+
+def normalizar(*textos):
+    """Texto listo para indexar: términos separados por espacios."""
+    return " ".join(t for texto in textos for t in terminos(texto))
+
+
+# ── Stemmer Snowball (español) ─────────────────────────────────────────────
+
+def _region_despues_de_no_vocal(palabra, inicio=0):
+    for i in range(inicio + 1, len(palabra)):
+        if palabra[i] not in VOCALES and palabra[i - 1] in VOCALES:
+            return i + 1
+    return len(palabra)
+
+
+def _region_rv(palabra):
+    if len(palabra) < 2:
+        return len(palabra)
+    if palabra[1] not in VOCALES:
+        for i in range(2, len(palabra)):
+            if palabra[i] in VOCALES:
+                return i + 1
+        return len(palabra)
+    if palabra[0] in VOCALES and palabra[1] in VOCALES:
+        for i in range(2, len(palabra)):
+            if palabra[i] not in VOCALES:
+                return i + 1
+        return len(palabra)
+    return 3
+
+
+def _sufijo(palabra, sufijos):
+    """El sufijo más largo de la lista con el que termina la palabra."""
+    for s in sufijos:
+        if palabra.endswith(s):
+            return s
+    return None
+
+
+def _por_largo(*sufijos):
+    return sorted(sufijos, key=len, reverse=True)
+
+
+_PRONOMBRES = _por_largo("me", "se", "sela", "selo", "selas", "selos", "la", "le", "lo", "las", "les", "los", "nos")
+_ANTES_PRONOMBRE = _por_largo("iendo", "ando", "ar", "er", "ir", "yendo")
+
+_PASO1_BORRAR = _por_largo(
+    "anza", "anzas", "ico", "ica", "icos", "icas", "ismo", "ismos", "able", "ables",
+    "ible", "ibles", "ista", "istas", "oso", "osa", "osos", "osas",
+    "amiento", "amientos", "imiento", "imientos",
+)
+_PASO1_IC = _por_largo(
+    "adora", "ador", "acion", "adoras", "adores", "aciones", "ante", "antes", "ancia", "ancias",
+)
+_PASO1_REEMPLAZAR = {"logia": "log", "logias": "log", "ucion": "u", "uciones": "u", "encia": "ente", "encias": "ente"}
+
+_PASO2A = _por_largo("ya", "ye", "yan", "yen", "yeron", "yendo", "yo", "yas", "yes", "yais", "yamos")
+_PASO2B_GU = _por_largo("en", "es", "eis", "emos")
+_PASO2B = _por_largo(
+    "arian", "arias", "aran", "aras", "ariais", "aria", "areis", "ariamos", "aremos", "ara", "are",
+    "erian", "erias", "eran", "eras", "eriais", "eria", "ereis", "eriamos", "eremos", "era", "ere",
+    "irian", "irias", "iran", "iras", "iriais", "iria", "ireis", "iriamos", "iremos", "ira", "ire",
+    "aba", "ada", "ida", "ia", "iera", "ad", "ed", "id", "ase", "iese", "aste", "iste",
+    "an", "aban", "ian", "ieran", "asen", "iesen", "aron", "ieron", "ado", "ido", "ando", "iendo",
+    "io", "ar", "er", "ir", "as", "abas", "adas", "idas", "ias", "ieras", "ases", "ieses", "is",
+    "ais", "abais", "iais", "arais", "ierais", "aseis", "ieseis", "asteis", "isteis", "ados", "idos",
+    "amos", "abamos", "iamos", "imos", "aramos", "ieramos", "iesemos", "asemos",
+)
+_PASO3 = _por_largo("os", "a", "o", "i")
+
+
+def raiz(palabra):
+    if len(palabra) < 3:
+        return palabra
+    rv = _region_rv(palabra)
+    r1 = _region_despues_de_no_vocal(palabra)
+    r2 = _region_despues_de_no_vocal(palabra, r1) if r1 < len(palabra) else len(palabra)
+
+    def en(region, s):
+        return len(palabra) - len(s) >= region
+
+    # Paso 0: pronombres pegados al verbo
+    s = _sufijo(palabra, _PRONOMBRES)
+    if s and en(rv, s):
+        base = palabra[: -len(s)]
+        previo = _sufijo(base, _ANTES_PRONOMBRE)
+        if previo and (previo != "yendo" or base[: -len(previo)].endswith("u")):
+            palabra = base
+
+    # Paso 1: sufijos derivativos
+    original = palabra
+    s = _sufijo(palabra, _PASO1_BORRAR)
+    if s and en(r2, s):
+        palabra = palabra[: -len(s)]
+    else:
+        s = _sufijo(palabra, _PASO1_IC)
+        if s and en(r2, s):
+            palabra = palabra[: -len(s)]
+            if palabra.endswith("ic") and len(palabra) - 2 >= r2:
+                palabra = palabra[:-2]
+        else:
+            s = _sufijo(palabra, _por_largo(*_PASO1_REEMPLAZAR))
+            if s and en(r2, s):
+                palabra = palabra[: -len(s)] + _PASO1_REEMPLAZAR[s]
+            elif palabra.endswith("amente") and en(r1, "amente"):
+                palabra = palabra[:-6]
+                for previo in ("iv", "os", "ic", "ad"):
+                    if palabra.endswith(previo) and len(palabra) - 2 >= r2:
+                        palabra = palabra[:-2]
+                        if previo == "iv" and palabra.endswith("at") and len(palabra) - 2 >= r2:
+                            palabra = palabra[:-2]
+                        break
+            elif palabra.endswith("mente") and en(r2, "mente"):
+                palabra = palabra[:-5]
+                previo = _sufijo(palabra, ("ante", "able", "ible"))
+                if previo and len(palabra) - len(previo) >= r2:
+                    palabra = palabra[: -len(previo)]
+            else:
+                s = _sufijo(palabra, ("idades", "idad"))
+                if s and en(r2, s):
+                    palabra = palabra[: -len(s)]
+                    previo = _sufijo(palabra, ("abil", "ic", "iv"))
+                    if previo and len(palabra) - len(previo) >= r2:
+                        palabra = palabra[: -len(previo)]
+                else:
+                    s = _sufijo(palabra, ("ivas", "ivos", "iva", "ivo"))
+                    if s and en(r2, s):
+                        palabra = palabra[: -len(s)]
+                        if palabra.endswith("at") and len(palabra) - 2 >= r2:
+                            palabra = palabra[:-2]
+
+    # Paso 2: sufijos verbales (solo si el paso 1 no quitó nada)
+    if palabra == original:
+        s = _sufijo(palabra, _PASO2A)
+        if s and en(rv, s) and palabra[: -len(s)].endswith("u"):
+            palabra = palabra[: -len(s)]
+        else:
+            s = _sufijo(palabra, _PASO2B_GU)
+            largo = _sufijo(palabra, _PASO2B)
+            if largo and (not s or len(largo) > len(s)) and en(rv, largo):
+                palabra = palabra[: -len(largo)]
+            elif s and en(rv, s):
+                palabra = palabra[: -len(s)]
+                if palabra.endswith("gu"):
+                    palabra = palabra[:-1]
+
+    # Paso 3: vocal residual
+    s = _sufijo(palabra, _PASO3)
+    if s and len(palabra) - len(s) >= rv:
+        palabra = palabra[: -len(s)]
+    elif palabra.endswith("e") and len(palabra) - 1 >= rv:
+        palabra = palabra[:-1]
+        if palabra.endswith("gu") and len(palabra) - 1 >= rv:
+            palabra = palabra[:-1]
+
+    return palabra
@@ -0,0 +1,8 @@
+"""busqueda/urls.py"""
+
+from django.urls import path
+from .views import BuscarView
+
+urlpatterns = [
+    path("", BuscarView.as_view(), name="buscar"),
+]
@@ -0,0 +1,70 @@
+"""busqueda/views.py"""
+
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from entrevistas.models import Entrevista
+from entrevistas.serializers import EntrevistaResumenSerializer
+from eventos.models import Evento
+from eventos.serializers import EventoResumenSerializer
+from noticias.models import Noticia
+from noticias.serializers import NoticiaResumenSerializer
+
+from .models import DocumentoBusqueda
+from .motor import buscar
+
+Tipo = DocumentoBusqueda.Tipo
+
+
+def _resumenes():
+    """tipo → (queryset base, serializer de resumen)."""
+    return {
+        Tipo.EVENTO: (
+            Evento.objects.select_related("categoria").prefetch_related("fechas_adicionales"),
+            EventoResumenSerializer,
+        ),
+        Tipo.NOTICIA:    (Noticia.objects.select_related("autor"), NoticiaResumenSerializer),
+        Tipo.ENTREVISTA: (Entrevista.objects.all(), EntrevistaResumenSerializer),
+    }
+
+
+class BuscarView(APIView):
+    """
+    GET /api/buscar/?q=cuenteria  → eventos, noticias y entrevistas en una sola llamada,
+    ordenados por relevancia.
+
+    Opcionales: ?tipo=evento|noticia|entrevista  ?limite=30 (máx. 100)
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        q    = request.query_params.get("q", "").strip()
+        tipo = request.query_params.get("tipo") or None
+        try:
+            limite = max(1, min(int(request.query_params.get("limite", 30)), 100))
+        except ValueError:
+            limite = 30
+        if tipo and tipo not in Tipo.values:
+            return Response({"tipo": f"Debe ser uno de: {', '.join(Tipo.values)}."}, status=400)
+
+        es_cuentero = request.user.is_authenticated and request.user.es_cuentero
+        hallazgos   = buscar(q, tipo=tipo, solo_publicados=not es_cuentero, limite=limite)
+
+        # Una consulta por tipo presente, no una por resultado
+        por_tipo = {}
+        for tipo_, pk, _ in hallazgos:
+            por_tipo.setdefault(tipo_, []).append(pk)
+        objetos    = {}
+        resumenes  = _resumenes()
+        for tipo_, ids in por_tipo.items():
+            base, serializer_class = resumenes[tipo_]
+            datos = serializer_class(base.filter(pk__in=ids), many=True, context={"request": request}).data
+            objetos.update({(tipo_, d["id"]): d for d in datos})
+
+        resultados = [
+            {"tipo": tipo_, "puntaje": puntaje, "objeto": objetos[(tipo_, pk)]}
+            for tipo_, pk, puntaje in hallazgos
+            if (tipo_, pk) in objetos
+        ]
+        return Response({"q": q, "count": len(resultados), "results": resultados})
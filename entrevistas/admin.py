@@ -1,12 +1,20 @@
 from django.contrib import admin
-from .models import Entrevista
+from .models import Entrevista, OndaEntrevista
 
 
 @admin.register(Entrevista)
 class EntrevistaAdmin(admin.ModelAdmin):
-    list_display  = ["titulo", "entrevistado", "categoria", "publicada", "destacada", "fecha_publicacion"]
+    list_display  = ["titulo", "entrevistado", "categoria", "duracion", "publicada", "destacada", "fecha_publicacion"]
     list_filter   = ["categoria", "publicada", "destacada"]
     search_fields = ["titulo", "entrevistado", "resumen"]
     prepopulated_fields = {"slug": ("titulo",)}
-    readonly_fields     = ["creada_en", "actualizada"]
-    raw_id_fields       = ["creado_por"]
\ No newline at end of file
+    readonly_fields     = ["duracion_segundos", "creada_en", "actualizada"]
+    raw_id_fields       = ["creado_por"]
+
+
+@admin.register(OndaEntrevista)
+class OndaEntrevistaAdmin(admin.ModelAdmin):
+    list_display    = ["entrevista", "estado", "generada_en"]
+    list_filter     = ["estado"]
+    readonly_fields = ["entrevista", "huella", "estado", "error", "generada_en"]
+    exclude         = ["picos"]
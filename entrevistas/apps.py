@@ -3,3 +3,15 @@ from django.apps import AppConfig
 
 class EntrevistasConfig(AppConfig):
     name = 'entrevistas'
+
+    def ready(self):
+        from django.db.models.signals import post_save, pre_save
+        from . import checks  # noqa: F401  (registra entrevistas.E001)
+        from ruedo.cache import registrar_invalidacion
+        from .duracion import medir_duracion
+        from .models import Entrevista
+        from .onda import al_guardar
+
+        registrar_invalidacion(Entrevista, "entrevistas")
+        pre_save.connect(medir_duracion, sender=Entrevista, dispatch_uid="entrevistas-duracion")
+        post_save.connect(al_guardar, sender=Entrevista, dispatch_uid="entrevistas-onda")
@@ -0,0 +1,24 @@
+"""
+entrevistas/checks.py
+
+Sin ffmpeg, las ondas de MP3 y OGG terminan todas en ERROR (entrevistas/onda.py).
+Como error de `manage.py check`, también corta el `migrate` de build.sh en vez
+de descubrirse job por job.
+"""
+
+from django.core import checks
+
+
+@checks.register()
+def ffmpeg_disponible(app_configs, **kwargs):
+    from .onda import ruta_ffmpeg
+
+    if ruta_ffmpeg() is not None:
+        return []
+    return [
+        checks.Error(
+            "No se encontró ffmpeg: las formas de onda de MP3 y OGG no se pueden generar.",
+            hint="Instalar requirements.txt (imageio-ffmpeg) o apuntar ONDA_FFMPEG a un ffmpeg del PATH.",
+            id="entrevistas.E001",
+        )
+    ]
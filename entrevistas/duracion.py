@@ -0,0 +1,68 @@
+"""
+entrevistas/duracion.py
+
+`duracion_segundos` es la fuente de verdad; `duracion` ("MM:SS") se deriva
+de ella para no romper a los clientes que ya la muestran.
+
+Al guardar una entrevista:
+    audio nuevo o cambiado → se mide leyendo las cabeceras (archivos/audio.py)
+    sin audio, o no se pudo medir → se interpreta el "MM:SS" escrito a mano
+
+El cambio de nombre pendientes/… → URL definitiva (archivos/cola.py) es el
+mismo contenido y no se vuelve a medir.
+"""
+
+from archivos.audio import segundos
+from archivos.cola import es_pendiente
+
+CAMPOS = {"audio_archivo", "duracion", "duracion_segundos"}
+
+
+def formatear(total):
+    minutos, resto = divmod(total, 60)
+    return f"{minutos:02d}:{resto:02d}"
+
+
+def interpretar(texto):
+    """Segundos de "MM:SS" o "H:MM:SS"; None si el texto no tiene ese formato."""
+    partes = (texto or "").strip().split(":")
+    if not 2 <= len(partes) <= 3 or not all(p.isdigit() for p in partes):
+        return None
+    *mayores, ultimo = [int(p) for p in partes]
+    if ultimo >= 60 or (len(mayores) == 2 and mayores[1] >= 60):
+        return None
+    total = 0
+    for parte in mayores:
+        total = total * 60 + parte
+    return total * 60 + ultimo
+
+
+def _audio_nuevo(instance):
+    archivo = instance.audio_archivo
+    if not archivo._committed or instance.pk is None:
+        return True
+    anterior = type(instance).objects.filter(pk=instance.pk).values_list("audio_archivo", flat=True).first()
+    if anterior == archivo.name:
+        return False
+    return not (anterior and es_pendiente(anterior) and instance.duracion_segundos is not None)
+
+
+def medir_duracion(sender, instance, update_fields=None, **kwargs):
+    """pre_save de Entrevista."""
+    if update_fields is not None and not CAMPOS & set(update_fields):
+        return
+    archivo = instance.audio_archivo
+    antes   = (instance.duracion_segundos, instance.duracion)
+
+    if archivo and _audio_nuevo(instance):
+        instance.duracion_segundos = segundos(archivo)
+    if instance.duracion_segundos is None or not archivo:
+        instance.duracion_segundos = interpretar(instance.duracion)
+    if instance.duracion_segundos is not None:
+        instance.duracion = formatear(instance.duracion_segundos)
+
+    # save(update_fields=[...]) solo escribe esos campos: lo medido va aparte
+    if update_fields is not None and (instance.duracion_segundos, instance.duracion) != antes:
+        sender.objects.filter(pk=instance.pk).update(
+            duracion_segundos=instance.duracion_segundos, duracion=instance.duracion,
+        )
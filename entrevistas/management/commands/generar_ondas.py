@@ -0,0 +1,62 @@
+"""
+entrevistas/management/commands/generar_ondas.py
+
+Calcula la forma de onda de las entrevistas cuyo audio todavía no la tiene
+(o cambió desde la última vez). Corre en el proceso actual, no en el pool.
+
+    python manage.py generar_ondas
+    python manage.py generar_ondas --todo          # también las que ya están
+    python manage.py generar_ondas --atascadas 30  # y las PENDIENTE de hace más de 30 min
+
+Un trabajo del pool que muere a mitad deja la onda en PENDIENTE con la
+huella vigente, y sin --atascadas no se vuelve a intentar.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from entrevistas.models import Entrevista, OndaEntrevista
+from entrevistas.onda import generar, preparar
+
+
+class Command(BaseCommand):
+    help = "Genera los picos de forma de onda de los audios de entrevistas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todo", action="store_true", help="Regenerar también las que ya tienen onda vigente.")
+        parser.add_argument("--errores", action="store_true", help="Reintentar las que terminaron en error.")
+        parser.add_argument(
+            "--atascadas", type=int, metavar="MINUTOS",
+            help="Reintentar también las que llevan más de MINUTOS en PENDIENTE.",
+        )
+
+    def handle(self, *args, **opts):
+        atascadas = set()
+        if opts["atascadas"] is not None:
+            limite = timezone.now() - timedelta(minutes=opts["atascadas"])
+            atascadas = set(
+                OndaEntrevista.objects
+                .filter(estado=OndaEntrevista.Estado.PENDIENTE, generada_en__lt=limite)
+                .values_list("entrevista_id", flat=True)
+            )
+
+        qs = Entrevista.objects.exclude(audio_archivo="").exclude(audio_archivo__isnull=True).only("pk", "audio_archivo")
+        if opts["errores"]:
+            qs = qs.filter(Q(onda__estado=OndaEntrevista.Estado.ERROR) | Q(pk__in=atascadas))
+
+        generadas = fallidas = 0
+        for entrevista in qs.iterator():
+            forzar = opts["todo"] or opts["errores"] or entrevista.pk in atascadas
+            huella = preparar(entrevista, forzar=forzar)
+            if not huella:
+                continue
+            if generar(entrevista.pk, huella) is None:
+                fallidas += 1
+                self.stderr.write(f"  sin onda: {entrevista.audio_archivo.name}")
+            else:
+                generadas += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{generadas} ondas generadas, {fallidas} con error."))
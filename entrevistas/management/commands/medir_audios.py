@@ -0,0 +1,72 @@
+"""
+entrevistas/management/commands/medir_audios.py
+
+Mide la duración de los audios ya subidos leyendo solo sus cabeceras (los
+primeros KB; en OGG también los últimos) y guarda `duracion_segundos` y
+`duracion`. Por defecto solo las entrevistas que todavía no la tienen.
+
+Las lecturas (peticiones Range a Cloudinary) corren en paralelo; la base
+de datos se escribe al final con un solo bulk_update por lote.
+
+    python manage.py medir_audios
+    python manage.py medir_audios --todo --hilos 8
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from archivos.audio import segundos
+from entrevistas.duracion import formatear
+from entrevistas.models import Entrevista
+from ruedo.cache import invalidar_grupos
+
+
+class Command(BaseCommand):
+    help = "Calcula la duración de los audios de entrevistas a partir de sus cabeceras."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todo", action="store_true", help="Volver a medir también las que ya tienen duración.")
+        parser.add_argument("--hilos", type=int, default=4, help="Archivos leídos en paralelo.")
+        parser.add_argument("--lote", type=int, default=200, help="Filas por bulk_update.")
+
+    def handle(self, *args, **opts):
+        qs = Entrevista.objects.exclude(audio_archivo="").exclude(audio_archivo__isnull=True)
+        if not opts["todo"]:
+            qs = qs.filter(duracion_segundos__isnull=True)
+        entrevistas = list(qs.only("pk", "audio_archivo", "duracion", "duracion_segundos"))
+        if not entrevistas:
+            self.stdout.write(self.style.SUCCESS("No hay audios por medir."))
+            return
+        self.stdout.write(f"{len(entrevistas)} audios por medir.")
+
+        with ThreadPoolExecutor(max_workers=opts["hilos"]) as pool:
+            medidas = list(pool.map(lambda e: segundos(e.audio_archivo), entrevistas))
+
+        ahora     = timezone.now()
+        cambiadas = []
+        fallidas  = 0
+        for entrevista, total in zip(entrevistas, medidas):
+            if total is None:
+                fallidas += 1
+                self.stderr.write(f"  sin duración: {entrevista.audio_archivo.name}")
+                continue
+            if total == entrevista.duracion_segundos and formatear(total) == entrevista.duracion:
+                continue
+            entrevista.duracion_segundos = total
+            entrevista.duracion          = formatear(total)
+            entrevista.actualizada       = ahora
+            cambiadas.append(entrevista)
+
+        # bulk_update no dispara señales: la caché se invalida a mano
+        Entrevista.objects.bulk_update(
+            cambiadas, ["duracion_segundos", "duracion", "actualizada"], batch_size=opts["lote"],
+        )
+        if cambiadas:
+            invalidar_grupos("entrevistas")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(cambiadas)} actualizadas, {len(entrevistas) - len(cambiadas) - fallidas} sin cambios, "
+            f"{fallidas} sin poder leer."
+        ))
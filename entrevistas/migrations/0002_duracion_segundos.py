@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:36
+
+from django.db import migrations, models
+
+from entrevistas.duracion import interpretar
+
+
+def desde_texto(apps, schema_editor):
+    """Punto de partida: el "MM:SS" escrito a mano. medir_audios lo corrige con el archivo."""
+    Entrevista = apps.get_model("entrevistas", "Entrevista")
+    cambiadas = []
+    for entrevista in Entrevista.objects.exclude(duracion="").only("pk", "duracion"):
+        entrevista.duracion_segundos = interpretar(entrevista.duracion)
+        if entrevista.duracion_segundos is not None:
+            cambiadas.append(entrevista)
+    Entrevista.objects.bulk_update(cambiadas, ["duracion_segundos"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entrevistas', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entrevista',
+            name='duracion_segundos',
+            field=models.PositiveIntegerField(blank=True, db_index=True, help_text='Se mide del archivo de audio al subirlo (ver entrevistas/duracion.py)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='entrevista',
+            name='duracion',
+            field=models.CharField(blank=True, help_text='Duración en formato MM:SS. Ej: "38:24". Si hay archivo se calcula sola.', max_length=10),
+        ),
+        migrations.RunPython(desde_texto, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entrevistas', '0002_duracion_segundos'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OndaEntrevista',
+            fields=[
+                ('entrevista', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='onda', serialize=False, to='entrevistas.entrevista')),
+                ('huella', models.CharField(max_length=500)),
+                ('picos', models.BinaryField(blank=True, default=b'')),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('LISTA', 'Lista'), ('ERROR', 'Error')], default='PENDIENTE', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('generada_en', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Forma de onda',
+                'verbose_name_plural': 'Formas de onda',
+            },
+        ),
+    ]
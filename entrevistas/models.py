@@ -51,7 +51,11 @@ class Entrevista(models.Model):
     duracion = models.CharField(
         max_length=10,
         blank=True,
-        help_text='Duración en formato MM:SS. Ej: "38:24"',
+        help_text='Duración en formato MM:SS. Ej: "38:24". Si hay archivo se calcula sola.',
+    )
+    duracion_segundos = models.PositiveIntegerField(
+        null=True, blank=True, db_index=True,
+        help_text="Se mide del archivo de audio al subirlo (ver entrevistas/duracion.py)",
     )
 
     # ── Clasificación ──
@@ -93,4 +97,31 @@ class Entrevista(models.Model):
     def audio_final(self):
         if self.audio_archivo:
             return self.audio_archivo.url
-        return self.audio_url or None
\ No newline at end of file
+        return self.audio_url or None
+
+class OndaEntrevista(models.Model):
+    """
+    Picos precalculados del audio para dibujar la forma de onda sin
+    descargarlo. `picos` es un arreglo de uint8 (0–255), uno por columna.
+    `huella` identifica el audio del que salió (sha256 del índice de media
+    o, si no está indexado, su nombre): solo se recalcula si cambia.
+    """
+
+    class Estado(models.TextChoices):
+        PENDIENTE = "PENDIENTE", "Pendiente"
+        LISTA     = "LISTA",     "Lista"
+        ERROR     = "ERROR",     "Error"
+
+    entrevista  = models.OneToOneField(Entrevista, on_delete=models.CASCADE, primary_key=True, related_name="onda")
+    huella      = models.CharField(max_length=500)
+    picos       = models.BinaryField(blank=True, default=b"")
+    estado      = models.CharField(max_length=10, choices=Estado.choices, default=Estado.PENDIENTE)
+    error       = models.TextField(blank=True)
+    generada_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = "Forma de onda"
+        verbose_name_plural = "Formas de onda"
+
+    def __str__(self):
+        return f"Onda de {self.entrevista_id} ({self.estado})"
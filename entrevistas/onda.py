@@ -0,0 +1,206 @@
+"""
+entrevistas/onda.py
+
+Forma de onda precalculada para el reproductor de entrevistas.
+
+Al guardar una entrevista con audio se compara la huella del archivo
+(sha256 del índice de media, o su nombre) con la de su OndaEntrevista; si
+cambió, generar() corre en el pool de archivos/cola.py. generar() decodifica
+el audio por bloques y guarda ONDA_PICOS picos en uint8:
+
+    WAV       → módulo wave, sin dependencias externas
+    MP3 / OGG → ffmpeg a PCM s16le mono de 8 kHz por stdout: el de
+                ONDA_FFMPEG si está en el PATH o, si no, el binario estático
+                que instala imageio-ffmpeg (requirements.txt). Si no hay
+                ninguno, el check entrevistas.E001 lo avisa al arrancar.
+
+Los picos se toman por ventanas fijas de VENTANA muestras con NumPy y al
+final se reducen a ONDA_PICOS columnas, normalizadas al pico más alto.
+"""
+
+import hashlib
+import logging
+import shutil
+import subprocess
+import wave
+from contextlib import closing
+
+import numpy as np
+import requests
+from django.conf import settings
+from django.utils import timezone
+
+from archivos.audio import ruta_local
+from archivos.cola import es_pendiente, programar
+from archivos.models import ArchivoMedia
+from ruedo.cache import invalidar_grupos
+from ruedo.storage import ext_de
+from .models import Entrevista, OndaEntrevista
+
+logger = logging.getLogger(__name__)
+
+VENTANA    = 256           # muestras por pico intermedio
+BLOQUE     = 64 * 1024     # muestras por lectura
+FRECUENCIA = 8000          # frecuencia a la que ffmpeg entrega el PCM
+
+
+class ErrorOnda(Exception):
+    pass
+
+
+def version(huella):
+    """Identificador corto de la onda para la URL (?v=) y el ETag."""
+    return hashlib.sha1(huella.encode()).hexdigest()[:16]
+
+
+def huella_de(archivo):
+    sha = ArchivoMedia.objects.filter(nombre=archivo.name).values_list("sha256", flat=True).first()
+    return sha or archivo.name
+
+
+# ── Programación ──
+
+def preparar(entrevista, forzar=False):
+    """
+    Deja la OndaEntrevista en PENDIENTE si el audio cambió (o si `forzar`)
+    y devuelve la huella a generar; None si no hay nada que hacer.
+    """
+    archivo = entrevista.audio_archivo
+    if not archivo:
+        OndaEntrevista.objects.filter(entrevista=entrevista).delete()
+        return None
+    if es_pendiente(archivo.name):
+        # Se genera cuando llegue la URL definitiva (mismo contenido)
+        return None
+    huella = huella_de(archivo)
+    if not forzar and OndaEntrevista.objects.filter(entrevista=entrevista, huella=huella).exists():
+        return None
+    OndaEntrevista.objects.update_or_create(
+        entrevista=entrevista,
+        defaults={"huella": huella, "estado": OndaEntrevista.Estado.PENDIENTE, "picos": b"", "error": ""},
+    )
+    return huella
+
+
+def al_guardar(sender, instance, update_fields=None, **kwargs):
+    """post_save de Entrevista."""
+    if update_fields is not None and "audio_archivo" not in update_fields:
+        return
+    huella = preparar(instance)
+    if huella:
+        programar(generar, instance.pk, huella)
+
+
+def generar(pk, huella):
+    """
+    Calcula y guarda los picos. Si mientras tanto el audio volvió a cambiar
+    (otra huella), no escribe nada: ya hay otro trabajo programado.
+    """
+    onda = OndaEntrevista.objects.select_related("entrevista").filter(pk=pk, huella=huella).first()
+    if onda is None:
+        return None
+    vigente = OndaEntrevista.objects.filter(pk=pk, huella=huella)
+    try:
+        picos = calcular(onda.entrevista.audio_archivo)
+    except (ErrorOnda, OSError, EOFError, wave.Error, requests.RequestException) as exc:
+        logger.warning("Onda de la entrevista %s: %s", pk, exc)
+        vigente.update(estado=OndaEntrevista.Estado.ERROR, error=f"{type(exc).__name__}: {exc}")
+        return None
+
+    if vigente.update(estado=OndaEntrevista.Estado.LISTA, picos=picos, error="", generada_en=timezone.now()):
+        # El detalle expone la URL de la onda: cambian su ETag y su caché
+        Entrevista.objects.filter(pk=pk).update(actualizada=timezone.now())
+        invalidar_grupos("entrevistas")
+    return picos
+
+
+# ── Decodificación ──
+
+def calcular(archivo, columnas=None):
+    """Picos de un FieldFile de audio como bytes (uint8, `columnas` valores)."""
+    columnas = columnas or settings.ONDA_PICOS
+    bloques  = _bloques_wav(archivo) if ext_de(archivo.name) == "wav" else _bloques_ffmpeg(archivo)
+
+    maximos, resto = [], np.empty(0, dtype=np.float32)
+    for muestras in bloques:
+        muestras  = np.concatenate([resto, muestras])
+        completas = len(muestras) // VENTANA * VENTANA
+        if completas:
+            maximos.append(muestras[:completas].reshape(-1, VENTANA).max(axis=1))
+        resto = muestras[completas:]
+    if len(resto):
+        maximos.append(resto.max(keepdims=True))
+    if not maximos:
+        raise ErrorOnda("El audio no tiene muestras.")
+
+    maximos = np.concatenate(maximos)
+    inicios = np.linspace(0, len(maximos), columnas, endpoint=False).astype(np.intp)
+    picos   = np.maximum.reduceat(maximos, inicios)
+    tope    = picos.max()
+    if tope > 0:
+        picos = picos / tope
+    return (picos * 255).round().astype(np.uint8).tobytes()
+
+
+def _a_flotantes(crudo, ancho, canales):
+    """PCM entero intercalado → amplitud absoluta (0–1) por cuadro."""
+    if ancho == 1:
+        muestras = np.frombuffer(crudo, dtype=np.uint8).astype(np.float32) - 128
+    elif ancho == 3:
+        b = np.frombuffer(crudo, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        muestras = (b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)).astype(np.float32)
+        muestras[muestras >= 2 ** 23] -= 2 ** 24
+    else:
+        muestras = np.frombuffer(crudo, dtype=f"<i{ancho}").astype(np.float32)
+    escala = 2 ** (8 * ancho - 1)
+    return np.abs(muestras).reshape(-1, canales).max(axis=1) / escala
+
+
+def _bloques_wav(archivo):
+    ruta = ruta_local(archivo)
+    if ruta:
+        fuente = open(ruta, "rb")
+    else:
+        respuesta = requests.get(archivo.url, stream=True, timeout=30)
+        respuesta.raise_for_status()
+        fuente = respuesta.raw
+    with closing(fuente), wave.open(fuente) as audio:
+        ancho, canales = audio.getsampwidth(), audio.getnchannels()
+        while crudo := audio.readframes(BLOQUE):
+            yield _a_flotantes(crudo, ancho, canales)
+
+
+def ruta_ffmpeg():
+    """Ejecutable de ffmpeg a usar, o None si no hay ninguno."""
+    ruta = shutil.which(settings.ONDA_FFMPEG)
+    if ruta:
+        return ruta
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+def _bloques_ffmpeg(archivo):
+    ffmpeg = ruta_ffmpeg()
+    if ffmpeg is None:
+        raise ErrorOnda("ffmpeg no está instalado: solo se pueden procesar archivos WAV.")
+    entrada = ruta_local(archivo) or archivo.url
+    proceso = subprocess.Popen(
+        [ffmpeg, "-v", "error", "-nostdin", "-i", entrada,
+         "-f", "s16le", "-ac", "1", "-ar", str(FRECUENCIA), "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    try:
+        while crudo := proceso.stdout.read(BLOQUE * 2):
+            yield _a_flotantes(crudo[:len(crudo) // 2 * 2], 2, 1)
+        mensaje = proceso.stderr.read().decode(errors="replace").strip()
+        if proceso.wait() != 0:
+            raise ErrorOnda(mensaje[-500:] or "ffmpeg no pudo decodificar el audio.")
+    finally:
+        if proceso.poll() is None:
+            proceso.kill()
+            proceso.wait()
+        proceso.stdout.close()
+        proceso.stderr.close()
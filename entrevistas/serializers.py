@@ -1,26 +1,35 @@
 """entrevistas/serializers.py"""
 
+from django.urls import reverse
 from rest_framework import serializers
+from archivos.serializers import MetadatosField, SrcsetField, SubidasPendientesField
 from usuarios.serializers import UsuarioPublicoSerializer
-from .models import Entrevista
+from .models import Entrevista, OndaEntrevista
+from .onda import version
 
 
 class EntrevistaResumenSerializer(serializers.ModelSerializer):
-    imagen_final = serializers.CharField(read_only=True)
+    imagen_final  = serializers.CharField(read_only=True)
+    imagen_srcset = SrcsetField(source="imagen")
+    audio_meta    = MetadatosField(source="audio_archivo")
 
     class Meta:
         model  = Entrevista
         fields = [
             "id", "slug", "titulo", "entrevistado", "rol",
             "resumen", "categoria", "categoria_color",
-            "imagen_final", "duracion", "fecha_publicacion",
+            "imagen_final", "imagen_srcset", "duracion", "duracion_segundos", "audio_meta", "fecha_publicacion",
         ]
 
 
 class EntrevistaSerializer(serializers.ModelSerializer):
-    creado_por   = UsuarioPublicoSerializer(read_only=True)
-    imagen_final = serializers.CharField(read_only=True)
-    audio_final  = serializers.CharField(read_only=True)
+    creado_por    = UsuarioPublicoSerializer(read_only=True)
+    imagen_final  = serializers.CharField(read_only=True)
+    imagen_srcset = SrcsetField(source="imagen")
+    audio_final   = serializers.CharField(read_only=True)
+    audio_meta    = MetadatosField(source="audio_archivo")
+    subidas_pendientes = SubidasPendientesField()
+    waveform      = serializers.SerializerMethodField()
 
     class Meta:
         model  = Entrevista
@@ -28,10 +37,22 @@ class EntrevistaSerializer(serializers.ModelSerializer):
             "id", "slug", "titulo", "entrevistado", "rol",
             "resumen", "descripcion_larga",
             "categoria", "categoria_color",
-            "imagen", "imagen_url", "imagen_final",
-            "audio_archivo", "audio_url", "audio_final", "duracion",
+            "imagen", "imagen_url", "imagen_final", "imagen_srcset",
+            "audio_archivo", "audio_url", "audio_final", "audio_meta", "duracion", "duracion_segundos", "waveform",
+            "subidas_pendientes",
             "publicada", "destacada",
             "creado_por", "fecha_publicacion",
             "creada_en", "actualizada",
         ]
-        read_only_fields = ["id", "creada_en", "actualizada"]
\ No newline at end of file
+        read_only_fields = ["id", "duracion_segundos", "creada_en", "actualizada"]
+
+    def get_waveform(self, obj):
+        """URL versionada de los picos, o None si todavía no están."""
+        try:
+            onda = obj.onda
+        except OndaEntrevista.DoesNotExist:
+            return None
+        if onda.estado != OndaEntrevista.Estado.LISTA:
+            return None
+        url = reverse("entrevista-waveform", kwargs={"slug": obj.slug})
+        return f"{url}?v={version(onda.huella)}"
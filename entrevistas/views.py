@@ -1,30 +1,50 @@
 """entrevistas/views.py"""
 
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from rest_framework import viewsets, filters, permissions
-from .models import Entrevista
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .models import Entrevista, OndaEntrevista
+from .onda import version
 from .serializers import EntrevistaSerializer, EntrevistaResumenSerializer
 from usuarios.permissions import EsCuenteroOAdmin, EsPropietarioOCuentero
+from ruedo.cache import CacheRespuestaMixin
+from ruedo.condicional import CondicionalMixin
+from busqueda.filters import BusquedaFilter
+from busqueda.models import DocumentoBusqueda
 
 
-class EntrevistaViewSet(viewsets.ModelViewSet):
+class EntrevistaViewSet(CondicionalMixin, CacheRespuestaMixin, viewsets.ModelViewSet):
     """
     GET    /api/entrevistas/         → listar publicadas (público)
     POST   /api/entrevistas/         → crear (Cuentero/Admin)
     GET    /api/entrevistas/<slug>/  → detalle (público)
     PUT    /api/entrevistas/<slug>/  → editar (creador o Admin)
     DELETE /api/entrevistas/<slug>/  → eliminar (creador o Admin)
+    GET    /api/entrevistas/<slug>/waveform/ → picos de la forma de onda (público)
 
     Filtros: ?categoria=MAESTROS  ?destacada=true
-    Búsqueda: ?search=vargas
+             ?duracion_min=600  ?duracion_max=1800  (segundos)
+    Búsqueda: ?search=vargas  (texto completo, por relevancia)
+    Paginación por cursor: ?cursor=  (opcional ?total=true)
     """
-    lookup_field    = "slug"
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields   = ["titulo", "entrevistado", "resumen"]
-    ordering_fields = ["fecha_publicacion", "creada_en"]
-    ordering        = ["-fecha_publicacion"]
+    lookup_field      = "slug"
+    cache_grupo       = "entrevistas"
+    condicional_campo = "actualizada"
+    filter_backends   = [filters.OrderingFilter, BusquedaFilter]
+    busqueda_tipo     = DocumentoBusqueda.Tipo.ENTREVISTA
+    ordering_fields   = ["fecha_publicacion", "creada_en", "duracion_segundos"]
+    ordering          = ["-fecha_publicacion"]
+    cursor_ordering   = "-fecha_publicacion"
+
+    UN_ANO = 365 * 24 * 60 * 60
 
     def get_queryset(self):
         qs = Entrevista.objects.select_related("creado_por")
+        if self.action == "retrieve":
+            qs = qs.select_related("onda").defer("onda__picos")
         if not self.request.user.is_authenticated or not self.request.user.es_cuentero:
             qs = qs.filter(publicada=True)
         categoria = self.request.query_params.get("categoria")
@@ -33,6 +53,12 @@ class EntrevistaViewSet(viewsets.ModelViewSet):
             qs = qs.filter(categoria=categoria)
         if destacada:
             qs = qs.filter(destacada=destacada.lower() == "true")
+        for param, lookup in (("duracion_min", "gte"), ("duracion_max", "lte")):
+            try:
+                valor = int(self.request.query_params[param])
+            except (KeyError, ValueError):
+                continue
+            qs = qs.filter(**{f"duracion_segundos__{lookup}": valor})
         return qs
 
     def get_serializer_class(self):
@@ -41,11 +67,40 @@ class EntrevistaViewSet(viewsets.ModelViewSet):
         return EntrevistaSerializer
 
     def get_permissions(self):
-        if self.action in ["list", "retrieve"]:
+        if self.action in ["list", "retrieve", "waveform"]:
             return [permissions.AllowAny()]
         if self.action == "create":
             return [EsCuenteroOAdmin()]
         return [permissions.IsAuthenticated(), EsPropietarioOCuentero()]
 
     def perform_create(self, serializer):
-        serializer.save(creado_por=self.request.user)
\ No newline at end of file
+        serializer.save(creado_por=self.request.user)
+
+    @action(detail=True, methods=["get"])
+    def waveform(self, request, slug=None):
+        """
+        Picos precalculados (entrevistas/onda.py) como application/octet-stream:
+        un uint8 por columna. Con ?v= igual a la versión vigente (la URL que
+        trae el detalle en `waveform`) la respuesta se cachea un año.
+        """
+        entrevista = self.get_object()
+        onda = (
+            OndaEntrevista.objects
+            .filter(entrevista=entrevista, estado=OndaEntrevista.Estado.LISTA)
+            .values("huella", "picos")
+            .first()
+        )
+        if onda is None:
+            return Response({"detail": "La forma de onda todavía no está disponible."}, status=404)
+
+        vigente = version(onda["huella"])
+        etag    = quote_etag(vigente)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(bytes(onda["picos"]), content_type="application/octet-stream")
+        response["ETag"] = etag
+        if request.query_params.get("v") == vigente:
+            patch_cache_control(response, public=True, max_age=self.UN_ANO, immutable=True)
+        else:
+            patch_cache_control(response, public=True, max_age=300)
+        return response
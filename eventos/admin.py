@@ -10,9 +10,10 @@ class FechaEventoInline(admin.TabularInline):
 
 @admin.register(Evento)
 class EventoAdmin(admin.ModelAdmin):
-    list_display  = ["titulo", "fecha", "lugar", "recurrencia", "destacado", "abierto"]
+    list_display  = ["titulo", "fecha", "lugar", "recurrencia", "destacado", "abierto", "popularidad"]
     list_filter   = ["recurrencia", "destacado", "abierto", "gratuito", "categoria"]
     search_fields = ["titulo", "lugar"]
+    readonly_fields = ["guardados_count", "asistidos_count"]
     inlines       = [FechaEventoInline]
 
 
@@ -0,0 +1,128 @@
+"""
+eventos/agenda.py
+
+Mantiene la tabla OcurrenciaEvento a partir de Evento.fecha, Evento.recurrencia
+y las FechaEvento de cada evento.
+
+La recurrencia se expande dentro de una ventana móvil de
+±AGENDA_HORIZONTE_DIAS alrededor de hoy. La ventana solo avanza cuando se
+regenera: `manage.py regenerar_agenda` corre a diario como Cron Job de
+Render (render.yaml) y build.sh lo corre con --todo en cada despliegue.
+Quien lee una fecha futura concreta sin poder esperar al cron (los
+recordatorios) llama antes a extender_ventana(hasta).
+"""
+
+import calendar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from ruedo.cache import invalidar_grupos
+from .models import Evento, OcurrenciaEvento
+
+
+def _sumar_meses(fecha, meses):
+    mes  = fecha.month - 1 + meses
+    anio = fecha.year + mes // 12
+    mes  = mes % 12 + 1
+    dia  = min(fecha.day, calendar.monthrange(anio, mes)[1])
+    return fecha.replace(year=anio, month=mes, day=dia)
+
+
+def expandir_fechas(evento):
+    """Fecha principal + repeticiones de la recurrencia dentro de la ventana."""
+    ahora     = timezone.now()
+    horizonte = timedelta(days=settings.AGENDA_HORIZONTE_DIAS)
+    desde, hasta = ahora - horizonte, ahora + horizonte
+
+    fechas = {evento.fecha: OcurrenciaEvento.Origen.PRINCIPAL}
+    if evento.recurrencia not in ("semanal", "mensual"):
+        return fechas
+
+    # Aritmética en hora local para conservar la hora de pared
+    inicio = timezone.localtime(evento.fecha)
+    n = 1
+    while True:
+        if evento.recurrencia == "semanal":
+            fecha = inicio + timedelta(weeks=n)
+        else:
+            fecha = _sumar_meses(inicio, n)
+        if fecha > hasta:
+            break
+        if fecha >= desde:
+            fechas[fecha] = OcurrenciaEvento.Origen.RECURRENCIA
+        n += 1
+    return fechas
+
+
+def regenerar_ocurrencias(evento):
+    """
+    Sincroniza las ocurrencias principal/recurrencia del evento.
+    Solo inserta las que faltan y borra las que sobran: si nada cambió
+    cuesta un SELECT.
+    """
+    deseadas = expandir_fechas(evento)
+    actuales = dict(
+        evento.ocurrencias
+        .exclude(origen=OcurrenciaEvento.Origen.ADICIONAL)
+        .values_list("fecha", "id")
+    )
+
+    sobran = [pk for fecha, pk in actuales.items() if fecha not in deseadas]
+    if sobran:
+        OcurrenciaEvento.objects.filter(pk__in=sobran).delete()
+
+    faltan = [
+        OcurrenciaEvento(evento=evento, fecha=fecha, origen=origen)
+        for fecha, origen in deseadas.items() if fecha not in actuales
+    ]
+    if faltan:
+        OcurrenciaEvento.objects.bulk_create(faltan)
+
+
+def extender_ventana(hasta):
+    """
+    Regenera los eventos recurrentes cuya última repetición materializada
+    queda antes de `hasta` (la ventana no se corrió a tiempo). Con la
+    ventana al día es una sola consulta que no devuelve nada.
+    """
+    atrasados = (
+        Evento.objects
+        .filter(recurrencia__in=["semanal", "mensual"])
+        .annotate(ultima=Max("ocurrencias__fecha", filter=~Q(ocurrencias__origen=OcurrenciaEvento.Origen.ADICIONAL)))
+        .filter(Q(ultima__lt=hasta) | Q(ultima__isnull=True))
+        .only("id", "fecha", "recurrencia")
+    )
+    n = 0
+    for evento in atrasados:
+        regenerar_ocurrencias(evento)
+        n += 1
+    if n:
+        invalidar_grupos("eventos")
+    return n
+
+
+def sincronizar_fecha_adicional(fecha_evento):
+    """Crea o mueve la ocurrencia de una FechaEvento (el borrado va por CASCADE)."""
+    OcurrenciaEvento.objects.update_or_create(
+        fecha_adicional=fecha_evento,
+        defaults={
+            "evento_id": fecha_evento.evento_id,
+            "fecha":     fecha_evento.fecha,
+            "origen":    OcurrenciaEvento.Origen.ADICIONAL,
+        },
+    )
+
+
+# ── Receptores (conectados en EventosConfig.ready) ──
+
+def al_guardar_evento(sender, instance, raw=False, **kwargs):
+    if not raw:
+        regenerar_ocurrencias(instance)
+
+
+def al_guardar_fecha(sender, instance, raw=False, **kwargs):
+    if not raw:
+        sincronizar_fecha_adicional(instance)
@@ -3,3 +3,29 @@ from django.apps import AppConfig
 
 class EventosConfig(AppConfig):
     name = 'eventos'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from ruedo.cache import registrar_invalidacion
+        from ruedo.condicional import registrar_toque
+        from .models import Evento, FechaEvento, Categoria
+
+        registrar_invalidacion(Evento,      "eventos")
+        registrar_invalidacion(FechaEvento, "eventos")
+        registrar_invalidacion(Categoria,   "eventos", "categorias")
+
+        # Los hijos anidados cambian el ETag / Last-Modified del evento
+        registrar_toque(FechaEvento, lambda f: Evento.objects.filter(pk=f.evento_id), "actualizado")
+        registrar_toque(Categoria,   lambda c: Evento.objects.filter(categoria=c),   "actualizado")
+
+        # Índice materializado de ocurrencias para /api/eventos/agenda/
+        from .agenda import al_guardar_evento, al_guardar_fecha
+        post_save.connect(al_guardar_evento, sender=Evento,      dispatch_uid="eventos-agenda-evento")
+        post_save.connect(al_guardar_fecha,  sender=FechaEvento, dispatch_uid="eventos-agenda-fecha")
+
+        # Feed personalizado /api/eventos/para-mi/
+        from usuarios.models import EventoGuardado, Usuario
+        from .para_mi import al_cambiar_guardado, al_guardar_usuario
+        post_save.connect(al_guardar_usuario,    sender=Usuario,        dispatch_uid="eventos-para-mi-usuario")
+        post_save.connect(al_cambiar_guardado,   sender=EventoGuardado, dispatch_uid="eventos-para-mi-guardado")
+        post_delete.connect(al_cambiar_guardado, sender=EventoGuardado, dispatch_uid="eventos-para-mi-guardado")
@@ -0,0 +1,73 @@
+"""
+eventos/fechas.py
+
+Escritura en lote de las fechas adicionales de un evento.
+
+aplicar_fechas() compara el conjunto enviado con el guardado y solo toca
+lo que cambió: un bulk_create para las nuevas, un bulk_update para las
+modificadas y un DELETE para las que ya no vienen. Las filas se emparejan
+por `id` y, si no traen id, por `fecha`. Debe llamarse dentro de
+transaction.atomic().
+
+bulk_create/bulk_update no disparan señales, así que aquí mismo se
+sincronizan las ocurrencias de la agenda, se invalida la caché y se toca
+`Evento.actualizado` (una sola vez, no una por fecha).
+"""
+
+from django.utils import timezone
+
+from ruedo.cache import invalidar_grupos
+from ruedo.condicional import sin_toques
+from .models import Evento, FechaEvento, OcurrenciaEvento
+
+
+def aplicar_fechas(evento, fechas, borrar_faltantes=True):
+    """
+    `fechas` es la lista validada por FechaEventoLoteSerializer
+    (dicts con fecha, nota y opcionalmente id).
+    Devuelve (creadas, actualizadas, borradas).
+    """
+    guardadas = {f.pk: f for f in FechaEvento.objects.filter(evento=evento)}
+    por_fecha = {f.fecha: f for f in guardadas.values()}
+    vistas    = set()
+    nuevas, cambiadas = [], []
+
+    for datos in fechas:
+        actual = guardadas.get(datos.get("id")) or por_fecha.get(datos["fecha"])
+        if actual is None or actual.pk in vistas:
+            nuevas.append(FechaEvento(evento=evento, fecha=datos["fecha"], nota=datos.get("nota", "")))
+            continue
+        vistas.add(actual.pk)
+        nota = datos.get("nota", actual.nota)
+        if actual.fecha != datos["fecha"] or actual.nota != nota:
+            actual.fecha, actual.nota = datos["fecha"], nota
+            cambiadas.append(actual)
+
+    sobrantes = [pk for pk in guardadas if pk not in vistas] if borrar_faltantes else []
+
+    if sobrantes:
+        # Las ocurrencias de la agenda caen por CASCADE
+        with sin_toques():
+            FechaEvento.objects.filter(pk__in=sobrantes).delete()
+    if nuevas:
+        FechaEvento.objects.bulk_create(nuevas)
+        OcurrenciaEvento.objects.bulk_create([
+            OcurrenciaEvento(
+                evento=evento, fecha=f.fecha, fecha_adicional=f,
+                origen=OcurrenciaEvento.Origen.ADICIONAL,
+            )
+            for f in nuevas
+        ])
+    if cambiadas:
+        FechaEvento.objects.bulk_update(cambiadas, ["fecha", "nota"])
+        ocurrencias = list(OcurrenciaEvento.objects.filter(fecha_adicional__in=cambiadas))
+        fecha_de = {f.pk: f.fecha for f in cambiadas}
+        for o in ocurrencias:
+            o.fecha = fecha_de[o.fecha_adicional_id]
+        OcurrenciaEvento.objects.bulk_update(ocurrencias, ["fecha"])
+
+    if nuevas or cambiadas or sobrantes:
+        invalidar_grupos("eventos")
+        Evento.objects.filter(pk=evento.pk).update(actualizado=timezone.now())
+
+    return nuevas, cambiadas, sobrantes
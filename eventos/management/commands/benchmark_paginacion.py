@@ -0,0 +1,93 @@
+"""
+eventos/management/commands/benchmark_paginacion.py
+
+Compara la latencia de /api/eventos/ con paginación por página (OFFSET + COUNT)
+y por cursor (keyset), en la primera página y en una página profunda.
+
+Crea eventos de prueba dentro de una transacción que se revierte al final,
+así que se puede correr contra cualquier base sin dejar datos.
+
+    python manage.py benchmark_paginacion --pagina 500 --repeticiones 20
+"""
+
+import statistics
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from eventos.models import Evento
+from eventos.views import EventoViewSet
+from ruedo.pagination import PaginacionHibrida
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark de paginación por página vs. por cursor en el listado de eventos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pagina", type=int, default=500)
+        parser.add_argument("--repeticiones", type=int, default=20)
+
+    def handle(self, *args, **opts):
+        try:
+            with transaction.atomic():
+                self._correr(opts["pagina"], opts["repeticiones"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _correr(self, pagina, repeticiones):
+        page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+        total     = pagina * page_size
+        existentes = Evento.objects.count()
+        if existentes < total:
+            self.stdout.write(f"Creando {total - existentes} eventos de prueba...")
+            base = timezone.now()
+            Evento.objects.bulk_create(
+                [
+                    # Fechas repetidas a propósito para ejercitar el desempate por id
+                    Evento(titulo=f"Bench {i}", fecha=base + timedelta(hours=i // 3), lugar="Bench")
+                    for i in range(total - existentes)
+                ],
+                batch_size=1000,
+            )
+
+        # Cursor equivalente a la página pedida: la última fila de la página
+        # anterior (vacío para la primera)
+        campo  = EventoViewSet.cursor_ordering
+        cursor = ""
+        if pagina > 1:
+            previo = Evento.objects.order_by(campo, "id")[(pagina - 1) * page_size - 1]
+            cursor = PaginacionHibrida()._encode_cursor(getattr(previo, campo), previo.pk)
+
+        casos = [
+            ("página 1",                  {"page": 1}),
+            (f"página {pagina}",          {"page": pagina}),
+            ("cursor 1",                  {"cursor": ""}),
+            (f"cursor {pagina}",          {"cursor": cursor}),
+            (f"cursor {pagina} + total",  {"cursor": cursor, "total": "true"}),
+        ]
+        # Sin caché de respuestas: se mide el costo real de cada modo
+        vista   = EventoViewSet.as_view({"get": "list"}, cache_grupo=None)
+        factory = APIRequestFactory(HTTP_HOST=settings.ALLOWED_HOSTS[0].lstrip("."))
+
+        for nombre, params in casos:
+            tiempos = []
+            for _ in range(repeticiones):
+                request = factory.get("/api/eventos/", params)
+                inicio  = time.perf_counter()
+                response = vista(request)
+                response.render()
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+            self.stdout.write(
+                f"{nombre:<24} mediana {statistics.median(tiempos):8.2f} ms   "
+                f"p95 {sorted(tiempos)[int(len(tiempos) * 0.95) - 1]:8.2f} ms"
+            )
@@ -0,0 +1,60 @@
+"""
+eventos/management/commands/recontar_popularidad.py
+
+Reconciliación periódica de Evento.guardados_count / asistidos_count con
+las filas reales de EventoGuardado (ver usuarios/popularidad.py).
+
+Solo escribe los eventos desviados. Cada lote se bloquea con SELECT … FOR
+UPDATE y se vuelve a contar dentro de la transacción: un guardado que
+llegue a la vez espera al bloqueo y su +1 se suma después sobre el valor
+corregido, sin perderse.
+
+    python manage.py recontar_popularidad [--lote 500] [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from eventos.models import Evento
+from ruedo.cache import invalidar_grupos
+from usuarios.popularidad import conteos_reales
+
+
+class Command(BaseCommand):
+    help = "Recalcula los contadores de popularidad de los eventos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lote", type=int, default=500, help="Eventos por transacción.")
+        parser.add_argument("--dry-run", action="store_true", help="Solo contar los desviados.")
+
+    def handle(self, *args, **opts):
+        desviados = list(
+            conteos_reales(Evento.objects.order_by())
+            .filter(~Q(guardados_count=F("guardados_real")) | ~Q(asistidos_count=F("asistidos_real")))
+            .values_list("pk", flat=True)
+        )
+        if opts["dry_run"] or not desviados:
+            self.stdout.write(f"{len(desviados)} eventos con contadores desviados.")
+            return
+
+        corregidos = 0
+        for i in range(0, len(desviados), opts["lote"]):
+            ids = desviados[i:i + opts["lote"]]
+            with transaction.atomic():
+                list(Evento.objects.select_for_update().filter(pk__in=ids).values_list("pk", flat=True))
+                cambiados = []
+                ahora     = timezone.now()
+                for evento in conteos_reales(Evento.objects.filter(pk__in=ids).only("pk", *Evento.CONTADORES)):
+                    if (evento.guardados_count, evento.asistidos_count) != (evento.guardados_real, evento.asistidos_real):
+                        evento.guardados_count = evento.guardados_real
+                        evento.asistidos_count = evento.asistidos_real
+                        evento.actualizado     = ahora
+                        cambiados.append(evento)
+                Evento.objects.bulk_update(cambiados, [*Evento.CONTADORES, "actualizado"])
+                corregidos += len(cambiados)
+
+        if corregidos:
+            invalidar_grupos("eventos")
+        self.stdout.write(self.style.SUCCESS(f"Contadores corregidos en {corregidos} eventos."))
@@ -0,0 +1,45 @@
+"""
+eventos/management/commands/regenerar_agenda.py
+
+Recalcula la tabla de ocurrencias (OcurrenciaEvento).
+
+Sin argumentos solo recorre los eventos recurrentes para correr la ventana
+de AGENDA_HORIZONTE_DIAS; con --todo reconstruye también fechas principales
+y adicionales (útil tras cargar datos con update()/bulk_create()).
+
+    python manage.py regenerar_agenda [--todo]
+
+Sin --todo corre a diario como Cron Job de Render (render.yaml); si deja de
+correr, al año las recurrencias se salen de la ventana.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from eventos.agenda import regenerar_ocurrencias, sincronizar_fecha_adicional
+from eventos.models import Evento, FechaEvento
+from ruedo.cache import invalidar_grupos
+
+
+class Command(BaseCommand):
+    help = "Regenera el índice materializado de ocurrencias de eventos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todo", action="store_true", help="Incluir eventos sin recurrencia y fechas adicionales.")
+
+    def handle(self, *args, **opts):
+        eventos = Evento.objects.only("id", "fecha", "recurrencia")
+        if not opts["todo"]:
+            eventos = eventos.filter(recurrencia__in=["semanal", "mensual"])
+
+        n = 0
+        with transaction.atomic():
+            for evento in eventos.iterator(chunk_size=500):
+                regenerar_ocurrencias(evento)
+                n += 1
+            if opts["todo"]:
+                for fecha in FechaEvento.objects.only("id", "evento_id", "fecha").iterator(chunk_size=500):
+                    sincronizar_fecha_adicional(fecha)
+            invalidar_grupos("eventos")
+
+        self.stdout.write(self.style.SUCCESS(f"Ocurrencias regeneradas para {n} eventos."))
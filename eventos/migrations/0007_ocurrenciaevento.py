@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventos', '0006_alter_evento_imagen_alter_evento_video'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OcurrenciaEvento',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateTimeField()),
+                ('origen', models.CharField(choices=[('principal', 'Fecha principal'), ('recurrencia', 'Recurrencia'), ('adicional', 'Fecha adicional')], max_length=12)),
+                ('evento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ocurrencias', to='eventos.evento')),
+                ('fecha_adicional', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ocurrencia', to='eventos.fechaevento')),
+            ],
+            options={
+                'verbose_name': 'Ocurrencia',
+                'verbose_name_plural': 'Ocurrencias',
+                'ordering': ['fecha'],
+                'indexes': [models.Index(fields=['fecha', 'evento'], name='ocurrencia_fecha_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:47
+
+import django.db.models.expressions
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def contar(apps, schema_editor):
+    """Valores iniciales a partir de los EventoGuardado existentes."""
+    Evento         = apps.get_model("eventos", "Evento")
+    EventoGuardado = apps.get_model("usuarios", "EventoGuardado")
+
+    def total(estado):
+        filas = (
+            EventoGuardado.objects
+            .filter(evento=OuterRef("pk"), estado=estado)
+            .order_by()
+            .values("evento")
+            .annotate(n=Count("pk"))
+            .values("n")
+        )
+        return Coalesce(Subquery(filas), Value(0))
+
+    Evento.objects.filter(pk__in=EventoGuardado.objects.values("evento")).update(
+        guardados_count=total("GUARDADO"),
+        asistidos_count=total("ASISTIDO"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventos', '0007_ocurrenciaevento'),
+        ('usuarios', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evento',
+            name='asistidos_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='evento',
+            name='guardados_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='evento',
+            name='popularidad',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('guardados_count'), '+', models.F('asistidos_count')), output_field=models.PositiveIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='evento',
+            index=models.Index(fields=['-popularidad', '-id'], name='evento_popularidad_idx'),
+        ),
+        migrations.RunPython(contar, migrations.RunPython.noop),
+    ]
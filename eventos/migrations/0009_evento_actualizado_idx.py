@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventos', '0008_popularidad'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='evento',
+            name='actualizado',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -69,16 +69,41 @@ class Evento(models.Model):
         null=True, related_name="eventos_creados",
     )
     creado_en   = models.DateTimeField(auto_now_add=True)
-    actualizado = models.DateTimeField(auto_now=True)
+    actualizado = models.DateTimeField(auto_now=True, db_index=True)
+
+    # ── Popularidad (usuarios/popularidad.py) ──
+    # Se mantienen con UPDATE … F() al cambiar EventoGuardado; save() no los
+    # escribe para no pisar incrementos concurrentes con un valor viejo.
+    guardados_count = models.PositiveIntegerField(default=0, editable=False)
+    asistidos_count = models.PositiveIntegerField(default=0, editable=False)
+    popularidad     = models.GeneratedField(
+        expression=models.F("guardados_count") + models.F("asistidos_count"),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+    )
+
+    CONTADORES = ("guardados_count", "asistidos_count")
 
     class Meta:
         verbose_name        = "Evento"
         verbose_name_plural = "Eventos"
         ordering            = ["fecha"]
+        indexes             = [
+            models.Index(fields=["-popularidad", "-id"], name="evento_popularidad_idx"),
+        ]
 
     def __str__(self):
         return f"{self.titulo} — {self.fecha.strftime('%d/%m/%Y')}"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            omitir = self.get_deferred_fields().union(self.CONTADORES)
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and not f.generated and f.attname not in omitir
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def imagen_final(self):
         if self.imagen:
@@ -103,4 +128,33 @@ class FechaEvento(models.Model):
         ordering            = ["fecha"]
 
     def __str__(self):
-        return f"{self.evento.titulo} — {self.fecha.strftime('%d/%m/%Y %H:%M')}"
\ No newline at end of file
+        return f"{self.evento.titulo} — {self.fecha.strftime('%d/%m/%Y %H:%M')}"
+
+class OcurrenciaEvento(models.Model):
+    """
+    Índice materializado de cuándo sucede cada evento.
+    Se genera a partir de `fecha` + `recurrencia` y de cada FechaEvento
+    (ver eventos/agenda.py) para que la agenda sea un solo rango por fecha.
+    """
+
+    class Origen(models.TextChoices):
+        PRINCIPAL   = "principal",   "Fecha principal"
+        RECURRENCIA = "recurrencia", "Recurrencia"
+        ADICIONAL   = "adicional",   "Fecha adicional"
+
+    evento = models.ForeignKey(Evento, on_delete=models.CASCADE, related_name="ocurrencias")
+    fecha  = models.DateTimeField()
+    origen = models.CharField(max_length=12, choices=Origen.choices)
+    fecha_adicional = models.OneToOneField(
+        FechaEvento, on_delete=models.CASCADE,
+        null=True, blank=True, related_name="ocurrencia",
+    )
+
+    class Meta:
+        verbose_name        = "Ocurrencia"
+        verbose_name_plural = "Ocurrencias"
+        ordering            = ["fecha"]
+        indexes             = [models.Index(fields=["fecha", "evento"], name="ocurrencia_fecha_idx")]
+
+    def __str__(self):
+        return f"{self.evento.titulo} — {self.fecha.strftime('%d/%m/%Y %H:%M')}"
@@ -0,0 +1,175 @@
+"""
+eventos/para_mi.py
+
+Feed personalizado de /api/eventos/para-mi/.
+
+Cada evento próximo (con alguna ocurrencia en los siguientes
+FEED_HORIZONTE_DIAS) recibe un puntaje para el usuario:
+    PESO_GUSTO       si su categoría está en los intereses del usuario
+    PESO_CIUDAD      si es en la ciudad del usuario
+    PESO_HISTORIAL   × la fracción de sus guardados en esa categoría
+                       (los ASISTIDO cuentan doble)
+    PESO_POPULARIDAD × log(1 + Evento.popularidad)
+    PESO_CERCANIA    / (1 + días hasta la próxima ocurrencia / 30)
+Los que el usuario ya tiene en mis-eventos no se proponen.
+
+Los FEED_TAMANO mejores se guardan en la caché compartida por usuario,
+junto con el perfil usado para puntuar, así que un request normal es:
+    1 get de caché (+ el token de versión del grupo "eventos")
+    1 SELECT … WHERE id IN (…) para serializar la página
+
+Refresco incremental:
+    - Al crear o editar eventos cambia la versión del grupo "eventos"
+      (ruedo/cache.py). El siguiente request del usuario re-puntúa solo los
+      eventos con `actualizado` posterior a la marca del feed y los mezcla.
+      La marca se queda MARGEN atrás por las transacciones que confirman
+      fuera de orden.
+    - Las entradas cuya ocurrencia ya pasó se re-puntúan igual (un evento
+      recurrente pasa a su siguiente fecha; uno único sale del feed).
+    - Cambiar la ciudad, los intereses (usuarios/intereses.py) o la agenda
+      propia (EventoGuardado) borra el feed del usuario y se reconstruye en
+      el siguiente request.
+    - FEED_TTL_SEGUNDOS acota la deriva (p. ej. eventos que no entraron al
+      top y luego habrían subido por popularidad).
+"""
+
+import math
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Min
+from django.utils import timezone
+
+from ruedo.cache import version_grupo
+from usuarios.models import EventoGuardado, Interes, Usuario
+from .models import Evento
+
+PESO_GUSTO       = 3.0
+PESO_CIUDAD      = 2.0
+PESO_HISTORIAL   = 2.0
+PESO_POPULARIDAD = 0.25
+PESO_CERCANIA    = 1.0
+
+MARGEN = timedelta(seconds=30)
+
+
+def _llave(usuario_id):
+    return f"eventos:para-mi:{usuario_id}"
+
+
+def olvidar(usuario_id):
+    """Descarta el feed del usuario; se reconstruye en el siguiente request."""
+    caches["compartida"].delete(_llave(usuario_id))
+
+
+# ── Perfil y puntaje ──
+
+def perfil_de(usuario_id):
+    ciudad = Usuario.objects.filter(pk=usuario_id).values_list("ciudad", flat=True).first()
+    historial = Counter()
+    excluidos = []
+    for evento_id, categoria_id, estado in (
+        EventoGuardado.objects.filter(usuario_id=usuario_id)
+        .values_list("evento_id", "evento__categoria_id", "estado")
+    ):
+        excluidos.append(evento_id)
+        if categoria_id is not None:
+            historial[categoria_id] += 2 if estado == EventoGuardado.Estado.ASISTIDO else 1
+    total = sum(historial.values()) or 1
+    return {
+        "gustos":    set(
+            Interes.objects.filter(usuario_id=usuario_id, categoria__isnull=False)
+            .values_list("categoria_id", flat=True)
+        ),
+        "ciudad":    (ciudad or "").strip().casefold(),
+        "historial": {pk: n / total for pk, n in historial.items()},
+        "excluidos": set(excluidos),
+    }
+
+
+def puntaje(perfil, categoria_id, ciudad, popularidad, proxima, ahora):
+    valor = PESO_POPULARIDAD * math.log1p(popularidad or 0)
+    valor += PESO_CERCANIA / (1 + (proxima - ahora).total_seconds() / 86400 / 30)
+    if categoria_id in perfil["gustos"]:
+        valor += PESO_GUSTO
+    if perfil["ciudad"] and (ciudad or "").strip().casefold() == perfil["ciudad"]:
+        valor += PESO_CIUDAD
+    valor += PESO_HISTORIAL * perfil["historial"].get(categoria_id, 0)
+    return valor
+
+
+def _puntuar(perfil, eventos, ahora):
+    """[(puntaje, evento_id, proxima_ts)] de los eventos próximos de `eventos`."""
+    hasta = ahora + timedelta(days=settings.FEED_HORIZONTE_DIAS)
+    filas = (
+        eventos
+        .filter(ocurrencias__fecha__gte=ahora, ocurrencias__fecha__lt=hasta)
+        .exclude(pk__in=perfil["excluidos"])
+        .order_by()
+        .annotate(proxima=Min("ocurrencias__fecha"))
+        .values_list("pk", "categoria_id", "ciudad", "popularidad", "proxima")
+    )
+    return [
+        (puntaje(perfil, categoria_id, ciudad, popularidad, proxima, ahora), pk, proxima.timestamp())
+        for pk, categoria_id, ciudad, popularidad, proxima in filas
+    ]
+
+
+def _recortar(entradas):
+    return sorted(entradas, key=lambda e: (-e[0], e[2], e[1]))[: settings.FEED_TAMANO]
+
+
+# ── Feed ──
+
+def construir(usuario_id):
+    ahora  = timezone.now()
+    feed   = {
+        "version": version_grupo("eventos"),   # antes de leer: un cambio a mitad se re-puntúa después
+        "marca":   ahora - MARGEN,
+        "perfil":  perfil_de(usuario_id),
+    }
+    feed["entradas"] = _recortar(_puntuar(feed["perfil"], Evento.objects.all(), ahora))
+    caches["compartida"].set(_llave(usuario_id), feed, settings.FEED_TTL_SEGUNDOS)
+    return feed
+
+
+def _refrescar(usuario_id, feed, version, ahora):
+    cambiados = set(Evento.objects.filter(actualizado__gte=feed["marca"]).values_list("pk", flat=True))
+    vencidos  = {pk for _, pk, ts in feed["entradas"] if ts < ahora.timestamp()}
+    tocar     = cambiados | vencidos
+    nuevas    = _puntuar(feed["perfil"], Evento.objects.filter(pk__in=tocar), ahora) if tocar else []
+
+    feed["entradas"] = _recortar([e for e in feed["entradas"] if e[1] not in tocar] + nuevas)
+    feed["version"]  = version
+    feed["marca"]    = ahora - MARGEN
+    caches["compartida"].set(_llave(usuario_id), feed, settings.FEED_TTL_SEGUNDOS)
+
+
+def ids_para(usuario_id):
+    """ids de los eventos recomendados al usuario, del más al menos relevante."""
+    feed = caches["compartida"].get(_llave(usuario_id))
+    if feed is None:
+        feed = construir(usuario_id)
+    else:
+        ahora   = timezone.now()
+        version = version_grupo("eventos")
+        if feed["version"] != version or any(ts < ahora.timestamp() for _, _, ts in feed["entradas"]):
+            _refrescar(usuario_id, feed, version, ahora)
+    return [pk for _, pk, _ in feed["entradas"]]
+
+
+# ── Señales ──
+
+def al_guardar_usuario(sender, instance, created, update_fields=None, **kwargs):
+    """post_save de Usuario: la ciudad cambia el perfil."""
+    if created:
+        return
+    if update_fields is None or "ciudad" in update_fields:
+        olvidar(instance.pk)
+
+
+def al_cambiar_guardado(sender, instance, **kwargs):
+    """post_save/post_delete de EventoGuardado: cambia historial y excluidos."""
+    olvidar(instance.usuario_id)
@@ -1,5 +1,13 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Evento, Categoria, FechaEvento
+from archivos.serializers import MetadatosField, SrcsetField, SubidasPendientesField
+from ruedo.serializers import JSONAnidadoMixin
+from .models import Evento, Categoria, FechaEvento, OcurrenciaEvento
+from .fechas import aplicar_fechas
 
 
 class FechaEventoSerializer(serializers.ModelSerializer):
@@ -8,6 +16,11 @@ class FechaEventoSerializer(serializers.ModelSerializer):
         fields = ["id", "fecha", "nota"]
 
 
+class FechaEventoLoteSerializer(FechaEventoSerializer):
+    """Para escritura en lote: el `id` es opcional y sirve para emparejar con lo guardado."""
+    id = serializers.IntegerField(required=False)
+
+
 class CategoriaSerializer(serializers.ModelSerializer):
     class Meta:
         model  = Categoria
@@ -17,6 +30,7 @@ class CategoriaSerializer(serializers.ModelSerializer):
 class EventoResumenSerializer(serializers.ModelSerializer):
     categoria     = CategoriaSerializer(read_only=True)
     imagen_final  = serializers.ReadOnlyField()
+    imagen_srcset = SrcsetField(source="imagen")
     video_final   = serializers.ReadOnlyField()
     fechas_adicionales = FechaEventoSerializer(many=True, read_only=True)
 
@@ -24,33 +38,97 @@ class EventoResumenSerializer(serializers.ModelSerializer):
         model  = Evento
         fields = [
             "id", "titulo", "descripcion", "categoria",
-            "imagen_final", "imagen_url", "video_final", "video_url",
+            "imagen_final", "imagen_srcset", "imagen_url", "video_final", "video_url",
             "fecha", "lugar", "detalle_lugar", "ciudad",
             "recurrencia", "fechas_adicionales",
             "abierto", "destacado", "gratuito", "precio",
+            "guardados_count", "asistidos_count",
         ]
 
 
-class EventoSerializer(serializers.ModelSerializer):
+class EventoSerializer(JSONAnidadoMixin, serializers.ModelSerializer):
     categoria_id       = serializers.PrimaryKeyRelatedField(
         queryset=Categoria.objects.all(), source="categoria",
         required=False, allow_null=True,
     )
     categoria          = CategoriaSerializer(read_only=True)
     imagen_final       = serializers.ReadOnlyField()
+    imagen_srcset      = SrcsetField(source="imagen")
     video_final        = serializers.ReadOnlyField()
-    fechas_adicionales = FechaEventoSerializer(many=True, read_only=True)
+    video_meta         = MetadatosField(source="video")
+    fechas_adicionales = FechaEventoLoteSerializer(many=True, required=False)
+    subidas_pendientes = SubidasPendientesField()
 
     class Meta:
         model  = Evento
         fields = [
             "id", "titulo", "descripcion",
             "categoria_id", "categoria",
-            "imagen", "imagen_url", "imagen_final",
-            "video", "video_url", "video_final",
+            "imagen", "imagen_url", "imagen_final", "imagen_srcset",
+            "video", "video_url", "video_final", "video_meta", "subidas_pendientes",
             "fecha", "lugar", "detalle_lugar", "ciudad",
             "recurrencia", "fechas_adicionales",
             "abierto", "destacado", "gratuito", "precio",
+            "guardados_count", "asistidos_count",
             "creado_por", "creado_en",
         ]
         read_only_fields = ["creado_por", "creado_en", "imagen_final"]
+
+    # En multipart (cuando se sube imagen/video) las fechas llegan como JSON en texto
+    campos_json_anidados = ["fechas_adicionales"]
+
+    @transaction.atomic
+    def create(self, validated_data):
+        fechas = validated_data.pop("fechas_adicionales", [])
+        evento = super().create(validated_data)
+        aplicar_fechas(evento, fechas)
+        return evento
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        # Si no vienen fechas (PATCH parcial) se dejan como están
+        fechas = validated_data.pop("fechas_adicionales", None)
+        evento = super().update(instance, validated_data)
+        if fechas is not None:
+            aplicar_fechas(evento, fechas)
+        return evento
+
+
+class EventoAgendaSerializer(serializers.ModelSerializer):
+    """Vista mínima del evento dentro de una ocurrencia (sin fechas anidadas)."""
+    categoria     = CategoriaSerializer(read_only=True)
+    imagen_final  = serializers.ReadOnlyField()
+    imagen_srcset = SrcsetField(source="imagen")
+
+    class Meta:
+        model  = Evento
+        fields = [
+            "id", "titulo", "categoria", "imagen_final", "imagen_srcset",
+            "lugar", "ciudad", "recurrencia",
+            "abierto", "destacado", "gratuito", "precio",
+        ]
+
+
+class OcurrenciaSerializer(serializers.ModelSerializer):
+    evento = EventoAgendaSerializer(read_only=True)
+
+    class Meta:
+        model  = OcurrenciaEvento
+        fields = ["fecha", "origen", "evento"]
+
+
+class AgendaQuerySerializer(serializers.Serializer):
+    """Valida ?desde=&hasta= de /api/eventos/agenda/."""
+    desde = serializers.DateTimeField(required=False)
+    hasta = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        desde = data.get("desde") or timezone.now()
+        hasta = data.get("hasta") or desde + timedelta(days=7)
+        if hasta <= desde:
+            raise serializers.ValidationError({"hasta": "Debe ser posterior a `desde`."})
+        if hasta - desde > timedelta(days=settings.AGENDA_RANGO_MAXIMO_DIAS):
+            raise serializers.ValidationError(
+                {"hasta": f"El rango máximo es de {settings.AGENDA_RANGO_MAXIMO_DIAS} días."}
+            )
+        return {"desde": desde, "hasta": hasta}
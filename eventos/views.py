@@ -1,22 +1,40 @@
-from rest_framework import viewsets, permissions, filters
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import viewsets, permissions, filters, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Evento, Categoria, FechaEvento
-from .serializers import EventoSerializer, EventoResumenSerializer, CategoriaSerializer, FechaEventoSerializer
+from .models import Evento, Categoria, FechaEvento, OcurrenciaEvento
+from .serializers import (
+    EventoSerializer, EventoResumenSerializer, CategoriaSerializer, FechaEventoSerializer,
+    OcurrenciaSerializer, AgendaQuerySerializer, FechaEventoLoteSerializer,
+)
+from .fechas import aplicar_fechas
+from .para_mi import ids_para
 from usuarios.permissions import EsCuenteroOAdmin
+from ruedo.cache import CacheRespuestaMixin
+from ruedo.condicional import CondicionalMixin
+from busqueda.filters import BusquedaFilter
+from busqueda.models import DocumentoBusqueda
+from notificaciones.difusion import encolar as difundir_evento
 
 
-class CategoriaViewSet(viewsets.ModelViewSet):
+class CategoriaViewSet(CacheRespuestaMixin, viewsets.ModelViewSet):
+    cache_grupo      = "categorias"
     queryset         = Categoria.objects.all()
     serializer_class = CategoriaSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
 
-class EventoViewSet(viewsets.ModelViewSet):
-    queryset = Evento.objects.select_related("categoria").prefetch_related("fechas_adicionales").all()
-    filter_backends  = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["ciudad", "destacado", "abierto", "categoria", "recurrencia"]
-    search_fields    = ["titulo", "descripcion", "lugar"]
-    ordering_fields  = ["fecha", "creado_en"]
+class EventoViewSet(CondicionalMixin, CacheRespuestaMixin, viewsets.ModelViewSet):
+    cache_grupo       = "eventos"
+    condicional_campo = "actualizado"
+    queryset          = Evento.objects.select_related("categoria").prefetch_related("fechas_adicionales").all()
+    filter_backends   = [DjangoFilterBackend, filters.OrderingFilter, BusquedaFilter]
+    filterset_fields  = ["ciudad", "destacado", "abierto", "categoria", "recurrencia"]
+    busqueda_tipo     = DocumentoBusqueda.Tipo.EVENTO
+    ordering_fields   = ["fecha", "creado_en", "popularidad"]
+    cursor_ordering   = "fecha"
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -26,27 +44,59 @@ class EventoViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
             return [EsCuenteroOAdmin()]
+        if self.action == "para_mi":
+            return [permissions.IsAuthenticated()]
         return [permissions.AllowAny()]
 
+    @action(detail=False, methods=["get"])
+    def agenda(self, request):
+        """
+        GET /api/eventos/agenda/?desde=&hasta=
+        Ocurrencias (fecha principal, recurrencias y fechas adicionales) en el
+        rango, resueltas con un solo escaneo del índice por fecha.
+        """
+        return self._respuesta_cacheada(request, self._agenda)
+
+    @action(detail=False, methods=["get"], url_path="para-mi")
+    def para_mi(self, request):
+        """
+        GET /api/eventos/para-mi/
+        Próximos eventos ordenados para el usuario autenticado (gustos,
+        ciudad e historial de mis-eventos). El ranking sale precalculado de
+        la caché (eventos/para_mi.py); aquí solo se pagina la lista de ids
+        y se trae la página con un IN.
+        """
+        # view=None: paginación por número de página, el feed no tiene orden por columna
+        ids     = self.paginator.paginate_queryset(ids_para(request.user.pk), request, view=None)
+        eventos = Evento.objects.select_related("categoria").prefetch_related("fechas_adicionales").in_bulk(ids)
+        pagina  = [eventos[pk] for pk in ids if pk in eventos]
+        return self.paginator.get_paginated_response(EventoResumenSerializer(pagina, many=True).data)
+
+    def _agenda(self, request):
+        rango = AgendaQuerySerializer(data=request.query_params)
+        rango.is_valid(raise_exception=True)
+        ocurrencias = (
+            OcurrenciaEvento.objects
+            .filter(fecha__gte=rango.validated_data["desde"], fecha__lt=rango.validated_data["hasta"])
+            .select_related("evento", "evento__categoria")
+            .order_by("fecha", "evento_id")
+        )
+        return Response(OcurrenciaSerializer(ocurrencias, many=True).data)
+
     def perform_create(self, serializer):
+        # Las fechas adicionales se validan y guardan en lote dentro del serializer
         evento = serializer.save(creado_por=self.request.user)
-        # Guardar fechas adicionales si vienen en el request
-        fechas = self.request.data.get("fechas_adicionales", [])
-        if isinstance(fechas, str):
-            import json
-            try:
-                fechas = json.loads(fechas)
-            except Exception:
-                fechas = []
-        for f in fechas:
-            FechaEvento.objects.create(
-                evento=evento,
-                fecha=f.get("fecha"),
-                nota=f.get("nota", ""),
-            )
+        # Avisar a los interesados en la categoría: se reparte después del request
+        difundir_evento(evento)
 
 
 class FechaEventoViewSet(viewsets.ModelViewSet):
+    """
+    GET    /api/eventos/<pk>/fechas/               → listar
+    POST   /api/eventos/<pk>/fechas/               → crear una, o varias si el cuerpo es una lista
+    PUT    /api/eventos/<pk>/fechas/sincronizar/   → reemplazar el conjunto completo
+                                                     (solo inserta/actualiza/borra lo que cambió)
+    """
     serializer_class   = FechaEventoSerializer
     permission_classes = [EsCuenteroOAdmin]
 
@@ -54,4 +104,22 @@ class FechaEventoViewSet(viewsets.ModelViewSet):
         return FechaEvento.objects.filter(evento_id=self.kwargs["evento_pk"])
 
     def perform_create(self, serializer):
-        serializer.save(evento_id=self.kwargs["evento_pk"])
\ No newline at end of file
+        serializer.save(evento_id=self.kwargs["evento_pk"])
+
+    def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self._lote(request, borrar_faltantes=False)
+        return super().create(request, *args, **kwargs)
+
+    @action(detail=False, methods=["put"])
+    def sincronizar(self, request, evento_pk=None):
+        return self._lote(request, borrar_faltantes=True)
+
+    def _lote(self, request, borrar_faltantes):
+        evento = get_object_or_404(Evento, pk=self.kwargs["evento_pk"])
+        serializer = FechaEventoLoteSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            creadas, _, _ = aplicar_fechas(evento, serializer.validated_data, borrar_faltantes)
+        codigo = status.HTTP_201_CREATED if creadas else status.HTTP_200_OK
+        return Response(FechaEventoSerializer(self.get_queryset(), many=True).data, status=codigo)
\ No newline at end of file
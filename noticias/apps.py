@@ -3,3 +3,21 @@ from django.apps import AppConfig
 
 class NoticiasConfig(AppConfig):
     name = 'noticias'
+
+    def ready(self):
+        from ruedo.cache import registrar_invalidacion
+        from ruedo.condicional import registrar_toque
+        from .models import Noticia, BloqueContenido
+
+        registrar_invalidacion(Noticia,         "noticias")
+        registrar_invalidacion(BloqueContenido, "noticias")
+
+        # Un bloque modificado cambia el ETag / Last-Modified de su noticia
+        registrar_toque(BloqueContenido, lambda b: Noticia.objects.filter(pk=b.noticia_id), "actualizada")
+
+        # Cuerpo precompilado para el detalle
+        from django.db.models.signals import post_save, post_delete, pre_save
+        from .cuerpo import al_crear_noticia, al_cambiar_bloque
+        pre_save.connect(al_crear_noticia,     sender=Noticia,         dispatch_uid="noticias-cuerpo")
+        post_save.connect(al_cambiar_bloque,   sender=BloqueContenido, dispatch_uid="noticias-cuerpo-bloque")
+        post_delete.connect(al_cambiar_bloque, sender=BloqueContenido, dispatch_uid="noticias-cuerpo-bloque")
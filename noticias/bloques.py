@@ -0,0 +1,82 @@
+"""
+noticias/bloques.py
+
+Escritura en lote de los bloques de una noticia.
+
+aplicar_bloques() recibe la lista ordenada completa, la compara por `id`
+con lo guardado y en una sola transacción hace un bulk_create de los
+nuevos, un bulk_update de los modificados y un DELETE de los que ya no
+vienen. `orden` se renumera en la misma pasada según la posición en la
+lista. Debe llamarse dentro de transaction.atomic().
+
+Como las escrituras en lote no disparan señales, aquí mismo se invalida
+la caché, se toca `Noticia.actualizada`, se reindexa la búsqueda y se
+recompila el cuerpo.
+"""
+
+from django.db.models import Case, IntegerField, Value, When
+from django.utils import timezone
+
+from busqueda.indice import indexar
+from busqueda.models import DocumentoBusqueda
+from ruedo.cache import invalidar_grupos
+from ruedo.condicional import sin_toques
+from .models import Noticia, BloqueContenido
+from .cuerpo import recompilar
+
+CAMPOS = ["tipo", "texto", "autor", "src", "pie"]
+
+
+def _al_cambiar(noticia):
+    invalidar_grupos("noticias")
+    Noticia.objects.filter(pk=noticia.pk).update(actualizada=timezone.now())
+    indexar(DocumentoBusqueda.Tipo.NOTICIA, noticia)
+    recompilar(noticia)
+
+
+def aplicar_bloques(noticia, bloques):
+    """
+    `bloques` es la lista validada por BloqueContenidoLoteSerializer, en el
+    orden final. Devuelve (creados, actualizados, borrados).
+    """
+    guardados = {b.pk: b for b in BloqueContenido.objects.filter(noticia=noticia)}
+    vistos    = set()
+    nuevos, cambiados = [], []
+
+    for orden, datos in enumerate(bloques):
+        campos = {c: datos[c] for c in CAMPOS if c in datos}
+        campos["orden"] = orden
+        actual = guardados.get(datos.get("id"))
+        if actual is None or actual.pk in vistos:
+            nuevos.append(BloqueContenido(noticia=noticia, **campos))
+            continue
+        vistos.add(actual.pk)
+        if any(getattr(actual, c) != v for c, v in campos.items()):
+            for c, v in campos.items():
+                setattr(actual, c, v)
+            cambiados.append(actual)
+
+    sobrantes = [pk for pk in guardados if pk not in vistos]
+
+    if sobrantes:
+        with sin_toques():
+            BloqueContenido.objects.filter(pk__in=sobrantes).delete()
+    if nuevos:
+        BloqueContenido.objects.bulk_create(nuevos)
+    if cambiados:
+        BloqueContenido.objects.bulk_update(cambiados, CAMPOS + ["orden"])
+
+    if nuevos or cambiados or sobrantes:
+        _al_cambiar(noticia)
+    return nuevos, cambiados, sobrantes
+
+
+def reordenar_bloques(noticia, ids):
+    """Reescribe `orden` de todos los bloques con un solo UPDATE ... CASE."""
+    BloqueContenido.objects.filter(noticia=noticia, pk__in=ids).update(
+        orden=Case(
+            *[When(pk=pk, then=Value(posicion)) for posicion, pk in enumerate(ids)],
+            output_field=IntegerField(),
+        )
+    )
+    _al_cambiar(noticia)
@@ -0,0 +1,52 @@
+"""
+noticias/cuerpo.py
+
+Cuerpo precompilado de una noticia.
+
+Las noticias se leen miles de veces por cada edición, así que el detalle no
+serializa BloqueContenido en cada request: lee `Noticia.cuerpo_compilado`,
+que ya trae los bloques serializados en orden (con `src_final` resuelto) y
+`palabras` calculado. Solo depende de los bloques, así que se regenera una
+vez por escritura de bloques:
+    un bloque suelto (guardar/borrar)  → al_cambiar_bloque (señales)
+    la lista completa o el orden       → noticias/bloques.py, al final del lote
+Guardar solo la noticia no lo toca; al crearla nace vacío (al_crear_noticia).
+`manage.py compilar_noticias` lo reconstruye en lote.
+"""
+
+from ruedo.condicional import toques_suspendidos
+from .models import Noticia
+
+
+def compilar(noticia, bloques=None):
+    """Devuelve (cuerpo, palabras) a partir de los bloques (o los de la BD)."""
+    from .serializers import BloqueContenidoSerializer
+
+    if bloques is None:
+        bloques = noticia.bloques.all()
+    cuerpo   = BloqueContenidoSerializer(bloques, many=True).data
+    palabras = sum(len(b["texto"].split()) for b in cuerpo if b["texto"])
+    return [dict(b) for b in cuerpo], palabras
+
+
+def recompilar(noticia):
+    """Regenera y guarda el cuerpo con un UPDATE directo (sin señales ni auto_now)."""
+    cuerpo, palabras = compilar(noticia)
+    Noticia.objects.filter(pk=noticia.pk).update(cuerpo_compilado=cuerpo, palabras=palabras)
+    noticia.cuerpo_compilado, noticia.palabras = cuerpo, palabras
+
+
+# ── Receptores (conectados en NoticiasConfig.ready) ──
+
+def al_crear_noticia(sender, instance, raw=False, **kwargs):
+    """pre_save de Noticia: una noticia nueva no tiene bloques todavía."""
+    if not raw and instance._state.adding and instance.cuerpo_compilado is None:
+        instance.cuerpo_compilado, instance.palabras = [], 0
+
+
+def al_cambiar_bloque(sender, instance, raw=False, **kwargs):
+    if raw or toques_suspendidos():
+        return
+    noticia = Noticia.objects.filter(pk=instance.noticia_id).first()
+    if noticia is not None:
+        recompilar(noticia)
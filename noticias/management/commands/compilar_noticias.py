@@ -0,0 +1,47 @@
+"""
+noticias/management/commands/compilar_noticias.py
+
+Reconstruye el cuerpo precompilado de las noticias en lotes.
+
+    python manage.py compilar_noticias              → solo las que no lo tienen
+    python manage.py compilar_noticias --todo       → todas
+    python manage.py compilar_noticias --lote 100
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Prefetch
+
+from noticias.cuerpo import compilar
+from noticias.models import Noticia, BloqueContenido
+
+
+class Command(BaseCommand):
+    help = "Regenera Noticia.cuerpo_compilado y Noticia.palabras en lotes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todo", action="store_true", help="Recompilar también las que ya tienen cuerpo.")
+        parser.add_argument("--lote", type=int, default=200)
+
+    def handle(self, *args, **opts):
+        qs = Noticia.objects.only("id").prefetch_related(
+            Prefetch("bloques", queryset=BloqueContenido.objects.order_by("orden"))
+        ).order_by("id")
+        if not opts["todo"]:
+            qs = qs.filter(cuerpo_compilado__isnull=True)
+
+        lote, total = [], 0
+        for noticia in qs.iterator(chunk_size=opts["lote"]):
+            noticia.cuerpo_compilado, noticia.palabras = compilar(noticia, noticia.bloques.all())
+            lote.append(noticia)
+            if len(lote) >= opts["lote"]:
+                total += self._guardar(lote)
+                lote = []
+        if lote:
+            total += self._guardar(lote)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} noticias compiladas."))
+
+    def _guardar(self, lote):
+        Noticia.objects.bulk_update(lote, ["cuerpo_compilado", "palabras"])
+        self.stdout.write(f"  … {len(lote)}")
+        return len(lote)
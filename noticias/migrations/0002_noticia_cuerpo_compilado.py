@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('noticias', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='noticia',
+            name='cuerpo_compilado',
+            field=models.JSONField(blank=True, editable=False, help_text='Bloques ya serializados, en orden. Se regenera al editar.', null=True),
+        ),
+        migrations.AddField(
+            model_name='noticia',
+            name='palabras',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
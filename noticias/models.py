@@ -60,6 +60,13 @@ class Noticia(models.Model):
     creada_en         = models.DateTimeField(auto_now_add=True)
     actualizada       = models.DateTimeField(auto_now=True)
 
+    # ── Cuerpo precompilado (ver noticias/cuerpo.py) ──
+    cuerpo_compilado = models.JSONField(
+        null=True, blank=True, editable=False,
+        help_text="Bloques ya serializados, en orden. Se regenera al editar.",
+    )
+    palabras = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         verbose_name        = "Noticia"
         verbose_name_plural = "Noticias"
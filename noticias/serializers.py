@@ -1,22 +1,51 @@
 """noticias/serializers.py"""
 
+from django.db import transaction
 from rest_framework import serializers
+from archivos.serializers import SrcsetField
+from ruedo.serializers import JSONAnidadoMixin
 from usuarios.serializers import UsuarioPublicoSerializer
 from .models import Noticia, BloqueContenido
+from .bloques import aplicar_bloques
+from .cuerpo import compilar
 
 
 class BloqueContenidoSerializer(serializers.ModelSerializer):
-    src_final = serializers.CharField(read_only=True)
+    src_final  = serializers.CharField(read_only=True)
+    src_srcset = SrcsetField(source="imagen")
 
     class Meta:
         model  = BloqueContenido
-        fields = ["id", "tipo", "orden", "texto", "autor", "imagen", "src", "src_final", "pie"]
+        fields = ["id", "tipo", "orden", "texto", "autor", "imagen", "src", "src_final", "src_srcset", "pie"]
+
+
+class BloqueContenidoLoteSerializer(BloqueContenidoSerializer):
+    """
+    Bloque dentro de la lista completa de una noticia.
+    `id` opcional (sin id = bloque nuevo); `orden` lo da la posición en la lista.
+    Las imágenes subidas como archivo se gestionan por /bloques/<id>/.
+    """
+    id = serializers.IntegerField(required=False)
+
+    class Meta(BloqueContenidoSerializer.Meta):
+        read_only_fields = ["orden", "imagen"]
+
+
+class ReordenarBloquesSerializer(serializers.Serializer):
+    orden = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    def validate_orden(self, value):
+        esperados = set(self.context["noticia"].bloques.values_list("id", flat=True))
+        if len(value) != len(set(value)) or set(value) != esperados:
+            raise serializers.ValidationError("Debe incluir cada bloque de la noticia exactamente una vez.")
+        return value
 
 
 class NoticiaResumenSerializer(serializers.ModelSerializer):
     """Vista compacta para listados."""
     autor              = UsuarioPublicoSerializer(read_only=True)
-    imagen_portada_final = serializers.CharField(read_only=True)
+    imagen_portada_final  = serializers.CharField(read_only=True)
+    imagen_portada_srcset = SrcsetField(source="imagen_portada")
 
     class Meta:
         model  = Noticia
@@ -24,15 +53,19 @@ class NoticiaResumenSerializer(serializers.ModelSerializer):
             "id", "slug", "titulo", "resumen",
             "categoria", "categoria_color",
             "autor", "tiempo_lectura",
-            "imagen_portada_final", "fecha_publicacion",
+            "imagen_portada_final", "imagen_portada_srcset", "fecha_publicacion",
         ]
 
 
 class NoticiaSerializer(serializers.ModelSerializer):
-    """Serializer completo con bloques anidados."""
+    """
+    Serializer completo. Los bloques salen del cuerpo precompilado
+    (noticias/cuerpo.py), no de la tabla BloqueContenido.
+    """
     autor              = UsuarioPublicoSerializer(read_only=True)
-    bloques            = BloqueContenidoSerializer(many=True, read_only=True)
-    imagen_portada_final = serializers.CharField(read_only=True)
+    bloques            = serializers.SerializerMethodField()
+    imagen_portada_final  = serializers.CharField(read_only=True)
+    imagen_portada_srcset = SrcsetField(source="imagen_portada")
 
     class Meta:
         model  = Noticia
@@ -40,16 +73,30 @@ class NoticiaSerializer(serializers.ModelSerializer):
             "id", "slug", "titulo", "resumen",
             "categoria", "categoria_color",
             "imagen_portada", "imagen_portada_url", "imagen_portada_final",
-            "autor", "tiempo_lectura",
+            "imagen_portada_srcset", "autor", "tiempo_lectura",
             "publicada", "destacada",
             "fecha_publicacion", "creada_en", "actualizada",
-            "bloques",
+            "palabras", "bloques",
         ]
         read_only_fields = ["id", "creada_en", "actualizada"]
 
+    def get_bloques(self, obj):
+        if obj.cuerpo_compilado is None:
+            # Noticia anterior al precompilado que compilar_noticias no alcanzó:
+            # se compila al vuelo, sin escribir en una lectura
+            return compilar(obj)[0]
+        return obj.cuerpo_compilado
+
+
+class NoticiaWriteSerializer(JSONAnidadoMixin, serializers.ModelSerializer):
+    """
+    Para creación y edición. `bloques` es opcional: si viene, es la lista
+    ordenada completa y reemplaza a la guardada en una sola transacción.
+    """
+    bloques = BloqueContenidoLoteSerializer(many=True, required=False)
+
+    campos_json_anidados = ["bloques"]
 
-class NoticiaWriteSerializer(serializers.ModelSerializer):
-    """Para creación y edición (sin bloques anidados — se gestionan por separado)."""
     class Meta:
         model  = Noticia
         fields = [
@@ -57,5 +104,20 @@ class NoticiaWriteSerializer(serializers.ModelSerializer):
             "categoria", "categoria_color",
             "imagen_portada", "imagen_portada_url",
             "tiempo_lectura", "publicada", "destacada",
-            "fecha_publicacion",
-        ]
\ No newline at end of file
+            "fecha_publicacion", "bloques",
+        ]
+
+    @transaction.atomic
+    def create(self, validated_data):
+        bloques = validated_data.pop("bloques", [])
+        noticia = super().create(validated_data)
+        aplicar_bloques(noticia, bloques)
+        return noticia
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        bloques = validated_data.pop("bloques", None)
+        noticia = super().update(instance, validated_data)
+        if bloques is not None:
+            aplicar_bloques(noticia, bloques)
+        return noticia
\ No newline at end of file
@@ -1,3 +1,55 @@
+from datetime import date
+from unittest import mock
+
+from django.core.cache import caches
 from django.test import TestCase
 
-# Create your tests here.
+from ruedo.pagination import PaginacionHibrida
+from .models import Noticia
+
+
+@mock.patch.object(PaginacionHibrida, "page_size", 2)
+class PaginacionCursorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        fechas = [date(2026, 3, 1), date(2026, 5, 1), date(2026, 5, 1), None, date(2026, 5, 1), None, date(2026, 1, 1)]
+        cls.noticias = [
+            Noticia.objects.create(titulo=f"Nota {i}", slug=f"nota-{i}", publicada=True, fecha_publicacion=fecha)
+            for i, fecha in enumerate(fechas)
+        ]
+
+    def setUp(self):
+        for alias in ("default", "compartida"):
+            caches[alias].clear()
+
+    def _get(self, url, **params):
+        return self.client.get(url, params, HTTP_HOST="localhost")
+
+    def _recorrer(self):
+        ids, url, params = [], "/api/noticias/", {"cursor": ""}
+        while url:
+            respuesta = self._get(url, **params)
+            self.assertEqual(respuesta.status_code, 200)
+            datos = respuesta.json()
+            self.assertLessEqual(len(datos["results"]), 2)
+            ids += [n["id"] for n in datos["results"]]
+            url, params = datos["next"], {}
+        return ids
+
+    def test_empates_y_nulos(self):
+        # -fecha_publicacion, empates por -id y los NULL al final
+        esperado = sorted(
+            self.noticias,
+            key=lambda n: (n.fecha_publicacion is None, -(n.fecha_publicacion or date.min).toordinal(), -n.pk),
+        )
+        self.assertEqual(self._recorrer(), [n.pk for n in esperado])
+
+    def test_cursor_invalido(self):
+        self.assertEqual(self._get("/api/noticias/", cursor="no-es-un-cursor").status_code, 404)
+        self.assertEqual(self._get("/api/noticias/", cursor="eyJ2IjogIm1hbCIsICJpZCI6IDF9").status_code, 404)
+
+    def test_orden_incompatible(self):
+        self.assertEqual(self._get("/api/noticias/", cursor="", ordering="creada_en").status_code, 400)
+        self.assertEqual(self._get("/api/noticias/", cursor="", search="nota").status_code, 400)
+        self.assertEqual(self._get("/api/noticias/", cursor="", ordering="-fecha_publicacion").status_code, 200)
@@ -1,15 +1,25 @@
 """noticias/views.py"""
 
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, filters, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from .models import Noticia, BloqueContenido
 from .serializers import (
     NoticiaSerializer, NoticiaResumenSerializer,
     NoticiaWriteSerializer, BloqueContenidoSerializer,
+    ReordenarBloquesSerializer,
 )
+from .bloques import reordenar_bloques
 from usuarios.permissions import EsCuenteroOAdmin, EsPropietarioOCuentero
+from ruedo.cache import CacheRespuestaMixin
+from ruedo.condicional import CondicionalMixin
+from busqueda.filters import BusquedaFilter
+from busqueda.models import DocumentoBusqueda
 
 
-class NoticiaViewSet(viewsets.ModelViewSet):
+class NoticiaViewSet(CondicionalMixin, CacheRespuestaMixin, viewsets.ModelViewSet):
     """
     GET    /api/noticias/          → listar publicadas (público)
     POST   /api/noticias/          → crear (Cuentero/Admin)
@@ -18,16 +28,23 @@ class NoticiaViewSet(viewsets.ModelViewSet):
     DELETE /api/noticias/<slug>/   → eliminar (autor o Admin)
 
     Filtros: ?categoria=CRÓNICA  ?destacada=true
-    Búsqueda: ?search=cuenteria
+    Búsqueda: ?search=cuenteria  (texto completo, por relevancia; incluye los bloques)
+    Paginación por cursor: ?cursor=  (opcional ?total=true)
     """
-    lookup_field    = "slug"
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields   = ["titulo", "resumen"]
-    ordering_fields = ["fecha_publicacion", "creada_en"]
-    ordering        = ["-fecha_publicacion"]
+    lookup_field      = "slug"
+    cache_grupo       = "noticias"
+    condicional_campo = "actualizada"
+    filter_backends   = [filters.OrderingFilter, BusquedaFilter]
+    busqueda_tipo     = DocumentoBusqueda.Tipo.NOTICIA
+    ordering_fields   = ["fecha_publicacion", "creada_en"]
+    ordering          = ["-fecha_publicacion"]
+    cursor_ordering   = "-fecha_publicacion"
 
     def get_queryset(self):
-        qs = Noticia.objects.select_related("autor").prefetch_related("bloques")
+        qs = Noticia.objects.select_related("autor")
+        if self.action == "list":
+            # El listado no muestra el cuerpo: no traer el JSON precompilado
+            qs = qs.defer("cuerpo_compilado")
         # Usuarios no autenticados solo ven noticias publicadas
         if not self.request.user.is_authenticated or not self.request.user.es_cuentero:
             qs = qs.filter(publicada=True)
@@ -65,6 +82,10 @@ class BloqueContenidoViewSet(viewsets.ModelViewSet):
     POST   /api/noticias/<slug>/bloques/
     PUT    /api/noticias/<slug>/bloques/<id>/
     DELETE /api/noticias/<slug>/bloques/<id>/
+    POST   /api/noticias/<slug>/bloques/reordenar/   {"orden": [id, id, ...]}
+
+    Para guardar todos los bloques de una vez usar `bloques` en
+    POST/PUT /api/noticias/<slug>/.
     """
     serializer_class = BloqueContenidoSerializer
     permission_classes = [EsCuenteroOAdmin]
@@ -76,4 +97,13 @@ class BloqueContenidoViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         noticia = Noticia.objects.get(slug=self.kwargs["noticia_slug"])
-        serializer.save(noticia=noticia)
\ No newline at end of file
+        serializer.save(noticia=noticia)
+
+    @action(detail=False, methods=["post"])
+    def reordenar(self, request, noticia_slug=None):
+        noticia    = get_object_or_404(Noticia, slug=noticia_slug)
+        serializer = ReordenarBloquesSerializer(data=request.data, context={"noticia": noticia})
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            reordenar_bloques(noticia, serializer.validated_data["orden"])
+        return Response(BloqueContenidoSerializer(self.get_queryset(), many=True).data)
\ No newline at end of file
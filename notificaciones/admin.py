@@ -0,0 +1,24 @@
+from django.contrib import admin
+from .models import Difusion, Notificacion, RecordatorioEnviado
+
+
+@admin.register(Notificacion)
+class NotificacionAdmin(admin.ModelAdmin):
+    list_display    = ["usuario", "tipo", "titulo", "leida", "creada"]
+    list_filter     = ["tipo", "leida"]
+    search_fields   = ["usuario__correo", "titulo"]
+    raw_id_fields   = ["usuario", "evento"]
+
+
+@admin.register(Difusion)
+class DifusionAdmin(admin.ModelAdmin):
+    list_display    = ["evento", "estado", "destinatarios", "correos", "creada_en"]
+    list_filter     = ["estado"]
+    readonly_fields = ["cursor", "destinatarios", "correos", "error", "creada_en", "actualizada"]
+
+
+@admin.register(RecordatorioEnviado)
+class RecordatorioEnviadoAdmin(admin.ModelAdmin):
+    list_display    = ["usuario", "evento", "fecha", "enviado_en"]
+    search_fields   = ["usuario__correo", "evento__titulo"]
+    raw_id_fields   = ["usuario", "evento"]
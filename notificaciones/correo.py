@@ -0,0 +1,40 @@
+"""
+notificaciones/correo.py
+
+Envío de correos en lote por una sola conexión SMTP.
+
+    with conexion() as c:          → abre la sesión una vez
+        enviar(c, mensajes)        → send_messages() de a NOTIFICACIONES_LOTE
+
+Con EMAIL_BACKEND de locmem (tests) o consola (desarrollo) funciona igual.
+Si NOTIFICACIONES_CORREO está apagado, conexion() devuelve None y enviar()
+no hace nada: solo se llena la bandeja.
+"""
+
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+
+def mensaje(correo, asunto, cuerpo):
+    return EmailMessage(subject=asunto, body=cuerpo, from_email=settings.DEFAULT_FROM_EMAIL, to=[correo])
+
+
+@contextmanager
+def conexion():
+    if not settings.NOTIFICACIONES_CORREO:
+        yield None
+        return
+    with get_connection() as c:
+        yield c
+
+
+def enviar(c, mensajes):
+    """Cuántos se enviaron. Los errores del servidor se propagan."""
+    if c is None or not mensajes:
+        return 0
+    enviados = 0
+    for i in range(0, len(mensajes), settings.NOTIFICACIONES_LOTE):
+        enviados += c.send_messages(mensajes[i:i + settings.NOTIFICACIONES_LOTE]) or 0
+    return enviados
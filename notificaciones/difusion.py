@@ -0,0 +1,119 @@
+"""
+notificaciones/difusion.py
+
+Reparto de "evento nuevo" a los usuarios interesados en su categoría.
+
+    encolar(evento)   → crea la Difusion y la programa en el pool de
+                        archivos/cola.py (corre al terminar el request: el
+                        POST que crea el evento cuesta un INSERT más, sin
+                        importar cuántos usuarios coincidan)
+    difundir(pk)      → recorre los interesados por lotes
+
+Cada lote de NOTIFICACIONES_LOTE destinatarios:
+    1. un SELECT por rango sobre el índice (categoria, usuario) de Interes,
+       a partir de Difusion.cursor (paginación por llave, sin OFFSET)
+    2. bulk_create de las Notificacion de la bandeja y avance del cursor,
+       en una transacción
+    3. los correos del lote por la misma conexión SMTP, abierta una vez
+       para toda la difusión (notificaciones/correo.py)
+
+El cursor se confirma antes de mandar el lote de correos: si el proceso
+muere a mitad, `manage.py difundir_eventos` retoma desde el siguiente lote
+sin repetir correos; la bandeja no se duplica por la restricción única.
+
+update() no toca los auto_now: cada escritura de la Difusion pone
+`actualizada` a mano, que hace de latido para `difundir_eventos --atascadas`.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from archivos.cola import programar
+from usuarios.models import Interes
+from .correo import conexion, enviar, mensaje
+from .models import Difusion, Notificacion
+
+logger = logging.getLogger(__name__)
+
+Estado = Difusion.Estado
+
+
+def encolar(evento):
+    if evento.categoria_id is None:
+        return None
+    difusion = Difusion.objects.create(evento=evento)
+    programar(difundir, difusion.pk)
+    return difusion
+
+
+def _destinatarios(evento, cursor):
+    return list(
+        Interes.objects
+        .filter(categoria_id=evento.categoria_id, usuario_id__gt=cursor, usuario__is_active=True)
+        .exclude(usuario_id=evento.creado_por_id)
+        .order_by("usuario_id")
+        .values_list("usuario_id", "usuario__correo", "usuario__nombres")
+        [: settings.NOTIFICACIONES_LOTE]
+    )
+
+
+def _textos(evento):
+    titulo  = f"Nuevo evento: {evento.titulo}"
+    mensaje = f"{evento.titulo} — {evento.fecha:%d/%m/%Y %H:%M} en {evento.lugar}, {evento.ciudad}."
+    return titulo, mensaje
+
+
+def difundir(pk):
+    """Reparte la Difusion `pk`. Devuelve la difusión actualizada."""
+    tomada = Difusion.objects.filter(pk=pk, estado__in=[Estado.PENDIENTE, Estado.ERROR]).update(
+        estado=Estado.ENVIANDO, actualizada=timezone.now(),
+    )
+    difusion = Difusion.objects.select_related("evento").get(pk=pk)
+    if not tomada:
+        return difusion
+
+    evento = difusion.evento
+    titulo, texto = _textos(evento)
+    try:
+        with conexion() as c:
+            while lote := _destinatarios(evento, difusion.cursor):
+                with transaction.atomic():
+                    Notificacion.objects.bulk_create(
+                        [
+                            Notificacion(
+                                usuario_id=usuario_id, evento=evento,
+                                tipo=Notificacion.Tipo.EVENTO_NUEVO, titulo=titulo, mensaje=texto,
+                            )
+                            for usuario_id, _, _ in lote
+                        ],
+                        ignore_conflicts=True,
+                    )
+                    difusion.cursor = lote[-1][0]
+                    Difusion.objects.filter(pk=pk).update(
+                        cursor=difusion.cursor, destinatarios=F("destinatarios") + len(lote),
+                        actualizada=timezone.now(),
+                    )
+                enviados = enviar(c, [
+                    mensaje(correo, titulo, f"Hola, {nombres}:\n\n{texto}")
+                    for _, correo, nombres in lote if correo
+                ])
+                if enviados:
+                    Difusion.objects.filter(pk=pk).update(
+                        correos=F("correos") + enviados, actualizada=timezone.now(),
+                    )
+    except Exception as exc:
+        logger.exception("Difusión %s falló", pk)
+        Difusion.objects.filter(pk=pk).update(
+            estado=Estado.ERROR, error=str(exc), actualizada=timezone.now(),
+        )
+    else:
+        Difusion.objects.filter(pk=pk).update(
+            estado=Estado.LISTA, error="", actualizada=timezone.now(),
+        )
+
+    difusion.refresh_from_db()
+    return difusion
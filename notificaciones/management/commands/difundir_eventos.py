@@ -0,0 +1,53 @@
+"""
+notificaciones/management/commands/difundir_eventos.py
+
+Retoma las difusiones de eventos nuevos que quedaron sin terminar (el
+proceso se reinició, o falló el servidor de correo). Continúan desde su
+cursor: los usuarios ya notificados no reciben nada de nuevo.
+
+    python manage.py difundir_eventos                 → PENDIENTE y ERROR
+    python manage.py difundir_eventos --atascadas 30  → además ENVIANDO de hace más de 30 min
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from notificaciones.difusion import difundir
+from notificaciones.models import Difusion
+
+Estado = Difusion.Estado
+
+
+class Command(BaseCommand):
+    help = "Termina de repartir las notificaciones de eventos nuevos."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--atascadas", type=int, metavar="MINUTOS",
+            help="Reintentar también las que llevan más de MINUTOS en ENVIANDO.",
+        )
+
+    def handle(self, *args, **opts):
+        if opts["atascadas"] is not None:
+            limite = timezone.now() - timedelta(minutes=opts["atascadas"])
+            Difusion.objects.filter(estado=Estado.ENVIANDO, actualizada__lt=limite).update(
+                estado=Estado.PENDIENTE, actualizada=timezone.now(),
+            )
+
+        pks = list(
+            Difusion.objects
+            .filter(estado__in=[Estado.PENDIENTE, Estado.ERROR])
+            .order_by("creada_en")
+            .values_list("pk", flat=True)
+        )
+        listas = 0
+        for pk in pks:
+            difusion = difundir(pk)
+            if difusion.estado == Estado.LISTA:
+                listas += 1
+            else:
+                self.stderr.write(f"{difusion.evento}: {difusion.error}")
+
+        self.stdout.write(self.style.SUCCESS(f"{listas} de {len(pks)} difusiones terminadas."))
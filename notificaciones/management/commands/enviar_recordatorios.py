@@ -0,0 +1,37 @@
+"""
+notificaciones/management/commands/enviar_recordatorios.py
+
+Planificador de recordatorios de eventos guardados (ver
+notificaciones/recordatorios.py). Pensado para un cron cada pocos minutos;
+--intervalo debe ser al menos la frecuencia del cron para no dejar huecos.
+
+    python manage.py enviar_recordatorios [--intervalo 10]
+
+Las repeticiones de los eventos recurrentes salen de OcurrenciaEvento, cuya
+ventana corre hacia adelante `regenerar_agenda` (otro Cron Job, a diario;
+ver render.yaml).
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from notificaciones.recordatorios import enviar_recordatorios
+
+
+class Command(BaseCommand):
+    help = "Envía los recordatorios de eventos guardados que vencen antes de la próxima corrida."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--intervalo", type=int, default=10, metavar="MINUTOS",
+            help="Minutos hasta la próxima corrida (por defecto 10).",
+        )
+
+    def handle(self, *args, **opts):
+        resultado = enviar_recordatorios(timedelta(minutes=opts["intervalo"]))
+        if resultado is None:
+            self.stderr.write("Otra corrida está en curso; no se hizo nada.")
+            return
+        registrados, correos = resultado
+        self.stdout.write(self.style.SUCCESS(f"{registrados} recordatorios, {correos} correos enviados."))
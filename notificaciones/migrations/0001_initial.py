@@ -0,0 +1,57 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('eventos', '0009_evento_actualizado_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Difusion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('ENVIANDO', 'Enviando'), ('LISTA', 'Lista'), ('ERROR', 'Error')], db_index=True, default='PENDIENTE', max_length=10)),
+                ('cursor', models.BigIntegerField(default=0, help_text='Último usuario_id ya notificado')),
+                ('destinatarios', models.PositiveIntegerField(default=0)),
+                ('correos', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('creada_en', models.DateTimeField(auto_now_add=True)),
+                ('actualizada', models.DateTimeField(auto_now=True)),
+                ('evento', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='difusion', to='eventos.evento')),
+            ],
+            options={
+                'verbose_name': 'Difusión',
+                'verbose_name_plural': 'Difusiones',
+                'ordering': ['-creada_en'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Notificacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('EVENTO_NUEVO', 'Evento nuevo')], max_length=20)),
+                ('titulo', models.CharField(max_length=200)),
+                ('mensaje', models.TextField(blank=True)),
+                ('leida', models.BooleanField(default=False)),
+                ('creada', models.DateTimeField(auto_now_add=True)),
+                ('evento', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notificaciones', to='eventos.evento')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notificaciones', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notificación',
+                'verbose_name_plural': 'Notificaciones',
+                'ordering': ['-creada', '-id'],
+                'indexes': [models.Index(fields=['usuario', '-creada'], name='notificacion_bandeja_idx')],
+                'constraints': [models.UniqueConstraint(fields=('usuario', 'evento', 'tipo'), name='notificacion_unica')],
+            },
+        ),
+    ]
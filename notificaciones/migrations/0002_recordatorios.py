@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventos', '0009_evento_actualizado_idx'),
+        ('notificaciones', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecordatorioEnviado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateTimeField(help_text='Ocurrencia recordada')),
+                ('enviado_en', models.DateTimeField(auto_now_add=True)),
+                ('evento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='eventos.evento')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Recordatorio enviado',
+                'verbose_name_plural': 'Recordatorios enviados',
+                'indexes': [models.Index(fields=['fecha'], name='recordatorio_fecha_idx')],
+                'constraints': [models.UniqueConstraint(fields=('usuario', 'evento', 'fecha'), name='recordatorio_unico')],
+            },
+        ),
+    ]
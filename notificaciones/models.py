@@ -0,0 +1,95 @@
+"""
+notificaciones/models.py
+
+Bandeja de notificaciones de cada usuario y las difusiones que la llenan.
+
+Al publicar un evento se crea una Difusion; notificaciones/difusion.py la
+reparte en segundo plano entre los usuarios interesados en su categoría
+(una Notificacion por usuario y, si hay correo configurado, un email).
+
+RecordatorioEnviado es el registro de los recordatorios de eventos
+guardados que ya salieron (notificaciones/recordatorios.py).
+"""
+
+from django.conf import settings
+from django.db import models
+
+
+class Notificacion(models.Model):
+
+    class Tipo(models.TextChoices):
+        EVENTO_NUEVO = "EVENTO_NUEVO", "Evento nuevo"
+
+    usuario = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notificaciones",
+    )
+    evento  = models.ForeignKey(
+        "eventos.Evento", on_delete=models.CASCADE, related_name="notificaciones",
+        null=True, blank=True,
+    )
+    tipo    = models.CharField(max_length=20, choices=Tipo.choices)
+    titulo  = models.CharField(max_length=200)
+    mensaje = models.TextField(blank=True)
+    leida   = models.BooleanField(default=False)
+    creada  = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = "Notificación"
+        verbose_name_plural = "Notificaciones"
+        ordering            = ["-creada", "-id"]
+        constraints         = [
+            # Retomar una difusión a medias no duplica la bandeja
+            models.UniqueConstraint(fields=["usuario", "evento", "tipo"], name="notificacion_unica"),
+        ]
+        indexes             = [models.Index(fields=["usuario", "-creada"], name="notificacion_bandeja_idx")]
+
+    def __str__(self):
+        return f"{self.usuario} — {self.titulo}"
+
+
+class Difusion(models.Model):
+    """Reparto pendiente de la notificación de un evento nuevo."""
+
+    class Estado(models.TextChoices):
+        PENDIENTE = "PENDIENTE", "Pendiente"
+        ENVIANDO  = "ENVIANDO",  "Enviando"
+        LISTA     = "LISTA",     "Lista"
+        ERROR     = "ERROR",     "Error"
+
+    evento        = models.OneToOneField("eventos.Evento", on_delete=models.CASCADE, related_name="difusion")
+    estado        = models.CharField(max_length=10, choices=Estado.choices, default=Estado.PENDIENTE, db_index=True)
+    cursor        = models.BigIntegerField(default=0, help_text="Último usuario_id ya notificado")
+    destinatarios = models.PositiveIntegerField(default=0)
+    correos       = models.PositiveIntegerField(default=0)
+    error         = models.TextField(blank=True)
+    creada_en     = models.DateTimeField(auto_now_add=True)
+    actualizada   = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name        = "Difusión"
+        verbose_name_plural = "Difusiones"
+        ordering            = ["-creada_en"]
+
+    def __str__(self):
+        return f"{self.evento} [{self.estado}]"
+
+
+class RecordatorioEnviado(models.Model):
+    """Un recordatorio por usuario y ocurrencia: el planificador no lo repite."""
+
+    usuario    = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    evento     = models.ForeignKey("eventos.Evento", on_delete=models.CASCADE, related_name="+")
+    fecha      = models.DateTimeField(help_text="Ocurrencia recordada")
+    enviado_en = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = "Recordatorio enviado"
+        verbose_name_plural = "Recordatorios enviados"
+        constraints         = [
+            models.UniqueConstraint(fields=["usuario", "evento", "fecha"], name="recordatorio_unico"),
+        ]
+        # La poda borra por fecha lo que ya pasó
+        indexes             = [models.Index(fields=["fecha"], name="recordatorio_fecha_idx")]
+
+    def __str__(self):
+        return f"{self.usuario} → {self.evento} ({self.fecha:%d/%m/%Y %H:%M})"
@@ -0,0 +1,103 @@
+"""
+notificaciones/recordatorios.py
+
+Recordatorios por correo de los eventos guardados (EventoGuardado).
+
+Cada ocurrencia del evento (fecha principal, repeticiones y fechas
+adicionales, ver eventos/agenda.py) genera un recordatorio para cada
+usuario que lo guardó, RECORDATORIO_ANTICIPACION_HORAS antes.
+
+`manage.py enviar_recordatorios` corre cada pocos minutos y llama a
+enviar_recordatorios(intervalo):
+    0. extender_ventana(): si el cron de regenerar_agenda no corrió y la
+       ventana de recurrencias ya no llega a la fecha del recordatorio, se
+       regeneran los eventos recurrentes atrasados (con la ventana al día,
+       una consulta vacía).
+    1. pendientes(): las ocurrencias en [ahora, ahora + anticipación +
+       intervalo) por el índice (fecha, evento) de OcurrenciaEvento, unidas
+       a quienes guardaron el evento y sin fila en RecordatorioEnviado
+       (NOT EXISTS contra su índice único). El costo depende de cuántos
+       recordatorios vencen en la ventana, no del total de guardados.
+    2. por lotes de NOTIFICACIONES_LOTE: bulk_create del registro (se
+       confirma antes de mandar, así un fallo a mitad no repite correos) y
+       send_messages() por una sola conexión SMTP para toda la corrida.
+    3. poda del registro de ocurrencias que ya pasaron.
+
+Guardar un evento a menos de `anticipación` de su fecha también tiene
+recordatorio: la ventana empieza en `ahora`, no en ahora + anticipación.
+Un candado en la caché compartida evita que dos corridas se solapen.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from eventos.agenda import extender_ventana
+from eventos.models import OcurrenciaEvento
+from .correo import conexion, enviar, mensaje
+from .models import RecordatorioEnviado
+
+CANDADO = "notificaciones:recordatorios:candado"
+
+
+def pendientes(ahora, hasta, limite):
+    enviado = RecordatorioEnviado.objects.filter(
+        usuario_id=OuterRef("usuario_id"), evento_id=OuterRef("evento_id"), fecha=OuterRef("fecha"),
+    )
+    return list(
+        OcurrenciaEvento.objects
+        .filter(fecha__gte=ahora, fecha__lt=hasta, evento__guardado_por__usuario__is_active=True)
+        .annotate(
+            usuario_id=F("evento__guardado_por__usuario_id"),
+            correo=F("evento__guardado_por__usuario__correo"),
+            nombres=F("evento__guardado_por__usuario__nombres"),
+        )
+        .exclude(Exists(enviado))
+        .order_by("fecha", "pk")
+        .values_list("usuario_id", "evento_id", "fecha", "correo", "nombres", "evento__titulo", "evento__lugar")
+        [:limite]
+    )
+
+
+def _mensaje(correo, nombres, fecha, titulo, lugar):
+    fecha = timezone.localtime(fecha)
+    return mensaje(
+        correo,
+        f"Recordatorio: {titulo}",
+        f"Hola, {nombres}:\n\n{titulo} es el {fecha:%d/%m/%Y} a las {fecha:%H:%M} en {lugar}.",
+    )
+
+
+def enviar_recordatorios(intervalo=timedelta(minutes=10), ahora=None):
+    """
+    Envía los recordatorios que vencen antes de la próxima corrida.
+    Devuelve (registrados, correos), o None si otra corrida está en curso.
+    """
+    ahora = ahora or timezone.now()
+    hasta = ahora + timedelta(hours=settings.RECORDATORIO_ANTICIPACION_HORAS) + intervalo
+    if not caches["compartida"].add(CANDADO, 1, timeout=15 * 60):
+        return None
+
+    registrados = correos = 0
+    try:
+        extender_ventana(hasta)
+        with conexion() as c:
+            while lote := pendientes(ahora, hasta, settings.NOTIFICACIONES_LOTE):
+                with transaction.atomic():
+                    RecordatorioEnviado.objects.bulk_create(
+                        [RecordatorioEnviado(usuario_id=u, evento_id=e, fecha=f) for u, e, f, *_ in lote],
+                        ignore_conflicts=True,
+                    )
+                registrados += len(lote)
+                correos += enviar(c, [
+                    _mensaje(correo, nombres, fecha, titulo, lugar)
+                    for _, _, fecha, correo, nombres, titulo, lugar in lote if correo
+                ])
+        RecordatorioEnviado.objects.filter(fecha__lt=ahora).delete()
+    finally:
+        caches["compartida"].delete(CANDADO)
+    return registrados, correos
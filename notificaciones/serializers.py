@@ -0,0 +1,18 @@
+"""
+notificaciones/serializers.py
+"""
+
+from rest_framework import serializers
+from .models import Notificacion
+
+
+class NotificacionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model  = Notificacion
+        fields = ["id", "tipo", "titulo", "mensaje", "evento", "leida", "creada"]
+        read_only_fields = fields
+
+
+class MarcarLeidasSerializer(serializers.Serializer):
+    """Sin `ids` se marcan todas."""
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False)
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from eventos.models import Categoria, Evento, OcurrenciaEvento
+from usuarios.models import EventoGuardado, Interes, Usuario
+from . import correo, difusion
+from .recordatorios import enviar_recordatorios
+from .models import Difusion, Notificacion
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    NOTIFICACIONES_CORREO=True,
+    NOTIFICACIONES_LOTE=3,
+)
+class DifusionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categoria = Categoria.objects.create(nombre="Teatro", slug="teatro")
+        otra          = Categoria.objects.create(nombre="Danza", slug="danza")
+        cls.autor     = Usuario.objects.create_user("autor@ruedo.test", "clave", nombres="Autor", apellidos="X")
+        cls.usuarios  = [
+            Usuario.objects.create_user(f"u{i}@ruedo.test", "clave", nombres=f"U{i}", apellidos="X")
+            for i in range(7)
+        ]
+        Interes.objects.bulk_create(
+            [Interes(usuario=u, categoria=cls.categoria) for u in cls.usuarios + [cls.autor]]
+            + [Interes(usuario=cls.usuarios[0], categoria=otra)]
+        )
+        cls.evento = Evento.objects.create(
+            titulo="Función", categoria=cls.categoria, fecha=timezone.now() + timedelta(days=3),
+            lugar="Teatro", creado_por=cls.autor,
+        )
+
+    def _difusion(self, **campos):
+        return Difusion.objects.create(evento=self.evento, **campos)
+
+    def test_reparte_por_lotes(self):
+        pk = self._difusion().pk
+        with mock.patch.object(difusion, "enviar", wraps=correo.enviar) as enviar:
+            resultado = difusion.difundir(pk)
+
+        self.assertEqual(resultado.estado, Difusion.Estado.LISTA)
+        self.assertEqual([len(llamada.args[1]) for llamada in enviar.call_args_list], [3, 3, 1])
+        self.assertEqual(resultado.destinatarios, 7)
+        self.assertEqual(resultado.correos, 7)
+        self.assertEqual(resultado.cursor, self.usuarios[-1].pk)
+
+    def test_bandeja_en_lote(self):
+        pk = self._difusion().pk
+        with CaptureQueriesContext(connection) as consultas:
+            difusion.difundir(pk)
+
+        # Un INSERT por lote de 3, no uno por usuario
+        inserts = [c for c in consultas if c["sql"].startswith("INSERT") and "notificacion" in c["sql"]]
+        self.assertEqual(len(inserts), 3)
+
+        bandeja = Notificacion.objects.filter(evento=self.evento)
+        self.assertEqual(
+            set(bandeja.values_list("usuario_id", flat=True)),
+            {u.pk for u in self.usuarios},
+        )
+        self.assertFalse(bandeja.filter(usuario=self.autor).exists())
+
+    def test_una_conexion_por_difusion(self):
+        pk = self._difusion().pk
+        with mock.patch.object(correo, "get_connection", wraps=correo.get_connection) as abrir:
+            difusion.difundir(pk)
+
+        self.assertEqual(abrir.call_count, 1)
+        self.assertEqual(len(mail.outbox), 7)
+        self.assertEqual(
+            sorted(m.to[0] for m in mail.outbox),
+            sorted(u.correo for u in self.usuarios),
+        )
+
+    def test_retoma_desde_el_cursor(self):
+        corte = self.usuarios[3].pk
+        pk    = self._difusion(estado=Difusion.Estado.ERROR, cursor=corte, destinatarios=4).pk
+        resultado = difusion.difundir(pk)
+
+        self.assertEqual(resultado.estado, Difusion.Estado.LISTA)
+        self.assertEqual(resultado.destinatarios, 7)
+        self.assertEqual(
+            sorted(m.to[0] for m in mail.outbox),
+            sorted(u.correo for u in self.usuarios if u.pk > corte),
+        )
+
+    def test_no_repite_una_difusion_terminada(self):
+        pk = self._difusion().pk
+        difusion.difundir(pk)
+        difusion.difundir(pk)
+
+        self.assertEqual(len(mail.outbox), 7)
+        self.assertEqual(Notificacion.objects.filter(evento=self.evento).count(), 7)
+
+    def test_atascadas_usa_el_latido(self):
+        pk = self._difusion(estado=Difusion.Estado.ENVIANDO).pk
+        call_command("difundir_eventos", atascadas=30, stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(Difusion.objects.get(pk=pk).estado, Difusion.Estado.ENVIANDO)
+
+        Difusion.objects.filter(pk=pk).update(actualizada=timezone.now() - timedelta(hours=1))
+        call_command("difundir_eventos", atascadas=30, stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(Difusion.objects.get(pk=pk).estado, Difusion.Estado.LISTA)
+        self.assertEqual(len(mail.outbox), 7)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", RECORDATORIO_ANTICIPACION_HORAS=24)
+class RecordatoriosTests(TestCase):
+
+    def test_extiende_una_ventana_vencida(self):
+        # Semanal desde hace 60 semanas: la repetición de mañana sale de la recurrencia
+        manana = timezone.now() + timedelta(hours=12)
+        evento = Evento.objects.create(
+            titulo="Ronda", fecha=manana - timedelta(weeks=60), lugar="Teatro", recurrencia="semanal",
+        )
+        usuario = Usuario.objects.create_user("r@ruedo.test", "clave", nombres="R", apellidos="X")
+        EventoGuardado.objects.create(usuario=usuario, evento=evento)
+        # Como si regenerar_agenda no hubiera corrido desde hace un año
+        OcurrenciaEvento.objects.filter(evento=evento, fecha__gte=timezone.now()).delete()
+
+        self.assertEqual(enviar_recordatorios(), (1, 1))
+        self.assertEqual(mail.outbox[0].to, ["r@ruedo.test"])
+        self.assertTrue(evento.ocurrencias.filter(fecha__gt=manana).exists())
@@ -0,0 +1,9 @@
+"""notificaciones/urls.py"""
+
+from django.urls import path
+from .views import BandejaView, MarcarLeidasView
+
+urlpatterns = [
+    path("",        BandejaView.as_view(),      name="notificaciones"),
+    path("leidas/", MarcarLeidasView.as_view(), name="notificaciones-leidas"),
+]
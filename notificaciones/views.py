@@ -0,0 +1,36 @@
+"""
+notificaciones/views.py
+"""
+
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .models import Notificacion
+from .serializers import MarcarLeidasSerializer, NotificacionSerializer
+
+
+class BandejaView(generics.ListAPIView):
+    """GET /api/notificaciones/?leida=false — Bandeja del usuario autenticado."""
+    serializer_class   = NotificacionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        qs = Notificacion.objects.filter(usuario_id=self.request.user.pk)
+        leida = self.request.query_params.get("leida")
+        if leida in ("true", "false"):
+            qs = qs.filter(leida=leida == "true")
+        return qs
+
+
+class MarcarLeidasView(APIView):
+    """POST /api/notificaciones/leidas/ {"ids": [...]} — sin ids marca todas."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = MarcarLeidasSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        qs = Notificacion.objects.filter(usuario_id=request.user.pk, leida=False)
+        if "ids" in serializer.validated_data:
+            qs = qs.filter(pk__in=serializer.validated_data["ids"])
+        return Response({"marcadas": qs.update(leida=True)})
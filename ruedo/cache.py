@@ -0,0 +1,145 @@
+"""
+ruedo/cache.py
+
+Caché de respuestas para los GET públicos (list/retrieve) de las apps de contenido.
+
+Dos niveles, ambos configurados en CACHES (settings.py):
+    "default"     → LocMemCache acotado (LRU en memoria de cada worker)
+    "compartida"  → caché visible por todos los workers de gunicorn
+
+La invalidación es por versión: cada grupo ("eventos", "noticias", ...) tiene
+un token de versión en la caché compartida que forma parte de la llave.
+Al guardar o borrar un modelo del grupo se cambia el token y todas las
+respuestas anteriores quedan huérfanas (expiran solas por TTL / LRU).
+
+Uso en un ViewSet:
+    class EventoViewSet(CacheRespuestaMixin, viewsets.ModelViewSet):
+        cache_grupo = "eventos"
+
+Y en AppConfig.ready():
+    registrar_invalidacion(Evento, "eventos")
+
+Ojo: update()/bulk_create() no disparan señales; quien los use debe llamar
+a invalidar_grupos() a mano.
+"""
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from rest_framework.response import Response
+
+
+def _local():
+    return caches["default"]
+
+
+def _compartida():
+    return caches["compartida"]
+
+
+def _llave_version(grupo):
+    return f"ruedo:version:{grupo}"
+
+
+def version_grupo(grupo):
+    """Token de versión actual del grupo (lo crea si no existe)."""
+    llave   = _llave_version(grupo)
+    version = _compartida().get(llave)
+    if version is None:
+        _compartida().add(llave, uuid.uuid4().hex, None)
+        version = _compartida().get(llave)
+    return version
+
+
+def _bump(grupos):
+    for grupo in grupos:
+        # Token aleatorio (no contador): si la llave se pierde, nunca
+        # se reutiliza una versión vieja que siga viva en algún worker.
+        _compartida().set(_llave_version(grupo), uuid.uuid4().hex, None)
+
+
+def invalidar_grupos(*grupos):
+    """
+    Cambia la versión de los grupos cuando la transacción actual confirme.
+    Un on_commit por llamada: si la llamada ocurrió dentro de un savepoint
+    que se revierte, Django descarta su callback junto con lo demás.
+    """
+    grupos = frozenset(grupos)
+    transaction.on_commit(lambda: _bump(grupos))
+
+
+def leer(llave):
+    """Busca en la caché local y luego en la compartida (y sube el valor a la local)."""
+    valor = _local().get(llave)
+    if valor is None:
+        valor = _compartida().get(llave)
+        if valor is not None:
+            _local().set(llave, valor, settings.RESPUESTAS_CACHE_TTL)
+    return valor
+
+
+def guardar(llave, valor):
+    _local().set(llave, valor, settings.RESPUESTAS_CACHE_TTL)
+    _compartida().set(llave, valor, settings.RESPUESTAS_CACHE_TTL)
+
+
+def registrar_invalidacion(modelo, *grupos):
+    """Conecta post_save/post_delete del modelo a invalidar_grupos()."""
+    def _receptor(sender, **kwargs):
+        invalidar_grupos(*grupos)
+
+    uid = f"ruedo-cache-{modelo._meta.label}"
+    post_save.connect(_receptor, sender=modelo, weak=False, dispatch_uid=uid)
+    post_delete.connect(_receptor, sender=modelo, weak=False, dispatch_uid=uid)
+
+
+def clase_rol(user):
+    if not user or not user.is_authenticated:
+        return "ANONIMO"
+    return user.rol
+
+
+class CacheRespuestaMixin:
+    """
+    Cachea los datos serializados de list/retrieve.
+    La llave incluye esquema y host (los links next/previous de la
+    paginación son absolutos), ruta, query params normalizados y el rol
+    del usuario (un Cuentero ve borradores que un anónimo no ve).
+    """
+    cache_grupo = None
+
+    def list(self, request, *args, **kwargs):
+        return self._respuesta_cacheada(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._respuesta_cacheada(request, super().retrieve, *args, **kwargs)
+
+    def _llave_respuesta(self, request):
+        # Una vez por request: la versión del grupo es una lectura a la caché compartida
+        if getattr(self, "_llave_cacheada", None) is None:
+            params = sorted(request.query_params.lists())
+            crudo  = f"{request.scheme}://{request.get_host()}{request.path}?{params!r}"
+            digest = hashlib.sha1(crudo.encode()).hexdigest()
+            self._llave_cacheada = (
+                f"ruedo:resp:{self.cache_grupo}:{version_grupo(self.cache_grupo)}"
+                f":{clase_rol(request.user)}:{digest}"
+            )
+        return self._llave_cacheada
+
+    def _respuesta_cacheada(self, request, handler, *args, **kwargs):
+        if not self.cache_grupo:
+            return handler(request, *args, **kwargs)
+
+        llave = self._llave_respuesta(request)
+        datos = leer(llave)
+        if datos is not None:
+            return Response(datos)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            guardar(llave, response.data)
+        return response
@@ -0,0 +1,148 @@
+"""
+ruedo/condicional.py
+
+GET condicional (ETag / Last-Modified → 304) para list y retrieve.
+
+Los validadores salen de una sola consulta barata, sin serializar nada:
+    retrieve → timestamp `condicional_campo` del objeto (ETag y Last-Modified)
+    list     → MAX(condicional_campo) + COUNT(*) del queryset filtrado, solo
+               en el ETag: borrar una fila baja el COUNT pero no el MAX, así
+               que un If-Modified-Since respondería 304 con la fila borrada
+Si la vista usa CacheRespuestaMixin, el par (ETag, Last-Modified) se guarda
+junto a la respuesta cacheada (misma llave y versión de grupo): con la caché
+caliente no se consulta la base, haya o no cabeceras condicionales.
+
+Para que el cambio de un hijo anidado (fechas_adicionales, bloques) cambie
+el validador del padre, registrar_toque() actualiza el timestamp del padre
+cada vez que el hijo se guarda o se borra.
+
+Uso en un ViewSet:
+    class EventoViewSet(CondicionalMixin, ..., viewsets.ModelViewSet):
+        condicional_campo = "actualizado"
+"""
+
+import hashlib
+import threading
+from contextlib import contextmanager
+
+from django.db.models import Count, Max
+from django.db.models.signals import post_save, pre_delete
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from ruedo.cache import clase_rol, guardar, leer
+
+
+_estado = threading.local()
+
+
+@contextmanager
+def sin_toques():
+    """
+    Suspende los toques automáticos al padre (timestamp, reindexado) dentro
+    del bloque. Para escrituras en lote que tocan al padre una sola vez al
+    final (ver eventos/fechas.py, noticias/bloques.py).
+    """
+    previo = getattr(_estado, "suspendido", False)
+    _estado.suspendido = True
+    try:
+        yield
+    finally:
+        _estado.suspendido = previo
+
+
+def toques_suspendidos():
+    return getattr(_estado, "suspendido", False)
+
+
+def registrar_toque(modelo, destino, campo):
+    """
+    Al guardar o borrar una instancia de `modelo`, pone `campo = now()`
+    en las filas de destino(instance) (un queryset) con un solo UPDATE.
+    """
+    def _tocar(sender, instance, **kwargs):
+        if toques_suspendidos():
+            return
+        destino(instance).update(**{campo: timezone.now()})
+
+    uid = f"ruedo-toque-{modelo._meta.label}"
+    post_save.connect(_tocar, sender=modelo, weak=False, dispatch_uid=uid)
+    pre_delete.connect(_tocar, sender=modelo, weak=False, dispatch_uid=uid)
+
+
+class CondicionalMixin:
+    condicional_campo = None
+
+    def list(self, request, *args, **kwargs):
+        if not self.condicional_campo:
+            return super().list(request, *args, **kwargs)
+        return self._condicional(request, self._resumen_list, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.condicional_campo:
+            return super().retrieve(request, *args, **kwargs)
+        return self._condicional(request, self._resumen_retrieve, super().retrieve, *args, **kwargs)
+
+    # ── Validadores ──
+
+    def _resumen_list(self, **kwargs):
+        resumen = self.filter_queryset(self.get_queryset()).aggregate(
+            ultimo=Max(self.condicional_campo), filas=Count("pk"),
+        )
+        return resumen["ultimo"], resumen["filas"]
+
+    def _resumen_retrieve(self, **kwargs):
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        ultimo = (
+            self.filter_queryset(self.get_queryset())
+            .filter(**{self.lookup_field: lookup})
+            .values_list(self.condicional_campo, flat=True)
+            .first()
+        )
+        # No existe o no es visible: que el flujo normal responda 404
+        return None if ultimo is None else (ultimo, lookup)
+
+    def _validadores(self, request, resumen, **kwargs):
+        """(etag, last_modified), o None si el objeto no existe."""
+        llave = None
+        if getattr(self, "cache_grupo", None) and hasattr(self, "_llave_respuesta"):
+            llave = f"{self._llave_respuesta(request)}:validadores"
+            guardados = leer(llave)
+            if guardados is not None:
+                return guardados
+
+        datos = resumen(**kwargs)
+        if datos is None:
+            return None
+        ultimo, discriminante = datos
+        crudo = "|".join([
+            request.get_full_path(),
+            clase_rol(request.user),
+            ultimo.isoformat() if ultimo else "",
+            str(discriminante),
+        ])
+        validadores = (
+            quote_etag(hashlib.sha1(crudo.encode()).hexdigest()),
+            int(ultimo.timestamp()) if ultimo and resumen == self._resumen_retrieve else None,
+        )
+        if llave:
+            guardar(llave, validadores)
+        return validadores
+
+    def _condicional(self, request, resumen, handler, *args, **kwargs):
+        validadores = self._validadores(request, resumen, **kwargs)
+        if validadores is None:
+            return handler(request, *args, **kwargs)
+        etag, last_modified = validadores
+
+        no_modificado = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if no_modificado is not None:
+            return no_modificado
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
@@ -0,0 +1,155 @@
+"""
+ruedo/media.py
+
+Vista que sirve MEDIA_ROOT cuando no hay un servidor web delante
+(LocalStorage, o los archivos pendientes/ y subidos/ de archivos/cola.py).
+
+A diferencia de django.views.static.serve:
+    - Range: bytes=… → 206 con el tramo pedido (416 si no se puede
+      satisfacer), para poder adelantar audio y video sin descargarlo todo.
+      If-Range se respeta; varios rangos en una petición se responden
+      con el archivo completo (200), como permite el RFC 9110.
+    - ETag (tamaño + mtime) y Last-Modified → 304.
+    - FileResponse: con gunicorn el cuerpo sale por sendfile(2) desde el
+      descriptor del archivo (Content-Length acota el tramo); sin
+      wsgi.file_wrapper se lee por bloques sin pasar del tramo.
+    - Cache-Control público por MEDIA_CACHE_SEGUNDOS.
+
+Se monta en ruedo/urls.py si MEDIA_SERVIR está activo.
+"""
+
+import mimetypes
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views.decorators.http import require_safe
+
+# Cargas reanudables a medio subir (archivos/cargas.py): no son públicas
+NO_SERVIR = ("cargas/",)
+
+RANGO = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _Tramo:
+    """
+    Vista de solo lectura de [inicio, inicio + largo) de un archivo abierto.
+    fileno() expone el descriptor ya posicionado para sendfile; read() no
+    pasa del final del tramo cuando el servidor itera por bloques.
+    """
+
+    def __init__(self, archivo, inicio, largo):
+        self.archivo  = archivo
+        self.restante = largo
+        self.name     = archivo.name
+        archivo.seek(inicio)
+
+    def read(self, n=-1):
+        if self.restante <= 0:
+            return b""
+        n = self.restante if n is None or n < 0 else min(n, self.restante)
+        datos = self.archivo.read(n)
+        self.restante -= len(datos)
+        return datos
+
+    def fileno(self):
+        return self.archivo.fileno()
+
+    def close(self):
+        self.archivo.close()
+
+
+def _rango(cabecera, tamano):
+    """
+    (inicio, fin) inclusivo del Range, None si no hay que aplicarlo (ausente,
+    mal formado o con varios rangos) y False si no se puede satisfacer.
+    """
+    coincidencia = RANGO.match(cabecera.strip()) if cabecera else None
+    if coincidencia is None:
+        return None
+    desde, hasta = coincidencia.groups()
+    if not desde and not hasta:
+        return None
+    if not desde:
+        # bytes=-N → los últimos N bytes
+        sufijo = int(hasta)
+        if sufijo == 0:
+            return False
+        return max(0, tamano - sufijo), tamano - 1
+    inicio = int(desde)
+    fin    = min(int(hasta), tamano - 1) if hasta else tamano - 1
+    if inicio >= tamano or fin < inicio:
+        return False
+    return inicio, fin
+
+
+def _if_range_vale(request, etag, modificado):
+    """If-Range: el Range solo aplica si el validador sigue siendo el actual."""
+    valor = request.headers.get("If-Range")
+    if not valor:
+        return True
+    if valor.startswith(('"', 'W/')):
+        return valor == etag
+    fecha = parse_http_date_safe(valor)
+    return fecha is not None and fecha >= modificado
+
+
+@require_safe
+def servir_media(request, ruta):
+    ruta = posixpath.normpath(ruta).lstrip("/")
+    if ruta.startswith(NO_SERVIR):
+        raise Http404
+    try:
+        completa = safe_join(settings.MEDIA_ROOT, ruta)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404
+    try:
+        datos = os.stat(completa)
+    except OSError:
+        raise Http404
+    if not os.path.isfile(completa):
+        raise Http404
+
+    tamano     = datos.st_size
+    modificado = int(datos.st_mtime)
+    etag       = quote_etag(f"{tamano:x}-{datos.st_mtime_ns:x}")
+
+    no_modificado = get_conditional_response(request, etag=etag, last_modified=modificado)
+    if no_modificado is not None:
+        if isinstance(no_modificado, HttpResponseNotModified):
+            patch_cache_control(no_modificado, public=True, max_age=settings.MEDIA_CACHE_SEGUNDOS)
+        return no_modificado
+
+    rango = _rango(request.headers.get("Range"), tamano)
+    if rango is not None and not _if_range_vale(request, etag, modificado):
+        rango = None
+
+    if rango is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{tamano}"
+    else:
+        inicio, fin = rango or (0, tamano - 1)
+        largo = max(0, fin - inicio + 1)
+        tipo, codificacion = mimetypes.guess_type(completa)
+        response = FileResponse(
+            _Tramo(open(completa, "rb"), inicio, largo),
+            content_type=tipo or "application/octet-stream",
+        )
+        response["Content-Length"] = largo
+        if codificacion:
+            response["Content-Encoding"] = codificacion
+        if rango:
+            response.status_code = 206
+            response["Content-Range"] = f"bytes {inicio}-{fin}/{tamano}"
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"]          = etag
+    response["Last-Modified"] = http_date(modificado)
+    patch_cache_control(response, public=True, max_age=settings.MEDIA_CACHE_SEGUNDOS)
+    return response
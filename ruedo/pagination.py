@@ -0,0 +1,128 @@
+"""
+ruedo/pagination.py
+
+Paginación global de la API.
+
+Por defecto se comporta como PageNumberPagination (?page=N, con `count`).
+Si el cliente envía ?cursor= (vacío para la primera página) y la vista
+declara `cursor_ordering`, se usa paginación por llave (keyset):
+    - No usa OFFSET: cada página filtra a partir de la última fila vista,
+      así que la página 500 cuesta lo mismo que la primera.
+    - El desempate es siempre por `id`, así el orden es estable aunque
+      varias filas compartan fecha.
+    - No calcula COUNT(*) salvo que el cliente lo pida con ?total=true.
+    - El orden es siempre `cursor_ordering`: un ?ordering= distinto o un
+      ?search= (que ordena por relevancia) junto con ?cursor= responden 400
+      en vez de devolver otro orden sin avisar; esos usan ?page=.
+
+Ejemplo en una vista:
+    cursor_ordering = "-fecha_publicacion"
+"""
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class PaginacionHibrida(PageNumberPagination):
+    cursor_query_param = "cursor"
+    total_query_param  = "total"
+    invalid_cursor_message = "Cursor inválido."
+    orden_incompatible_message = "?cursor= solo admite el orden {orden}; para ordenar o buscar, usar ?page=."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, "cursor_ordering", None)
+        self.modo_cursor = bool(ordering) and self.cursor_query_param in request.query_params
+        if not self.modo_cursor:
+            return super().paginate_queryset(queryset, request, view)
+
+        self._validar_orden(request, ordering)
+        self.request   = request
+        self.page_size = self.get_page_size(request)
+        self.campo = ordering.lstrip("-")
+        self.desc  = ordering.startswith("-")
+
+        self.total = None
+        if request.query_params.get(self.total_query_param, "").lower() in ("1", "true"):
+            self.total = queryset.count()
+
+        queryset = queryset.order_by(*self._order_by())
+        cursor = self._decode_cursor(request.query_params.get(self.cursor_query_param), queryset.model)
+        if cursor is not None:
+            queryset = queryset.filter(self._filtro_despues_de(*cursor))
+
+        # Una fila extra para saber si hay página siguiente sin contar
+        filas = list(queryset[: self.page_size + 1])
+        self.hay_siguiente = len(filas) > self.page_size
+        self.page = filas[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.modo_cursor:
+            return super().get_paginated_response(data)
+        contenido = OrderedDict()
+        if self.total is not None:
+            contenido["count"] = self.total
+        contenido["next"]    = self._next_link()
+        contenido["results"] = data
+        return Response(contenido)
+
+    # ── Keyset ──
+
+    def _validar_orden(self, request, ordering):
+        pedido = request.query_params.get(api_settings.ORDERING_PARAM, "").strip()
+        buscar = request.query_params.get(api_settings.SEARCH_PARAM, "").strip()
+        if buscar or (pedido and pedido != ordering):
+            raise serializers.ValidationError({self.cursor_query_param: self.orden_incompatible_message.format(orden=ordering)})
+
+    def _order_by(self):
+        # NULLs siempre al final, igual en SQLite y PostgreSQL
+        expr = F(self.campo).desc(nulls_last=True) if self.desc else F(self.campo).asc(nulls_last=True)
+        return [expr, "-id" if self.desc else "id"]
+
+    def _filtro_despues_de(self, valor, pk):
+        mayor_menor = "lt" if self.desc else "gt"
+        id_despues  = Q(**{f"id__{mayor_menor}": pk})
+        if valor is None:
+            # Ya estamos en la cola de NULLs: solo desempata el id
+            return Q(**{f"{self.campo}__isnull": True}) & id_despues
+        return (
+            Q(**{f"{self.campo}__{mayor_menor}": valor})
+            | (Q(**{self.campo: valor}) & id_despues)
+            | Q(**{f"{self.campo}__isnull": True})
+        )
+
+    def _next_link(self):
+        if not self.hay_siguiente:
+            return None
+        ultimo = self.page[-1]
+        valor  = getattr(ultimo, self.campo)
+        url    = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self._encode_cursor(valor, ultimo.pk))
+
+    def _encode_cursor(self, valor, pk):
+        payload = {"v": valor.isoformat() if valor is not None else None, "id": pk}
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    def _decode_cursor(self, raw, modelo):
+        """(valor, id) del cursor; `valor` ya convertido al tipo del campo de orden."""
+        if not raw:
+            return None
+        try:
+            relleno = "=" * (-len(raw) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(raw + relleno))
+            valor   = payload["v"]
+            if valor is not None:
+                valor = modelo._meta.get_field(self.campo).to_python(valor)
+            return valor, int(payload["id"])
+        except (ValueError, TypeError, KeyError, AttributeError, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
@@ -0,0 +1,31 @@
+"""
+ruedo/serializers.py
+
+Utilidades de serializers compartidas entre apps.
+"""
+
+import json
+
+from rest_framework import serializers
+
+
+class JSONAnidadoMixin:
+    """
+    Permite mandar listas anidadas (fechas_adicionales, bloques, ...) como
+    texto JSON cuando el request es multipart, que es el caso cuando además
+    se sube un archivo. Declarar en el serializer:
+        campos_json_anidados = ["bloques"]
+    """
+    campos_json_anidados = []
+
+    def to_internal_value(self, data):
+        texto = {c: data.get(c) for c in self.campos_json_anidados if isinstance(data.get(c), str)}
+        if texto:
+            # QueryDict → dict plano, para que la lista no se lea como campos HTML
+            data = {k: data.get(k) for k in data.keys()}
+            for campo, valor in texto.items():
+                try:
+                    data[campo] = json.loads(valor) if valor.strip() else []
+                except ValueError:
+                    raise serializers.ValidationError({campo: ["JSON inválido."]})
+        return super().to_internal_value(data)
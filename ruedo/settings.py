@@ -41,6 +41,9 @@ INSTALLED_APPS = [
     "eventos",
     "noticias",
     "entrevistas",
+    "busqueda",
+    "archivos",
+    "notificaciones",
 ]
 
 MIDDLEWARE = [
@@ -51,6 +54,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "archivos.middleware.RequestActualMiddleware",  # dueño de cada SubidaPendiente
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -94,10 +98,53 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # Solo desarrollo (en Render DATABASE_URL apunta a PostgreSQL). Los
+            # hilos de archivos/cola.py escriben a la par del request: con
+            # IMMEDIATE cada atomic() toma el candado de escritura al empezar y
+            # espera su turno (timeout) en vez de fallar con "database is
+            # locked" al subir de lectura a escritura. Serializa los atomic()
+            # aunque solo lean; las lecturas en autocommit no se ven afectadas.
+            # SQLITE_TRANSACCION=DEFERRED vuelve al modo por defecto de SQLite.
+            "OPTIONS": {"transaction_mode": os.getenv("SQLITE_TRANSACCION", "IMMEDIATE"), "timeout": 20},
         }
     }
 
 
+# ── Caché ──────────────────────────────────────────────────────────────────
+# "default"    → LRU en memoria de cada worker (acotada por MAX_ENTRIES).
+# "compartida" → tabla en la base de datos, la ven todos los workers de gunicorn.
+#                Requiere `python manage.py createcachetable` (ver build.sh).
+CACHES = {
+    "default": {
+        "BACKEND":  "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ruedo-local",
+        "OPTIONS":  {"MAX_ENTRIES": int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", 2000))},
+    },
+    "compartida": {
+        "BACKEND":  "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "ruedo_cache",
+        "OPTIONS":  {"MAX_ENTRIES": int(os.getenv("CACHE_COMPARTIDA_MAX_ENTRIES", 20000))},
+    },
+}
+
+# Segundos que vive una respuesta cacheada (la invalidación real es por señales)
+RESPUESTAS_CACHE_TTL = int(os.getenv("RESPUESTAS_CACHE_TTL", 300))
+# Cada cuántos segundos los contadores de popularidad cambian ETag y caché (usuarios/popularidad.py)
+POPULARIDAD_INTERVALO = float(os.getenv("POPULARIDAD_INTERVALO", 60))
+
+
+# ── Agenda ─────────────────────────────────────────────────────────────────
+# Días hacia atrás y hacia adelante en que se expanden los eventos recurrentes
+AGENDA_HORIZONTE_DIAS = int(os.getenv("AGENDA_HORIZONTE_DIAS", 365))
+# Rango máximo (en días) que se puede pedir a /api/eventos/agenda/
+AGENDA_RANGO_MAXIMO_DIAS = int(os.getenv("AGENDA_RANGO_MAXIMO_DIAS", 93))
+
+# Feed personalizado /api/eventos/para-mi/ (eventos/para_mi.py)
+FEED_TAMANO         = int(os.getenv("FEED_TAMANO", 100))
+FEED_HORIZONTE_DIAS = int(os.getenv("FEED_HORIZONTE_DIAS", 90))
+FEED_TTL_SEGUNDOS   = int(os.getenv("FEED_TTL_SEGUNDOS", 6 * 60 * 60))
+
+
 # ── Usuario personalizado ──────────────────────────────────────────────────
 AUTH_USER_MODEL = "usuarios.Usuario"
 
@@ -105,7 +152,7 @@ AUTH_USER_MODEL = "usuarios.Usuario"
 # ── DRF + JWT ──────────────────────────────────────────────────────────────
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "usuarios.tokens.JWTAutenticacionToken",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
@@ -113,7 +160,7 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "ruedo.pagination.PaginacionHibrida",
     "PAGE_SIZE": 20,
 }
 
@@ -125,8 +172,38 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "UPDATE_LAST_LOGIN": True,
     "TOKEN_OBTAIN_SERIALIZER": "usuarios.serializers.CustomTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "usuarios.serializers.CustomTokenRefreshSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "usuarios.serializers.CustomTokenBlacklistSerializer",
 }
 
+# Cuánto puede tardar un worker en notar que token_version cambió (usuarios/tokens.py)
+TOKEN_VERSION_CACHE_SEGUNDOS = int(os.getenv("TOKEN_VERSION_CACHE_SEGUNDOS", 30))
+
+# Filtro de Bloom de la lista negra de refresh tokens (usuarios/lista_negra.py)
+LISTA_NEGRA_CAPACIDAD = int(os.getenv("LISTA_NEGRA_CAPACIDAD", 100_000))
+LISTA_NEGRA_ERROR     = float(os.getenv("LISTA_NEGRA_ERROR", 0.01))
+# Cada cuánto cada worker trae las revocaciones hechas en otros workers
+LISTA_NEGRA_INTERVALO = float(os.getenv("LISTA_NEGRA_INTERVALO", 5))
+
+
+# ── Correo y notificaciones ────────────────────────────────────────────────
+EMAIL_BACKEND       = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST          = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT          = int(os.getenv("EMAIL_PORT", 587))
+EMAIL_HOST_USER     = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS       = os.getenv("EMAIL_USE_TLS", "True") == "True"
+DEFAULT_FROM_EMAIL  = os.getenv("DEFAULT_FROM_EMAIL", "El Ruedo del Cuentero <no-responder@elruedodelcuentero.com>")
+
+# Difusión de eventos nuevos (notificaciones/difusion.py): destinatarios por
+# lote y si además de la bandeja se manda correo
+NOTIFICACIONES_LOTE   = int(os.getenv("NOTIFICACIONES_LOTE", 500))
+NOTIFICACIONES_CORREO = os.getenv("NOTIFICACIONES_CORREO", "True") == "True"
+
+# Horas antes de cada ocurrencia en que sale el recordatorio de un evento
+# guardado (notificaciones/recordatorios.py)
+RECORDATORIO_ANTICIPACION_HORAS = int(os.getenv("RECORDATORIO_ANTICIPACION_HORAS", 24))
+
 
 # ── CORS ───────────────────────────────────────────────────────────────────
 CORS_ALLOWED_ORIGINS = os.getenv(
@@ -170,10 +247,47 @@ if CLOUDINARY_CLOUD_NAME:
             "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
         },
     }
+else:
+    # Sin Cloudinary: disco local, con los mismos derivados responsive (Pillow)
+    STORAGES = {
+        "default": {
+            "BACKEND": "ruedo.storage.LocalStorage",
+        },
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+        },
+    }
 
 MEDIA_URL  = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# ruedo/media.py sirve MEDIA_ROOT con Range/ETag. Desactivar si nginx u otro
+# servidor web ya lo sirve
+MEDIA_SERVIR         = os.getenv("MEDIA_SERVIR", "True") == "True"
+MEDIA_CACHE_SEGUNDOS = int(os.getenv("MEDIA_CACHE_SEGUNDOS", 24 * 60 * 60))
+
+# Subida en segundo plano (archivos/cola.py): los resource_type listados se
+# guardan primero en MEDIA_ROOT/pendientes/ y un pool de hilos los sube después
+MEDIA_SUBIDA_ASINCRONA = os.getenv("MEDIA_SUBIDA_ASINCRONA", "True") == "True"
+MEDIA_ASINCRONA_TIPOS  = ("video",)
+MEDIA_SUBIDA_WORKERS   = int(os.getenv("MEDIA_SUBIDA_WORKERS", 2))
+MEDIA_SUBIDA_REINTENTOS = int(os.getenv("MEDIA_SUBIDA_REINTENTOS", 3))
+# Al arrancar (ruedo/wsgi.py), el proceso retoma las que llevan más de estos minutos en SUBIENDO (0 = no retomar)
+MEDIA_SUBIDA_ATASCADAS = int(os.getenv("MEDIA_SUBIDA_ATASCADAS", 30))
+# archivos.subidores.SubidorLocal copia a MEDIA_ROOT/subidos/ (desarrollo y pruebas)
+MEDIA_SUBIDOR = os.getenv("MEDIA_SUBIDOR", "archivos.subidores.SubidorCloudinary")
+# Tamaño de cada parte que se envía a Cloudinary con upload_large
+MEDIA_CHUNK_CLOUDINARY = 20 * 1024 * 1024
+
+# Cargas reanudables (archivos/cargas.py)
+MEDIA_CARGA_TAMANO_MAXIMO    = int(os.getenv("MEDIA_CARGA_TAMANO_MAXIMO", 2 * 1024 ** 3))
+MEDIA_CARGA_FRAGMENTO_MAXIMO = int(os.getenv("MEDIA_CARGA_FRAGMENTO_MAXIMO", 32 * 1024 ** 2))
+
+# Forma de onda de las entrevistas (entrevistas/onda.py). MP3 y OGG se
+# decodifican con ffmpeg (el del PATH o el de imageio-ffmpeg); WAV no lo necesita
+ONDA_PICOS  = int(os.getenv("ONDA_PICOS", 1000))
+ONDA_FFMPEG = os.getenv("ONDA_FFMPEG", "ffmpeg")
+
 
 # ── Internacionalización ───────────────────────────────────────────────────
 LANGUAGE_CODE = "es-co"
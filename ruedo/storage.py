@@ -2,17 +2,68 @@
 ruedo/storage.py
 Storage backend personalizado que sube archivos a Cloudinary.
 Compatible con Django 6 sin depender de django-cloudinary-storage.
+
+Videos y audios (settings.MEDIA_ASINCRONA_TIPOS) no se suben dentro del
+request: se guardan en MEDIA_ROOT/pendientes/ y los sube archivos/cola.py.
+Mientras tanto el modelo guarda el nombre provisional "pendientes/<token>.<ext>".
+
+Cada archivo se identifica por su sha256 (archivos/contenido.py): si el
+contenido ya se subió antes se devuelve la misma URL sin subir nada, y
+delete() solo borra en Cloudinary cuando ya nadie lo referencia.
+
+LocalStorage es el equivalente en disco para desarrollo: mismo índice por
+contenido y derivados responsive reales generados con Pillow.
 """
 
 import cloudinary
 import cloudinary.uploader
-from django.core.files.storage import Storage
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import FileSystemStorage, Storage
+from django.utils.dateparse import parse_datetime
 from django.utils.deconstruct import deconstructible
 import os
+import re
+import uuid
+
+from archivos.derivados import DerivadosCloudinary, DerivadosPillow
+
+VIDEO_EXT = [".mp4", ".mov", ".avi", ".webm", ".mkv"]
+# Cloudinary trata el audio como resource_type "video"
+AUDIO_EXT = [".mp3", ".wav", ".ogg", ".oga", ".m4a", ".aac", ".flac"]
+# Prefijos de nombres que viven en MEDIA_ROOT y no en Cloudinary
+LOCALES = ("pendientes/", "subidos/")
+# Carpetas donde los upload_to de los modelos guardan archivos. Lo que está
+# fuera (subido a mano, otras apps en la misma cuenta) nunca se recolecta.
+CARPETAS = ("eventos/", "noticias/", "entrevistas/", "usuarios/")
+
+
+def tipo_de_recurso(name):
+    # Detectar si es video/audio o imagen por extensión
+    ext = os.path.splitext(name)[-1].lower()
+    return "video" if ext in VIDEO_EXT + AUDIO_EXT else "image"
+
+
+def ext_de(name):
+    return os.path.splitext(name)[-1].lower().lstrip(".")
+
+
+_URL_CLOUDINARY = re.compile(
+    r"/(?P<resource_type>image|video|raw)/upload/(?:v\d+/)?(?P<public_id>.+?)(?:\.(?P<formato>\w+))?$"
+)
+
+
+def desde_url(url):
+    """secure_url de Cloudinary → (resource_type, public_id, formato), o None."""
+    coincidencia = _URL_CLOUDINARY.search(url or "")
+    if not coincidencia:
+        return None
+    return coincidencia["resource_type"], coincidencia["public_id"], coincidencia["formato"] or ""
 
 
 @deconstructible
 class CloudinaryStorage(Storage):
+    derivados = DerivadosCloudinary()
 
     def _get_public_id(self, name):
         """Convierte el path del archivo en un public_id para Cloudinary."""
@@ -24,11 +75,19 @@ class CloudinaryStorage(Storage):
         raise NotImplementedError("CloudinaryStorage no soporta abrir archivos directamente.")
 
     def _save(self, name, content):
+        from archivos.contenido import copiar_con_huella, de_respuesta, registrar, reutilizar
+
         public_id = self._get_public_id(name)
+        resource_type = tipo_de_recurso(name)
 
-        # Detectar si es video o imagen por extensión
-        ext = os.path.splitext(name)[-1].lower()
-        resource_type = "video" if ext in [".mp4", ".mov", ".avi", ".webm", ".mkv"] else "image"
+        if settings.MEDIA_SUBIDA_ASINCRONA and resource_type in settings.MEDIA_ASINCRONA_TIPOS:
+            return self._save_pendiente(name, content, public_id, resource_type)
+
+        # Mismo contenido ya subido → misma URL, sin subir nada
+        digest = copiar_con_huella(content)
+        existente = reutilizar(digest)
+        if existente:
+            return existente
 
         result = cloudinary.uploader.upload(
             content,
@@ -37,30 +96,262 @@ class CloudinaryStorage(Storage):
             overwrite=True,
         )
         # Guardar la URL segura como nombre — se usará en url()
-        return result["secure_url"]
+        return registrar(digest, result["secure_url"], public_id, resource_type, **de_respuesta(result))
+
+    def _save_pendiente(self, name, content, public_id, resource_type):
+        from archivos.cola import PREFIJO, ruta_temporal
+        from archivos.contenido import copiar_con_huella, registrar, reutilizar
+
+        token  = uuid.uuid4()
+        nombre = f"{PREFIJO}{token.hex}{os.path.splitext(name)[-1].lower()}"
+        ruta   = ruta_temporal(nombre)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        # Una sola pasada: se escribe el temporal y se calcula el sha256
+        with open(ruta, "wb") as destino:
+            digest = copiar_con_huella(content, destino)
+
+        existente = reutilizar(digest)
+        if existente:
+            os.remove(ruta)
+            return existente
+        self._encolar(token, nombre, public_id, resource_type)
+        return registrar(
+            digest, nombre, public_id, resource_type,
+            tamano=os.path.getsize(ruta), formato=ext_de(name),
+        )
+
+    def _encolar(self, token, nombre, public_id, resource_type):
+        from archivos.cola import encolar
+        from archivos.middleware import usuario_actual_id
+        from archivos.models import SubidaPendiente
+
+        subida = SubidaPendiente.objects.create(
+            token=token, nombre=nombre, public_id=public_id, resource_type=resource_type,
+            usuario_id=usuario_actual_id(),
+        )
+        encolar(subida)
+        return subida
+
+    def guardar_desde_ruta(self, name, ruta, sha256):
+        """
+        Para archivos que ya están completos en disco y con el sha256
+        verificado (archivos/cargas.py): se mueven a pendientes/ sin
+        copiarlos. Devuelve (nombre, subida).
+        """
+        from archivos.cola import PREFIJO, ruta_temporal
+        from archivos.contenido import registrar, reutilizar
+
+        public_id = self._get_public_id(name)
+        resource_type = tipo_de_recurso(name)
+        if not (settings.MEDIA_SUBIDA_ASINCRONA and resource_type in settings.MEDIA_ASINCRONA_TIPOS):
+            with open(ruta, "rb") as archivo:
+                nombre = self.save(name, archivo)
+            os.remove(ruta)
+            return nombre, None
+
+        existente = reutilizar(sha256)
+        if existente:
+            os.remove(ruta)
+            return existente, None
+
+        token  = uuid.uuid4()
+        nombre = f"{PREFIJO}{token.hex}{os.path.splitext(name)[-1].lower()}"
+        tamano = os.path.getsize(ruta)
+        os.makedirs(os.path.dirname(ruta_temporal(nombre)), exist_ok=True)
+        os.replace(ruta, ruta_temporal(nombre))
+        subida = self._encolar(token, nombre, public_id, resource_type)
+        return registrar(
+            sha256, nombre, public_id, resource_type, tamano=tamano, formato=ext_de(name),
+        ), subida
 
     def exists(self, name):
-        # Cloudinary no tiene un método barato de verificación — asumir que no existe
-        return False
+        # Sin llamar a Cloudinary: lo que se subió está en el índice de metadatos
+        from archivos.contenido import metadatos
+
+        if name and name.startswith(LOCALES):
+            return FileSystemStorage().exists(name)
+        return bool(metadatos([name]))
 
     def url(self, name):
         # Si ya es una URL completa (guardada por _save) devolverla directo
         if name and name.startswith("http"):
             return name
+        # Pendiente de subir, o subido por archivos.subidores.SubidorLocal: está en MEDIA_ROOT
+        if name and name.startswith(LOCALES):
+            return f"{settings.MEDIA_URL}{name}"
         # Si es un path relativo construir la URL manualmente
         public_id = self._get_public_id(name)
         cloud_name = cloudinary.config().cloud_name
-        return f"https://res.cloudinary.com/{cloud_name}/image/upload/{public_id}"
+        return f"https://res.cloudinary.com/{cloud_name}/{tipo_de_recurso(name)}/upload/{public_id}"
 
     def delete(self, name):
+        from archivos.contenido import liberar
+
+        # Compartido con otros guardados del mismo contenido, o fuera del
+        # índice: no se borra (solo se descuenta)
+        borrar, public_id, resource_type = liberar(name)
+        if not borrar:
+            return
+        if name and name.startswith(LOCALES):
+            FileSystemStorage().delete(name)
+            return
+        if not public_id:
+            resource_type, public_id, _ = desde_url(name) or (tipo_de_recurso(name), self._get_public_id(name), "")
         try:
-            public_id = self._get_public_id(name)
-            cloudinary.uploader.destroy(public_id)
+            cloudinary.uploader.destroy(public_id, resource_type=resource_type)
         except Exception:
             pass
 
     def size(self, name):
-        return 0
+        from archivos.contenido import metadatos
+
+        if name and name.startswith(LOCALES):
+            return FileSystemStorage().size(name)
+        return (metadatos([name]).get(name) or {}).get("tamano") or 0
+
+    def metadatos_lote(self, nombres):
+        """
+        Para completar_metadatos: metadatos de archivos anteriores al índice,
+        con una llamada a la Admin API por cada resource_type (hasta 100 ids).
+        """
+        import cloudinary.api
+        from archivos.contenido import de_respuesta
+
+        por_tipo = {}
+        for nombre in nombres:
+            partes = desde_url(nombre) if nombre.startswith("http") else (
+                tipo_de_recurso(nombre), self._get_public_id(nombre), ext_de(nombre),
+            )
+            if partes:
+                por_tipo.setdefault(partes[0], {})[partes[1]] = nombre
+
+        encontrados = {}
+        for resource_type, ids in por_tipo.items():
+            respuesta = cloudinary.api.resources_by_ids(list(ids), resource_type=resource_type)
+            for recurso in respuesta.get("resources", []):
+                nombre = ids.get(recurso["public_id"])
+                if nombre:
+                    encontrados[nombre] = {
+                        "public_id": recurso["public_id"],
+                        "resource_type": resource_type,
+                        **de_respuesta(recurso),
+                    }
+        return encontrados
 
     def path(self, name):
-        raise NotImplementedError("CloudinaryStorage no usa rutas locales.")
\ No newline at end of file
+        raise NotImplementedError("CloudinaryStorage no usa rutas locales.")
+
+    # ── Para recolectar_huerfanos ──
+
+    def listar(self, prefijos=CARPETAS):
+        """Recursos de la cuenta bajo `prefijos`, página por página (500 por llamada)."""
+        for resource_type in ("image", "video", "raw"):
+            for prefijo in prefijos:
+                yield from self._listar_prefijo(resource_type, prefijo)
+
+    def _listar_prefijo(self, resource_type, prefijo):
+        import cloudinary.api
+
+        cursor = None
+        while True:
+            pagina = cloudinary.api.resources(
+                type="upload", resource_type=resource_type, prefix=prefijo,
+                max_results=500, next_cursor=cursor,
+            )
+            for recurso in pagina.get("resources", []):
+                yield {
+                    "nombre":        recurso["secure_url"],
+                    "public_id":     recurso["public_id"],
+                    "resource_type": resource_type,
+                    "creado":        parse_datetime(recurso["created_at"]),
+                }
+            cursor = pagina.get("next_cursor")
+            if not cursor:
+                break
+
+    def borrar_lote(self, recursos):
+        """Borra con delete_resources (hasta 100 public_id por llamada y tipo)."""
+        import cloudinary.api
+
+        por_tipo, borrados = {}, 0
+        for recurso in recursos:
+            if recurso["nombre"].startswith(LOCALES):
+                FileSystemStorage().delete(recurso["nombre"])
+                borrados += 1
+                continue
+            por_tipo.setdefault(recurso["resource_type"], []).append(recurso["public_id"])
+        for resource_type, ids in por_tipo.items():
+            for i in range(0, len(ids), 100):
+                respuesta = cloudinary.api.delete_resources(ids[i:i + 100], resource_type=resource_type)
+                borrados += sum(1 for estado in respuesta.get("deleted", {}).values() if estado == "deleted")
+        return borrados
+
+
+@deconstructible
+class LocalStorage(FileSystemStorage):
+    derivados = DerivadosPillow()
+
+    def _save(self, name, content):
+        from archivos.contenido import copiar_con_huella, registrar, reutilizar
+
+        digest = copiar_con_huella(content)
+        existente = reutilizar(digest)
+        if existente:
+            return existente
+
+        name = super()._save(name, content)
+        return registrar(digest, name, name, tipo_de_recurso(name), **self._medir(name))
+
+    def _medir(self, name):
+        datos = {"tamano": self.size(name), "formato": ext_de(name)}
+        if self.derivados.aplica(self, name):
+            datos["ancho"], datos["alto"] = self.derivados.generar(self, name)
+        return datos
+
+    def metadatos_lote(self, nombres):
+        """Para completar_metadatos: mide en disco (y genera los derivados que falten)."""
+        encontrados = {}
+        for nombre in nombres:
+            try:
+                if self.exists(nombre):
+                    encontrados[nombre] = {
+                        "public_id": nombre, "resource_type": tipo_de_recurso(nombre), **self._medir(nombre),
+                    }
+            except (SuspiciousFileOperation, OSError):
+                continue  # nombre inválido o archivo ilegible: se reporta como no encontrado
+        return encontrados
+
+    def delete(self, name):
+        from archivos.contenido import liberar
+
+        borrar, _, _ = liberar(name)
+        if not borrar:
+            return
+        for derivado in self.derivados.nombres(name):
+            super().delete(derivado)
+        super().delete(name)
+
+    # ── Para recolectar_huerfanos ──
+
+    def listar(self, prefijos=CARPETAS):
+        for prefijo in prefijos:
+            yield from self._listar_carpeta(prefijo)
+
+    def _listar_carpeta(self, prefijo):
+        for raiz, carpetas, archivos in os.walk(os.path.join(self.location, prefijo)):
+            relativa = os.path.relpath(raiz, self.location)
+            for archivo in archivos:
+                nombre = os.path.normpath(os.path.join(relativa, archivo)).replace(os.sep, "/")
+                yield {
+                    "nombre":        nombre,
+                    "public_id":     nombre,
+                    "resource_type": tipo_de_recurso(nombre),
+                    "creado":        self.get_created_time(nombre),
+                }
+
+    def borrar_lote(self, recursos):
+        for recurso in recursos:
+            for derivado in self.derivados.nombres(recurso["nombre"]):
+                FileSystemStorage.delete(self, derivado)
+            FileSystemStorage.delete(self, recurso["nombre"])
+        return len(recursos)
@@ -9,13 +9,17 @@ Endpoints disponibles:
     /api/eventos/       → CRUD de eventos y categorías
     /api/noticias/      → CRUD de artículos y bloques de contenido
     /api/entrevistas/   → CRUD de entrevistas de audio
+    /api/buscar/        → búsqueda de texto completo en todo el contenido
+    /api/archivos/      → cargas reanudables y estado de las subidas de media
+    /api/notificaciones/ → bandeja de notificaciones del usuario
     /admin/             → panel de administración Django
+    /media/             → archivos de MEDIA_ROOT con soporte de Range (ruedo/media.py)
 """
 
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+from ruedo.media import servir_media
 
 urlpatterns = [
     # Admin de Django
@@ -29,8 +33,14 @@ urlpatterns = [
     path("api/eventos/",     include("eventos.urls")),
     path("api/noticias/",    include("noticias.urls")),
     path("api/entrevistas/", include("entrevistas.urls")),
+    path("api/buscar/",      include("busqueda.urls")),
+    path("api/archivos/",    include("archivos.urls")),
+    path("api/notificaciones/", include("notificaciones.urls")),
 ]
 
-# Servir archivos media en desarrollo
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+# Servir archivos media (LocalStorage y temporales de subida) si no hay un
+# servidor web delante que lo haga
+if settings.MEDIA_SERVIR:
+    urlpatterns += [
+        re_path(rf"^{settings.MEDIA_URL.lstrip('/')}(?P<ruta>.*)$", servir_media, name="media"),
+    ]
\ No newline at end of file
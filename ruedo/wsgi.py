@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ruedo.settings')
 
 application = get_wsgi_application()
+
+# Subidas que el proceso anterior dejó a medias (archivos/cola.py)
+from archivos.cola import al_arrancar  # noqa: E402
+
+al_arrancar()
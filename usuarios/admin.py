@@ -1,6 +1,13 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import Usuario, EventoGuardado
+from .models import Usuario, EventoGuardado, Interes
+
+
+class InteresInline(admin.TabularInline):
+    model  = Interes
+    extra  = 0
+    fields = ["categoria", "texto"]
+
 
 @admin.register(Usuario)
 class UsuarioAdmin(UserAdmin):
@@ -12,11 +19,12 @@ class UsuarioAdmin(UserAdmin):
     fieldsets = (
         (None,              {"fields": ("correo", "password")}),
         ("Información",     {"fields": ("nombres", "apellidos", "telefono", "ciudad", "avatar")}),
-        ("Rol y acceso",    {"fields": ("rol", "gustos", "is_active", "is_staff", "is_superuser")}),
+        ("Rol y acceso",    {"fields": ("rol", "is_active", "is_staff", "is_superuser")}),
         ("Permisos",        {"fields": ("groups", "user_permissions")}),
         ("Fechas",          {"fields": ("last_login", "fecha_union")}),
     )
     readonly_fields   = ["fecha_union", "last_login"]
+    inlines           = [InteresInline]
     add_fieldsets     = (
         (None, {
             "classes": ("wide",),
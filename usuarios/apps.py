@@ -3,3 +3,19 @@ from django.apps import AppConfig
 
 class UsuariosConfig(AppConfig):
     name = 'usuarios'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save, pre_save
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+        from .lista_negra import al_revocar
+        from .models import EventoGuardado, Usuario
+        from .popularidad import al_borrar, al_guardar, al_guardar_previo
+        from .tokens import subir_version
+
+        pre_save.connect(subir_version, sender=Usuario, dispatch_uid="usuarios-token-version")
+        post_save.connect(al_revocar, sender=BlacklistedToken, dispatch_uid="usuarios-lista-negra")
+
+        # Contadores de popularidad de Evento
+        pre_save.connect(al_guardar_previo, sender=EventoGuardado, dispatch_uid="usuarios-popularidad-previo")
+        post_save.connect(al_guardar,       sender=EventoGuardado, dispatch_uid="usuarios-popularidad")
+        post_delete.connect(al_borrar,      sender=EventoGuardado, dispatch_uid="usuarios-popularidad-borrar")
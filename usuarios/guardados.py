@@ -0,0 +1,67 @@
+"""
+usuarios/guardados.py
+
+Escritura en lote de la agenda de un usuario (EventoGuardado).
+
+aplicar_guardados() recibe pares {evento_id, estado}, los compara con lo
+guardado en una sola consulta y hace un upsert (INSERT … ON CONFLICT
+(usuario, evento) DO UPDATE estado) de los nuevos y los que cambiaron de
+estado; con borrar_faltantes, un DELETE de los que ya no vienen. Si otra
+petición del mismo usuario inserta la fila entre la lectura y la escritura,
+el ON CONFLICT la actualiza en vez de fallar por la restricción única.
+Debe llamarse dentro de transaction.atomic().
+
+Como las escrituras en lote no disparan señales, aquí mismo se ajustan los
+contadores de popularidad de los eventos tocados (usuarios/popularidad.py)
+y se descarta el feed para-mi del usuario (eventos/para_mi.py).
+"""
+
+from rest_framework import serializers
+
+from eventos.models import Evento
+from eventos.para_mi import olvidar
+from ruedo.condicional import sin_toques
+from .models import EventoGuardado
+from .popularidad import ajustar
+
+
+def aplicar_guardados(usuario_id, items, borrar_faltantes=True):
+    """
+    `items` es la lista validada por EventoGuardadoLoteSerializer.
+    Devuelve (creados, cambiados, borrados) como listas de evento_id.
+    """
+    pedidos = {datos["evento_id"]: datos["estado"] for datos in items}
+
+    existentes = set(Evento.objects.filter(pk__in=pedidos).values_list("pk", flat=True))
+    faltan = sorted(set(pedidos) - existentes)
+    if faltan:
+        raise serializers.ValidationError({"evento_id": f"No existen los eventos {faltan}."})
+
+    guardados = dict(
+        EventoGuardado.objects.filter(usuario_id=usuario_id).values_list("evento_id", "estado")
+    )
+    creados   = [pk for pk in pedidos if pk not in guardados]
+    cambiados = [pk for pk, estado in pedidos.items() if pk in guardados and guardados[pk] != estado]
+    sobrantes = [pk for pk in guardados if pk not in pedidos] if borrar_faltantes else []
+
+    if sobrantes:
+        with sin_toques():
+            EventoGuardado.objects.filter(usuario_id=usuario_id, evento_id__in=sobrantes).delete()
+    if creados or cambiados:
+        EventoGuardado.objects.bulk_create(
+            [
+                EventoGuardado(usuario_id=usuario_id, evento_id=pk, estado=pedidos[pk])
+                for pk in creados + cambiados
+            ],
+            update_conflicts=True,
+            unique_fields=["usuario", "evento"],
+            update_fields=["estado"],
+        )
+
+    ajustar(
+        [(pk, pedidos[pk], +1) for pk in creados + cambiados]
+        + [(pk, guardados[pk], -1) for pk in cambiados + sobrantes]
+    )
+    if creados or cambiados or sobrantes:
+        olvidar(usuario_id)
+    return creados, cambiados, sobrantes
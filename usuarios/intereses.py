@@ -0,0 +1,84 @@
+"""
+usuarios/intereses.py
+
+Intereses del usuario (relación Usuario ↔ Categoria a través de Interes).
+
+La API conserva el formato anterior del campo `gustos`: una lista de
+textos. Se aceptan el slug o el nombre de la categoría sin importar
+mayúsculas ("CUENTO", "cuento", "Cuento") y cada uno se guarda en
+Interes.texto, así la respuesta devuelve lo mismo que envió el cliente.
+Un texto que no corresponde a ninguna Categoria se acepta igual que antes
+y se guarda como Interes sin categoría: vuelve en `gustos` pero no cuenta
+para el feed para-mi ni para las difusiones.
+
+aplicar_intereses() compara lo pedido con lo guardado y solo escribe la
+diferencia: un upsert de los nuevos o con otro texto y un DELETE de los que
+sobran. Como no pasa por señales, aquí mismo se descarta el feed para-mi
+del usuario (eventos/para_mi.py) si cambiaron las categorías.
+"""
+
+from django.db.models import Q
+from django.utils.text import slugify
+
+from eventos.models import Categoria
+from eventos.para_mi import olvidar
+from .models import Interes
+
+
+def resolver(gustos):
+    """[(id de Categoria o None, texto pedido)], sin repetidos."""
+    por_llave = {}
+    for pk, nombre, slug in Categoria.objects.values_list("pk", "nombre", "slug"):
+        por_llave.setdefault(slugify(nombre), pk)
+        por_llave[slug] = pk
+
+    elegidas, vistos = [], set()
+    for texto in gustos:
+        pk    = por_llave.get(slugify(texto))
+        llave = pk if pk is not None else texto
+        if llave not in vistos:
+            vistos.add(llave)
+            elegidas.append((pk, texto))
+    return elegidas
+
+
+def aplicar_intereses(usuario_id, elegidas):
+    """
+    Deja exactamente `elegidas` (ver resolver) como intereses.
+    Devuelve (agregadas, quitadas) como conjuntos de categoria_id.
+    """
+    actuales, libres = {}, {}
+    for pk, categoria_id, texto in Interes.objects.filter(usuario_id=usuario_id).values_list(
+        "pk", "categoria_id", "texto",
+    ):
+        if categoria_id is None:
+            libres[texto] = pk
+        else:
+            actuales[categoria_id] = texto
+
+    pedidas   = {pk: texto for pk, texto in elegidas if pk is not None}
+    pedidos   = [texto for pk, texto in elegidas if pk is None]
+    agregadas = set(pedidas) - set(actuales)
+    quitadas  = set(actuales) - set(pedidas)
+    sobrantes = [pk for texto, pk in libres.items() if texto not in pedidos]
+    escribir  = [
+        Interes(usuario_id=usuario_id, categoria_id=pk, texto=texto)
+        for pk, texto in elegidas
+        if (actuales.get(pk) != texto if pk is not None else texto not in libres)
+    ]
+
+    if quitadas or sobrantes:
+        Interes.objects.filter(
+            Q(categoria_id__in=quitadas) | Q(pk__in=sobrantes), usuario_id=usuario_id,
+        ).delete()
+    if escribir:
+        # Los de texto libre (categoria NULL) nunca chocan con interes_unico
+        Interes.objects.bulk_create(
+            escribir,
+            update_conflicts=True,
+            unique_fields=["usuario", "categoria"],
+            update_fields=["texto"],
+        )
+    if agregadas or quitadas:
+        olvidar(usuario_id)
+    return agregadas, quitadas
@@ -0,0 +1,127 @@
+"""
+usuarios/lista_negra.py
+
+Consulta rápida de la lista negra de refresh tokens (token_blacklist de
+simplejwt) con un filtro de Bloom en memoria de cada worker.
+
+    en_lista_negra(jti)
+        1. cada LISTA_NEGRA_INTERVALO segundos, trae las filas de
+           BlacklistedToken más nuevas que la marca del filtro (rango por
+           pk, fuera del candado: los demás hilos siguen respondiendo)
+        2. si el jti no está en el filtro → no está revocado, sin más consultas
+        3. si está (revocado o falso positivo, ~LISTA_NEGRA_ERROR) → se
+           confirma con la consulta exacta de siempre
+
+El filtro se arma en la primera consulta del worker y se rehace si pasa de
+su capacidad. Las escrituras del propio worker entran al instante
+(post_save de BlacklistedToken); las de otros workers, por el paso 1: un
+token revocado en otro worker puede pasar aquí durante a lo sumo
+LISTA_NEGRA_INTERVALO segundos. La marca se queda MARGEN atrás para no
+saltarse filas de transacciones que confirmen fuera de orden.
+
+`manage.py podar_tokens` borra los tokens vencidos para que las tablas no
+crezcan sin límite.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+MARGEN = timedelta(seconds=30)
+
+_filtro  = None
+_candado = threading.Lock()
+_ultima  = 0.0              # time.monotonic() de la última puesta al día
+
+
+class FiltroBloom:
+
+    def __init__(self, capacidad, error):
+        self.capacidad = capacidad
+        self.bits      = max(8, int(-capacidad * math.log(error) / math.log(2) ** 2))
+        self.hashes    = max(1, round(self.bits / capacidad * math.log(2)))
+        self.tabla     = bytearray((self.bits + 7) // 8)
+        self.elementos = 0
+        self.marca     = 0
+        self.recientes = set()      # pks ya agregados por encima de la marca
+
+    def _posiciones(self, valor):
+        # Doble hashing (Kirsch–Mitzenmacher): k posiciones con un solo digest
+        digest = hashlib.blake2b(valor.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def agregar(self, valor):
+        for pos in self._posiciones(valor):
+            self.tabla[pos >> 3] |= 1 << (pos & 7)
+        self.elementos += 1
+
+    def __contains__(self, valor):
+        return all(self.tabla[pos >> 3] & (1 << (pos & 7)) for pos in self._posiciones(valor))
+
+    @property
+    def lleno(self):
+        return self.elementos > self.capacidad
+
+
+def _filas(qs):
+    return qs.order_by("pk").values_list("pk", "token__jti", "blacklisted_at")
+
+
+def _construir():
+    total  = BlacklistedToken.objects.count()
+    filtro = FiltroBloom(max(settings.LISTA_NEGRA_CAPACIDAD, total * 2), settings.LISTA_NEGRA_ERROR)
+    _cargar(filtro, _filas(BlacklistedToken.objects.all()).iterator(), timezone.now() - MARGEN)
+    return filtro
+
+
+def _cargar(filtro, filas, limite):
+    """Agrega `filas` y adelanta la marca hasta la última que ya no puede cambiar."""
+    for pk, jti, fecha in filas:
+        if pk not in filtro.recientes:
+            filtro.agregar(jti)
+            filtro.recientes.add(pk)
+        if fecha <= limite:
+            filtro.marca = max(filtro.marca, pk)
+    filtro.recientes = {pk for pk in filtro.recientes if pk > filtro.marca}
+
+
+def _get_filtro():
+    global _filtro, _ultima
+    filtro = _filtro
+    if filtro is None or filtro.lleno:
+        with _candado:
+            if _filtro is None or _filtro.lleno:
+                _filtro = _construir()
+                _ultima = time.monotonic()
+            return _filtro
+
+    ahora = time.monotonic()
+    if ahora - _ultima >= settings.LISTA_NEGRA_INTERVALO:
+        _ultima = ahora             # los demás hilos no repiten la consulta mientras tanto
+        limite  = timezone.now() - MARGEN
+        filas   = list(_filas(BlacklistedToken.objects.filter(pk__gt=filtro.marca)))
+        with _candado:
+            _cargar(filtro, filas, limite)
+    return filtro
+
+
+def en_lista_negra(jti):
+    if jti not in _get_filtro():
+        return False
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def al_revocar(sender, instance, created, **kwargs):
+    """post_save de BlacklistedToken."""
+    if created and _filtro is not None:
+        with _candado:
+            _filtro.agregar(instance.token.jti)
+            _filtro.recientes.add(instance.pk)
@@ -0,0 +1,50 @@
+"""
+usuarios/management/commands/podar_tokens.py
+
+Borra en lotes los refresh tokens vencidos de token_blacklist
+(OutstandingToken y su BlacklistedToken). Un token vencido ya lo rechaza
+la validación de `exp`, así que guardarlo no sirve de nada; sin podar, las
+dos tablas crecen con cada login y cada rotación.
+
+Pensado para correr programado (p. ej. un Cron Job de Render, a diario):
+    python manage.py podar_tokens
+    python manage.py podar_tokens --lote 5000 --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = "Borra en lotes los refresh tokens vencidos y sus entradas en la lista negra."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lote", type=int, default=1000, help="Tokens por transacción.")
+        parser.add_argument("--dry-run", action="store_true", help="Solo contar lo que se borraría.")
+
+    def handle(self, *args, **opts):
+        ahora    = timezone.now()
+        vencidos = OutstandingToken.objects.filter(expires_at__lte=ahora)
+
+        if opts["dry_run"]:
+            total = vencidos.count()
+            negros = BlacklistedToken.objects.filter(token__expires_at__lte=ahora).count()
+            self.stdout.write(f"Se borrarían {total} tokens vencidos ({negros} en la lista negra).")
+            return
+
+        # Los pk crecen con la fecha de emisión: los vencidos están al principio
+        borrados = negros = 0
+        while True:
+            pks = list(vencidos.order_by("pk").values_list("pk", flat=True)[:opts["lote"]])
+            if not pks:
+                break
+            with transaction.atomic():
+                negros   += BlacklistedToken.objects.filter(token_id__in=pks).delete()[0]
+                borrados += OutstandingToken.objects.filter(pk__in=pks).delete()[0]
+            self.stdout.write(f"  {borrados} tokens borrados…")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{borrados} tokens vencidos borrados ({negros} estaban en la lista negra)."
+        ))
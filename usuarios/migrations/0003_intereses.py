@@ -0,0 +1,98 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:50
+
+import logging
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.text import slugify
+
+logger = logging.getLogger(__name__)
+
+
+def desde_gustos(apps, schema_editor):
+    """
+    Cada texto de `gustos` se empareja con el slug o el nombre de una
+    Categoria y se guarda tal cual en Interes.texto. Los que no coinciden
+    con ninguna quedan como Interes sin categoría, así la 0004 puede borrar
+    la columna sin perder nada.
+    """
+    Usuario   = apps.get_model("usuarios", "Usuario")
+    Categoria = apps.get_model("eventos", "Categoria")
+    Interes   = apps.get_model("usuarios", "Interes")
+
+    por_llave = {}
+    for pk, nombre, slug in Categoria.objects.values_list("pk", "nombre", "slug"):
+        por_llave.setdefault(slugify(nombre), pk)
+        por_llave[slug] = pk
+
+    nuevos, sin_categoria = [], 0
+    for usuario_id, gustos in Usuario.objects.values_list("pk", "gustos").iterator():
+        if not gustos or not isinstance(gustos, list):
+            continue
+        vistos = set()
+        for texto in gustos:
+            texto = str(texto).strip()[:50]
+            pk    = por_llave.get(slugify(texto))
+            llave = pk if pk is not None else texto
+            if not texto or llave in vistos:
+                continue
+            vistos.add(llave)
+            sin_categoria += pk is None
+            nuevos.append(Interes(usuario_id=usuario_id, categoria_id=pk, texto=texto))
+    Interes.objects.bulk_create(nuevos, batch_size=1000)
+    if sin_categoria:
+        logger.info("%s gustos sin categoría quedaron como intereses de texto libre", sin_categoria)
+
+
+def hacia_gustos(apps, schema_editor):
+    """Devuelve a `gustos` los textos guardados (el nombre de la categoría si no hay texto)."""
+    Usuario = apps.get_model("usuarios", "Usuario")
+    Interes = apps.get_model("usuarios", "Interes")
+
+    gustos = {}
+    for usuario_id, texto, nombre in (
+        Interes.objects.order_by("pk").values_list("usuario_id", "texto", "categoria__nombre")
+    ):
+        gustos.setdefault(usuario_id, []).append(texto or nombre)
+    for usuario_id, lista in gustos.items():
+        Usuario.objects.filter(pk=usuario_id).update(gustos=lista)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eventos', '0009_evento_actualizado_idx'),
+        ('usuarios', '0002_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Interes',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('texto', models.CharField(blank=True, help_text='Como lo escribió el usuario; la API lo devuelve tal cual en `gustos`', max_length=50)),
+                ('creado_en', models.DateTimeField(auto_now_add=True)),
+                ('categoria', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='eventos.categoria')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Interés',
+                'verbose_name_plural': 'Intereses',
+            },
+        ),
+        migrations.AddField(
+            model_name='usuario',
+            name='intereses',
+            field=models.ManyToManyField(blank=True, related_name='interesados', through='usuarios.Interes', to='eventos.categoria', verbose_name='Categorías de interés'),
+        ),
+        migrations.AddIndex(
+            model_name='interes',
+            index=models.Index(fields=['categoria', 'usuario'], name='interes_categoria_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='interes',
+            constraint=models.UniqueConstraint(fields=('usuario', 'categoria'), name='interes_unico'),
+        ),
+        migrations.RunPython(desde_gustos, hacia_gustos),
+    ]
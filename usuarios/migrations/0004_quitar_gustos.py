@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # La 0003 ya copió todos los gustos a Interes (los que no corresponden a
+    # ninguna categoría, como texto libre): la columna ya no tiene nada propio.
+    dependencies = [
+        ('usuarios', '0003_intereses'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='usuario',
+            name='gustos',
+        ),
+    ]
@@ -74,16 +74,21 @@ class Usuario(AbstractBaseUser, PermissionsMixin):
     )
 
     # ── Preferencias de eventos (gustos) ──
-    gustos = models.JSONField(
-        default=list,
+    # La API sigue exponiendo la lista `gustos` (usuarios/intereses.py)
+    intereses = models.ManyToManyField(
+        "eventos.Categoria",
+        through="Interes",
+        related_name="interesados",
         blank=True,
-        help_text='Lista de categorías de interés. Ej: ["CUENTO","FESTIVAL"]',
+        verbose_name="Categorías de interés",
     )
 
     # ── Campos de sistema ──
     is_active   = models.BooleanField(default=True)
     is_staff    = models.BooleanField(default=False)
     fecha_union = models.DateTimeField(auto_now_add=True, verbose_name="Miembro desde")
+    # Sube al cambiar rol o is_active: invalida los JWT emitidos antes (usuarios/tokens.py)
+    token_version = models.PositiveIntegerField(default=0, editable=False)
 
     objects = UsuarioManager()
 
@@ -112,6 +117,34 @@ class Usuario(AbstractBaseUser, PermissionsMixin):
         return f"{self.nombres} {self.apellidos}"
 
 
+class Interes(models.Model):
+    """
+    Categoría de eventos que le interesa a un usuario. Sin categoría es un
+    gusto de texto libre que no corresponde a ninguna: se conserva para
+    devolverlo en `gustos`, pero no cuenta para el feed ni las difusiones.
+    """
+
+    usuario   = models.ForeignKey(Usuario, on_delete=models.CASCADE)
+    categoria = models.ForeignKey("eventos.Categoria", on_delete=models.CASCADE, null=True, blank=True)
+    texto     = models.CharField(
+        max_length=50, blank=True,
+        help_text="Como lo escribió el usuario; la API lo devuelve tal cual en `gustos`",
+    )
+    creado_en = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name        = "Interés"
+        verbose_name_plural = "Intereses"
+        constraints         = [
+            models.UniqueConstraint(fields=["usuario", "categoria"], name="interes_unico"),
+        ]
+        # "¿A quién le interesa la categoría X?" sin recorrer usuarios
+        indexes             = [models.Index(fields=["categoria", "usuario"], name="interes_categoria_idx")]
+
+    def __str__(self):
+        return f"{self.usuario} → {self.categoria or self.texto}"
+
+
 class EventoGuardado(models.Model):
     """
     Relación M2M entre Usuario y Evento con metadatos adicionales.
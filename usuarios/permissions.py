@@ -40,8 +40,8 @@ class EsPropietarioOCuentero(BasePermission):
             return True
         if request.user.es_admin:
             return True
-        creador = getattr(obj, "creado_por", None)
-        return creador == request.user
+        # Por id: no carga ni el creador ni el usuario del token
+        return getattr(obj, "creado_por_id", None) == request.user.pk
 
 
 class EsPropietarioDePerfil(BasePermission):
@@ -56,7 +56,7 @@ class EsPropietarioDePerfil(BasePermission):
             return True
         if request.user.es_admin:
             return True
-        return obj == request.user
+        return obj.pk == request.user.pk
 
 
 class SoloAdmin(BasePermission):
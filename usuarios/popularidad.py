@@ -0,0 +1,145 @@
+"""
+usuarios/popularidad.py
+
+Contadores Evento.guardados_count / asistidos_count (y la columna generada
+`popularidad`, su suma, indexada para ?ordering=-popularidad).
+
+Cada cambio de EventoGuardado se aplica como un UPDATE … SET n = n ± 1 en
+la misma transacción que lo provoca, sin leer el valor actual, así que dos
+usuarios guardando el mismo evento a la vez no se pisan:
+    post_save   → +1 al estado nuevo (y −1 al anterior si cambió)
+    post_delete → −1 al estado que tenía
+aplicar_guardados() escribe en lote sin señales y llama a ajustar() con
+todos sus cambios (a lo sumo cuatro UPDATE por llamada); su DELETE corre
+dentro de sin_toques() para no descontar dos veces.
+
+Los contadores salen en el detalle y el listado de eventos, pero guardar un
+evento es la escritura más frecuente de la app: si cada una tocara
+Evento.actualizado e invalidara el grupo "eventos", vaciaría la caché de
+respuestas, los ETag y los feeds para-mi de todos. Por eso la publicación
+es diferida: ajustar() solo cambia los contadores y anota el evento; cada
+proceso junta los anotados durante POPULARIDAD_INTERVALO segundos y
+publicar() los toca con un solo UPDATE de `actualizado` (el validador de
+ruedo/condicional.py) y una sola invalidación del grupo. Los contadores
+servidos desde caché quedan, como mucho, ese intervalo atrás.
+
+`manage.py recontar_popularidad` recalcula los contadores desde
+EventoGuardado y corrige los que se hayan desviado (cargas con update(),
+carreras del ON CONFLICT, ediciones a mano).
+"""
+
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from eventos.models import Evento
+from ruedo.cache import invalidar_grupos
+from ruedo.condicional import toques_suspendidos
+from .models import EventoGuardado
+
+CAMPO = {
+    EventoGuardado.Estado.GUARDADO: "guardados_count",
+    EventoGuardado.Estado.ASISTIDO: "asistidos_count",
+}
+
+logger = logging.getLogger(__name__)
+
+_candado      = threading.Lock()
+_anotados     = set()
+_temporizador = None
+
+
+def ajustar(cambios):
+    """`cambios`: iterable de (evento_id, estado, +1/−1)."""
+    grupos = defaultdict(list)
+    for evento_id, estado, delta in cambios:
+        grupos[CAMPO[estado], delta].append(evento_id)
+
+    if not grupos:
+        return
+    ids = set()
+    for (campo, delta), eventos in grupos.items():
+        valor = F(campo) + delta if delta > 0 else Greatest(F(campo) + delta, Value(0))
+        Evento.objects.filter(pk__in=eventos).update(**{campo: valor})
+        ids.update(eventos)
+    transaction.on_commit(lambda: anotar(ids))
+
+
+def anotar(ids):
+    """Deja `ids` para la próxima publicación (a lo sumo POPULARIDAD_INTERVALO después)."""
+    global _temporizador
+    with _candado:
+        _anotados.update(ids)
+        if _temporizador is None:
+            _temporizador = threading.Timer(settings.POPULARIDAD_INTERVALO, _publicar_en_hilo)
+            _temporizador.daemon = True
+            _temporizador.start()
+
+
+def publicar():
+    """Toca `actualizado` de los eventos anotados e invalida el grupo "eventos" una vez."""
+    global _temporizador
+    with _candado:
+        ids = set(_anotados)
+        _anotados.clear()
+        _temporizador = None
+    if ids:
+        Evento.objects.filter(pk__in=ids).update(actualizado=timezone.now())
+        invalidar_grupos("eventos")
+    return len(ids)
+
+
+def _publicar_en_hilo():
+    close_old_connections()
+    try:
+        publicar()
+    except Exception:
+        logger.exception("No se pudo publicar la popularidad")
+    finally:
+        connection.close()
+
+
+def conteos_reales(eventos):
+    """`eventos` anotado con los conteos calculados desde EventoGuardado."""
+    return eventos.annotate(
+        guardados_real=Count("guardado_por", filter=Q(guardado_por__estado=EventoGuardado.Estado.GUARDADO)),
+        asistidos_real=Count("guardado_por", filter=Q(guardado_por__estado=EventoGuardado.Estado.ASISTIDO)),
+    )
+
+
+# ── Señales de EventoGuardado ──
+
+def al_guardar_previo(sender, instance, raw=False, update_fields=None, **kwargs):
+    """pre_save: recuerda el estado guardado para saber si cambió."""
+    instance._estado_anterior = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and "estado" not in update_fields:
+        return
+    instance._estado_anterior = (
+        EventoGuardado.objects.filter(pk=instance.pk).values_list("estado", flat=True).first()
+    )
+
+
+def al_guardar(sender, instance, created, raw=False, **kwargs):
+    """post_save de EventoGuardado."""
+    if raw:
+        return
+    anterior = getattr(instance, "_estado_anterior", None)
+    if created:
+        ajustar([(instance.evento_id, instance.estado, +1)])
+    elif anterior is not None and anterior != instance.estado:
+        ajustar([(instance.evento_id, anterior, -1), (instance.evento_id, instance.estado, +1)])
+
+
+def al_borrar(sender, instance, **kwargs):
+    """post_delete de EventoGuardado (también por CASCADE al borrar un usuario)."""
+    if toques_suspendidos():
+        return
+    ajustar([(instance.evento_id, instance.estado, -1)])
@@ -2,9 +2,15 @@
 usuarios/serializers.py
 """
 
+from django.db import transaction
 from rest_framework import serializers
+from archivos.serializers import SrcsetField
 from .models import Usuario, EventoGuardado
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from .intereses import aplicar_intereses, resolver
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer, TokenObtainPairSerializer, TokenRefreshSerializer,
+)
+from .tokens import RefreshFiltrado, agregar_claims, verificar_version
 
 class RegistroSerializer(serializers.ModelSerializer):
     """Registro de un nuevo usuario (rol USUARIO por defecto)."""
@@ -27,10 +33,30 @@ class RegistroSerializer(serializers.ModelSerializer):
 class UsuarioPublicoSerializer(serializers.ModelSerializer):
     """Vista pública mínima (para mostrar autor de noticias, etc.)."""
     nombre_completo = serializers.CharField(read_only=True)
+    avatar_srcset   = SrcsetField(source="avatar")
 
     class Meta:
         model  = Usuario
-        fields = ["id", "nombre_completo", "rol", "avatar", "ciudad"]
+        fields = ["id", "nombre_completo", "rol", "avatar", "avatar_srcset", "ciudad"]
+
+
+class GustosField(serializers.ListField):
+    """
+    La relación `intereses` con el formato de siempre: lista de textos.
+    Devuelve los textos tal como se guardaron; al escribir acepta slug,
+    nombre o texto libre (ver usuarios/intereses.py) y entrega
+    [(categoria_id o None, texto)].
+    """
+    child = serializers.CharField(max_length=50)
+
+    def get_attribute(self, instance):
+        return instance.interes_set.select_related("categoria").order_by("pk")
+
+    def to_representation(self, intereses):
+        return [i.texto or i.categoria.nombre for i in intereses]
+
+    def to_internal_value(self, data):
+        return resolver(super().to_internal_value(data))
 
 
 class PerfilSerializer(serializers.ModelSerializer):
@@ -41,6 +67,7 @@ class PerfilSerializer(serializers.ModelSerializer):
     """
     nombre_completo = serializers.CharField(read_only=True)
     es_cuentero     = serializers.BooleanField(read_only=True)
+    gustos          = GustosField(source="intereses", required=False)
 
     class Meta:
         model  = Usuario
@@ -60,6 +87,14 @@ class PerfilSerializer(serializers.ModelSerializer):
             return self.instance.rol if self.instance else value
         return value
 
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        intereses = validated_data.pop("intereses", None)
+        instance = super().update(instance, validated_data)
+        if intereses is not None:
+            aplicar_intereses(instance.pk, intereses)
+        return instance
+
 
 class CambiarPasswordSerializer(serializers.Serializer):
     password_actual = serializers.CharField(write_only=True)
@@ -92,5 +127,32 @@ class EventoGuardadoSerializer(serializers.ModelSerializer):
         fields = ["id", "evento", "evento_id", "estado", "fecha_alta"]
         read_only_fields = ["id", "fecha_alta"]
 
+
+class EventoGuardadoLoteSerializer(serializers.Serializer):
+    """Un elemento de la sincronización en lote de mis-eventos (ver usuarios/guardados.py)."""
+    evento_id = serializers.IntegerField(min_value=1)
+    estado    = serializers.ChoiceField(choices=EventoGuardado.Estado.choices, default=EventoGuardado.Estado.GUARDADO)
+
+
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
-    username_field = "correo"
\ No newline at end of file
+    """Login: el token lleva rol, is_active y token_version (ver usuarios/tokens.py)."""
+    username_field = "correo"
+    token_class    = RefreshFiltrado
+
+    @classmethod
+    def get_token(cls, user):
+        return agregar_claims(super().get_token(user), user)
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """Un refresh de una versión anterior (rol o estado cambiados) ya no renueva."""
+    token_class = RefreshFiltrado
+
+    def validate(self, attrs):
+        verificar_version(self.token_class(attrs["refresh"]))
+        return super().validate(attrs)
+
+
+class CustomTokenBlacklistSerializer(TokenBlacklistSerializer):
+    """Logout: la revocación entra al filtro de la lista negra (usuarios/lista_negra.py)."""
+    token_class = RefreshFiltrado
@@ -1,3 +1,142 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from . import lista_negra
+from .models import Usuario
+from .tokens import JWTAutenticacionToken, RefreshFiltrado, _llave
+
+
+class TokensTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = Usuario.objects.create_user("ana@ruedo.test", "clave-vieja", nombres="Ana", apellidos="X")
+
+    def setUp(self):
+        caches["default"].clear()
+        self.cliente = APIClient(HTTP_HOST="localhost")
+        respuesta = self.cliente.post(
+            "/api/auth/login/", {"correo": "ana@ruedo.test", "password": "clave-vieja"}, format="json",
+        )
+        self.assertEqual(respuesta.status_code, 200)
+        self.access, self.refresh = respuesta.json()["access"], respuesta.json()["refresh"]
+
+    def _perfil(self, access):
+        return self.cliente.get("/api/usuarios/perfil/", HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def _renovar(self, refresh):
+        return self.cliente.post("/api/auth/refresh/", {"refresh": refresh}, format="json")
+
+    def test_usuario_desde_los_claims(self):
+        token = JWTAutenticacionToken().get_validated_token(self.access)
+        with self.assertNumQueries(1):      # la versión vigente, la primera vez
+            usuario = JWTAutenticacionToken().get_user(token)
+            self.assertEqual((usuario.pk, usuario.rol, usuario.es_cuentero), (self.usuario.pk, "USUARIO", False))
+        with self.assertNumQueries(0):      # ya en la caché local
+            JWTAutenticacionToken().get_user(token)
+
+    def test_desactivar_rechaza_access_y_refresh(self):
+        self.assertEqual(self._perfil(self.access).status_code, 200)   # versión ya en caché
+
+        self.usuario.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.usuario.save()
+
+        self.assertEqual(self._perfil(self.access).status_code, 401)
+        self.assertEqual(self._renovar(self.refresh).status_code, 401)
+
+    def test_otro_worker_lo_nota_al_vencer_la_cache(self):
+        self.assertEqual(self._perfil(self.access).status_code, 200)
+
+        # Sin correr on_commit: como otro worker, que conserva la versión vieja
+        self.usuario.rol = Usuario.Rol.CUENTERO
+        self.usuario.save()
+        self.assertEqual(self._perfil(self.access).status_code, 200)
+
+        caches["default"].delete(_llave(self.usuario.pk))   # pasó TOKEN_VERSION_CACHE_SEGUNDOS
+        self.assertEqual(self._perfil(self.access).status_code, 401)
+
+    def test_cambiar_password_rechaza_los_tokens_anteriores(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            respuesta = self.cliente.post(
+                "/api/usuarios/cambiar-password/",
+                {"password_actual": "clave-vieja", "password_nuevo": "clave-nueva", "password_nuevo2": "clave-nueva"},
+                format="json", HTTP_AUTHORIZATION=f"Bearer {self.access}",
+            )
+        self.assertEqual(respuesta.status_code, 200)
+
+        self.assertEqual(self._perfil(self.access).status_code, 401)
+        self.assertEqual(self._renovar(self.refresh).status_code, 401)
+        self.assertEqual(self._perfil(respuesta.json()["access"]).status_code, 200)
+        self.assertEqual(self._renovar(respuesta.json()["refresh"]).status_code, 200)
+
+    def test_guardar_otros_campos_no_cambia_la_version(self):
+        self.usuario.ciudad = "Cali"
+        self.usuario.save()
+        self.assertEqual(self._perfil(self.access).status_code, 200)
+        self.assertEqual(self._renovar(self.refresh).status_code, 200)
+
+
+@override_settings(LISTA_NEGRA_INTERVALO=0)
+class ListaNegraTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = Usuario.objects.create_user("beto@ruedo.test", "clave", nombres="Beto", apellidos="X")
+
+    def setUp(self):
+        # Cada prueba arranca con el worker sin filtro
+        estado = mock.patch.multiple(lista_negra, _filtro=None, _ultima=0.0)
+        estado.start()
+        self.addCleanup(estado.stop)
+
+    def _token(self, vence_en=timedelta(days=1)):
+        ahora = timezone.now()
+        return OutstandingToken.objects.create(
+            user=self.usuario, jti=f"jti-{OutstandingToken.objects.count()}", token="x",
+            created_at=ahora, expires_at=ahora + vence_en,
+        )
+
+    def test_revocado_en_otro_worker_despues_de_armar_el_filtro(self):
+        token = self._token()
+        self.assertFalse(lista_negra.en_lista_negra(token.jti))    # arma el filtro
+        # bulk_create no dispara post_save: como si lo hubiera revocado otro worker
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+
+        self.assertTrue(lista_negra.en_lista_negra(token.jti))
+        self.assertTrue(lista_negra.en_lista_negra(token.jti))     # y sigue después de la marca
+
+    def test_refresh_revocado_no_renueva(self):
+        refresh = RefreshFiltrado.for_user(self.usuario)
+        cliente = APIClient(HTTP_HOST="localhost")
+        self.assertEqual(cliente.post("/api/auth/refresh/", {"refresh": str(refresh)}, format="json").status_code, 200)
+
+        # BLACKLIST_AFTER_ROTATION ya revocó el original al renovarlo
+        self.assertEqual(cliente.post("/api/auth/refresh/", {"refresh": str(refresh)}, format="json").status_code, 401)
+
+    def test_no_revocado_no_consulta_la_lista(self):
+        token = self._token()
+        lista_negra.en_lista_negra("otro")
+        with override_settings(LISTA_NEGRA_INTERVALO=60), self.assertNumQueries(0):
+            self.assertFalse(lista_negra.en_lista_negra(token.jti))
+
+    def test_podar_solo_borra_los_vencidos(self):
+        vencido, vigente = self._token(-timedelta(minutes=1)), self._token()
+        vencido_negro, vigente_negro = self._token(-timedelta(days=2)), self._token()
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=vencido_negro), BlacklistedToken(token=vigente_negro)])
+
+        call_command("podar_tokens", lote=1, stdout=StringIO())
+
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("pk", flat=True)), {vigente.pk, vigente_negro.pk},
+        )
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token_id", flat=True)), [vigente_negro.pk])
+        self.assertTrue(lista_negra.en_lista_negra(vigente_negro.jti))
@@ -0,0 +1,161 @@
+"""
+usuarios/tokens.py
+
+Autenticación JWT sin consultar Usuario en cada request.
+
+El access token lleva como claims lo que necesitan los permisos:
+    rol        → EsCuenteroOAdmin, SoloAdmin, caché por rol
+    is_active  → se rechaza el token si el usuario está inactivo
+    tv         → Usuario.token_version al emitir el token
+
+JWTAutenticacionToken compara `tv` con la versión vigente (una caché local
+de TOKEN_VERSION_CACHE_SEGUNDOS por worker, luego un SELECT de una
+columna) y devuelve un UsuarioDelToken: rol y permisos salen de los
+claims; cualquier otro atributo carga la fila completa la primera vez.
+
+Cambiar `rol`, `is_active` o la contraseña sube token_version (pre_save de
+Usuario): los tokens emitidos antes dejan de valer, también los refresh.
+
+RefreshFiltrado consulta la lista negra a través del filtro de Bloom de
+usuarios/lista_negra.py.
+"""
+
+from django.core.cache import caches
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .lista_negra import en_lista_negra
+from .models import Usuario
+
+CAMPOS_VERSIONADOS = ("rol", "is_active", "password")
+
+
+# ── Versión de los tokens ──
+
+def _llave(user_id):
+    return f"usuarios:token-version:{user_id}"
+
+
+def version_vigente(user_id):
+    """token_version actual del usuario, o None si ya no existe."""
+    llave   = _llave(user_id)
+    version = caches["default"].get(llave)
+    if version is None:
+        version = Usuario.objects.filter(pk=user_id).values_list("token_version", flat=True).first()
+        if version is None:
+            return None
+        caches["default"].set(llave, version, settings.TOKEN_VERSION_CACHE_SEGUNDOS)
+    return version
+
+
+def agregar_claims(token, user):
+    token["rol"]       = user.rol
+    token["is_active"] = user.is_active
+    token["tv"]        = user.token_version
+    return token
+
+
+def verificar_version(token):
+    """InvalidToken si el token es de una versión anterior (o el usuario ya no existe)."""
+    if "tv" not in token:
+        return
+    if token["tv"] != version_vigente(token[api_settings.USER_ID_CLAIM]):
+        raise InvalidToken("El rol o el estado de la cuenta cambió; vuelve a iniciar sesión.")
+
+
+def subir_version(sender, instance, update_fields=None, **kwargs):
+    """pre_save de Usuario: un cambio de rol, is_active o contraseña invalida los tokens."""
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(CAMPOS_VERSIONADOS) & set(update_fields):
+        return
+    anterior = Usuario.objects.filter(pk=instance.pk).values_list(*CAMPOS_VERSIONADOS).first()
+    if anterior is None or anterior == tuple(getattr(instance, campo) for campo in CAMPOS_VERSIONADOS):
+        return
+
+    instance.token_version += 1
+    if update_fields is not None:
+        # save(update_fields=[...]) no escribiría token_version
+        Usuario.objects.filter(pk=instance.pk).update(token_version=F("token_version") + 1)
+    pk = instance.pk
+    transaction.on_commit(lambda: caches["default"].delete(_llave(pk)))
+
+
+class RefreshFiltrado(RefreshToken):
+
+    def check_blacklist(self):
+        if en_lista_negra(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("El token fue revocado.")
+
+
+# ── request.user ──
+
+class UsuarioDelToken(SimpleLazyObject):
+    """
+    request.user armado con los claims del token. pk, rol, is_active,
+    es_cuentero y es_admin no consultan la base de datos; cualquier otro
+    atributo (o usarlo como Usuario en el ORM) carga la fila una sola vez.
+    """
+
+    def __init__(self, token):
+        # simplejwt guarda el id como texto; pk debe compararse con los *_id del ORM
+        user_id = Usuario._meta.pk.to_python(token[api_settings.USER_ID_CLAIM])
+        super().__init__(lambda: Usuario.objects.get(**{api_settings.USER_ID_FIELD: user_id}))
+        self.__dict__["_claims"] = {"pk": user_id, "rol": token["rol"], "is_active": token["is_active"]}
+
+    def __bool__(self):
+        # `request.user and ...` en los permisos no debe cargar la fila
+        return True
+
+    @property
+    def pk(self):
+        return self._claims["pk"]
+
+    id = pk
+
+    @property
+    def rol(self):
+        return self._claims["rol"]
+
+    @property
+    def is_active(self):
+        return self._claims["is_active"]
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+    @property
+    def es_cuentero(self):
+        return self.rol in (Usuario.Rol.CUENTERO, Usuario.Rol.ADMIN)
+
+    @property
+    def es_admin(self):
+        return self.rol == Usuario.Rol.ADMIN
+
+
+class JWTAutenticacionToken(JWTAuthentication):
+    """
+    Tokens con claims de rol (emitidos por CustomTokenObtainPairSerializer)
+    → UsuarioDelToken. Tokens anteriores sin claims → Usuario de la base.
+    """
+
+    def get_user(self, validated_token):
+        if "tv" not in validated_token:
+            return super().get_user(validated_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("El token no identifica a ningún usuario.")
+        verificar_version(validated_token)
+        if not validated_token.get("is_active", True):
+            raise AuthenticationFailed("Usuario inactivo.", code="user_inactive")
+        return UsuarioDelToken(validated_token)
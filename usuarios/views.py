@@ -2,6 +2,7 @@
 usuarios/views.py
 """
 
+from django.db import transaction
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
@@ -11,8 +12,10 @@ from .models import Usuario, EventoGuardado
 from .serializers import (
     RegistroSerializer, PerfilSerializer,
     CambiarPasswordSerializer, EventoGuardadoSerializer,
-    UsuarioPublicoSerializer,
+    EventoGuardadoLoteSerializer, UsuarioPublicoSerializer,
+    CustomTokenObtainPairSerializer,
 )
+from .guardados import aplicar_guardados
 from .permissions import EsPropietarioDePerfil, SoloAdmin
 
 
@@ -32,7 +35,11 @@ class PerfilView(generics.RetrieveUpdateAPIView):
 
 
 class CambiarPasswordView(APIView):
-    """POST /api/usuarios/cambiar-password/"""
+    """
+    POST /api/usuarios/cambiar-password/
+    Los tokens anteriores dejan de valer (usuarios/tokens.py): la respuesta
+    trae un par nuevo para seguir en esta sesión.
+    """
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
@@ -42,7 +49,12 @@ class CambiarPasswordView(APIView):
         serializer.is_valid(raise_exception=True)
         request.user.set_password(serializer.validated_data["password_nuevo"])
         request.user.save()
-        return Response({"detail": "Contraseña actualizada correctamente."})
+        refresh = CustomTokenObtainPairSerializer.get_token(request.user)
+        return Response({
+            "detail":  "Contraseña actualizada correctamente.",
+            "refresh": str(refresh),
+            "access":  str(refresh.access_token),
+        })
 
 
 class ListaUsuariosView(generics.ListAPIView):
@@ -62,17 +74,52 @@ class DetalleUsuarioView(generics.RetrieveUpdateAPIView):
 # ── Eventos guardados ──────────────────────────────────────────────────────
 
 class EventosGuardadosView(generics.ListCreateAPIView):
-    """GET/POST /api/usuarios/mis-eventos/ — Eventos guardados del usuario autenticado."""
+    """
+    GET  /api/usuarios/mis-eventos/   → eventos guardados del usuario autenticado
+    POST /api/usuarios/mis-eventos/   → guardar uno, o varios si el cuerpo es una
+                                        lista de {evento_id, estado}
+    PUT  /api/usuarios/mis-eventos/   → reemplazar la agenda completa con la lista
+                                        (upsert de lo enviado, borra lo que no viene)
+
+    El listado cuesta un número fijo de consultas sin importar cuántos
+    eventos haya: categoría por JOIN, fechas adicionales por prefetch y
+    los srcset de las imágenes en un lote por página.
+    """
     serializer_class   = EventoGuardadoSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return EventoGuardado.objects.filter(
-            usuario=self.request.user
-        ).select_related("evento")
+        return (
+            EventoGuardado.objects
+            .filter(usuario_id=self.request.user.pk)
+            .select_related("evento__categoria")
+            .prefetch_related("evento__fechas_adicionales")
+            .order_by("-fecha_alta", "-pk")
+        )
 
     def perform_create(self, serializer):
-        serializer.save(usuario=self.request.user)
+        serializer.save(usuario_id=self.request.user.pk)
+
+    def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self._lote(request, borrar_faltantes=False)
+        return super().create(request, *args, **kwargs)
+
+    def put(self, request, *args, **kwargs):
+        return self._lote(request, borrar_faltantes=True)
+
+    def _lote(self, request, borrar_faltantes):
+        serializer = EventoGuardadoLoteSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            creados, cambiados, borrados = aplicar_guardados(
+                request.user.pk, serializer.validated_data, borrar_faltantes
+            )
+        codigo = status.HTTP_201_CREATED if creados else status.HTTP_200_OK
+        return Response(
+            {"creados": creados, "actualizados": cambiados, "borrados": borrados},
+            status=codigo,
+        )
 
 
 class EventoGuardadoDetalleView(generics.RetrieveUpdateDestroyAPIView):
@@ -81,4 +128,4 @@ class EventoGuardadoDetalleView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return EventoGuardado.objects.filter(usuario=self.request.user)
\ No newline at end of file
+        return EventoGuardado.objects.filter(usuario_id=self.request.user.pk)
\ No newline at end of file